@@ -5,7 +5,7 @@ Stores control points and the selected interpolation method,
 and provides access to the interpolated path.
 """
 
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 from math_engine.interpolation_registry import get_registry
 
@@ -26,6 +26,7 @@ class CurveState:
         control_points: List of (x, y) tuples representing control points.
         interpolation_method: The interpolation method to use
             ('linear', 'lagrange', 'spline').
+        version: Counter bumped on every change to the points or method.
     """
 
     VALID_METHODS = ('linear', 'lagrange', 'spline')
@@ -35,6 +36,7 @@ class CurveState:
         self._control_points: List[Tuple[float, float]] = []
         self._interpolation_method: str = 'linear'
         self._locked: bool = False
+        self._version: int = 0
 
     @property
     def control_points(self) -> List[Tuple[float, float]]:
@@ -56,6 +58,17 @@ class CurveState:
         """
         return self._interpolation_method
 
+    @property
+    def version(self) -> int:
+        """
+        Return the modification counter of the curve.
+
+        Returns:
+            A number that changes whenever the control points or the
+            interpolation method change.
+        """
+        return self._version
+
     @property
     def locked(self) -> bool:
         """
@@ -109,6 +122,7 @@ class CurveState:
                 
         self._control_points.append((x, y))
         self._control_points.sort(key=lambda p: p[0])
+        self._version += 1
         return True
 
     def remove_point(self, index: int) -> bool:
@@ -134,6 +148,7 @@ class CurveState:
         
         if 0 <= index < len(self._control_points):
             self._control_points.pop(index)
+            self._version += 1
             return True
         return False
 
@@ -163,6 +178,7 @@ class CurveState:
             
             self._control_points[index] = (x, y)
             self._control_points.sort(key=lambda p: p[0])
+            self._version += 1
             return True
         return False
 
@@ -178,7 +194,9 @@ class CurveState:
             True if the method was set, False if the method was invalid.
         """
         if method in self.VALID_METHODS:
-            self._interpolation_method = method
+            if method != self._interpolation_method:
+                self._interpolation_method = method
+                self._version += 1
             return True
         return False
 
@@ -219,6 +237,26 @@ class CurveState:
         """
         self._check_locked()
         self._control_points.clear()
+        self._version += 1
+
+    def set_points(self, points: Iterable[Tuple[float, float]]) -> None:
+        """
+        Replace all control points with the given points, as they are.
+
+        Unlike ``add_point`` this skips the duplicate-X check, so a curve
+        received from the opponent is applied exactly even if rounding on
+        the wire moved two of its points closer than that check allows.
+
+        Args:
+            points: The new (x, y) control points, in any order.
+
+        Raises:
+            CurveLockedError: If the curve is locked.
+        """
+        self._check_locked()
+        self._control_points = [(x, y) for x, y in points]
+        self._control_points.sort(key=lambda p: p[0])
+        self._version += 1
 
     def get_point_count(self) -> int:
         """
@@ -248,6 +286,7 @@ class CurveState:
         self._control_points.append((start_x, y))
         self._control_points.append((end_x, y))
         self._control_points.sort(key=lambda p: p[0])
+        self._version += 1
         
         # Ensure curve is unlocked after initialization
         self._locked = False
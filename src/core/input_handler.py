@@ -136,7 +136,10 @@ class InputHandler:
         """Handle left mouse click."""
         # Convert screen pos to grid pos
         grid_x, grid_y = self.renderer.iso_to_cart(*screen_pos)
-        
+        self._handle_grid_click(grid_x, grid_y)
+
+    def _handle_grid_click(self, grid_x: int, grid_y: int):
+        """Handle a left click that has been resolved to grid coordinates."""
         # Check bounds
         if not self.grid.is_valid_position(grid_x, grid_y):
             return
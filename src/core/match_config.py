@@ -5,13 +5,13 @@ Provides data structures for configuring multiplayer matches,
 including difficulty, game speed, map size, and wave counts.
 """
 
-from dataclasses import dataclass, field
-from enum import Enum, auto
+from dataclasses import dataclass
+from enum import Enum, IntEnum, auto
 from typing import Dict, Any
 
 
-class Difficulty(Enum):
-    """Difficulty levels for the game."""
+class Difficulty(IntEnum):
+    """Difficulty levels for the game, serialized by integer value."""
     EASY = auto()
     NORMAL = auto()
     HARD = auto()
@@ -67,11 +67,21 @@ class MapSize(Enum):
         return self.value[1]
 
 
-@dataclass
+# Wave counts a match may be configured with
+_VALID_WAVE_COUNTS = frozenset({3, 5, 7, 10})
+
+# Allowed starting money range (inclusive)
+_MIN_MONEY, _MAX_MONEY = 100, 5000
+
+
+@dataclass(slots=True, frozen=True)
 class MatchConfig:
     """
     Configuration for a match.
     
+    Instances are immutable; use ``dataclasses.replace`` to derive a
+    modified configuration.
+    
     Attributes:
         wave_count: Number of waves (3, 5, 7, or 10).
         difficulty: Game difficulty level.
@@ -98,11 +108,8 @@ class MatchConfig:
         Returns:
             True if configuration is valid, False otherwise.
         """
-        if self.wave_count not in (3, 5, 7, 10):
-            return False
-        if self.starting_money < 100 or self.starting_money > 5000:
-            return False
-        return True
+        return (self.wave_count in _VALID_WAVE_COUNTS
+                and _MIN_MONEY <= self.starting_money <= _MAX_MONEY)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -113,7 +120,7 @@ class MatchConfig:
         """
         return {
             'wave_count': self.wave_count,
-            'difficulty': self.difficulty.name,
+            'difficulty': self.difficulty.value,
             'game_speed': self.game_speed.value,
             'map_size': self.map_size.name,
             'starting_money': self.starting_money,
@@ -132,20 +139,13 @@ class MatchConfig:
         Returns:
             MatchConfig instance created from the data.
         """
-        # Convert string names back to enum instances
-        difficulty = Difficulty[data['difficulty']]
-        
-        # Find GameSpeed by value
-        game_speed = None
-        for speed in GameSpeed:
-            if speed.value == data['game_speed']:
-                game_speed = speed
-                break
-        if game_speed is None:
-            game_speed = GameSpeed.NORMAL
-        
-        # Convert map size name back to enum
-        map_size = MapSize[data['map_size']]
+        # Resolve enums through their member maps directly; an unknown
+        # game speed falls back to NORMAL
+        difficulty = Difficulty(data['difficulty'])
+        game_speed = GameSpeed._value2member_map_.get(
+            data['game_speed'], GameSpeed.NORMAL
+        )
+        map_size = MapSize.__members__[data['map_size']]
         
         return cls(
             wave_count=data['wave_count'],
@@ -71,6 +71,11 @@ class PhaseManager:
         # Track which points were placed in which round
         self._point_round_map: dict[int, int] = {}  # point_index -> round_number
         
+        # Cached answers to the add/remove predicates, polled every UI frame
+        self._can_add: bool = False
+        self._can_remove: bool = False
+        self._refresh_modification_flags()
+        
         logger.info(f"PhaseManager initialized with {max_rounds} rounds")
     
     @property
@@ -103,6 +108,24 @@ class PhaseManager:
         """Return number of initial points placed (preparation only)."""
         return self._initial_points_placed
     
+    def _refresh_modification_flags(self) -> None:
+        """
+        Recompute the cached add/remove flags.
+        
+        Must be called whenever the phase or the modification counters change.
+        """
+        if not self._current_phase.can_modify_path():
+            self._can_add = False
+            self._can_remove = False
+        elif self.is_preparation_phase:
+            # During preparation, can place up to 2 initial points but not remove
+            self._can_add = self._initial_points_placed < self.MAX_INITIAL_POINTS
+            self._can_remove = False
+        else:
+            # During regular rounds, can modify at most 1 point
+            self._can_add = self._points_modified_this_round < self.MAX_POINTS_PER_ROUND
+            self._can_remove = self._can_add
+    
     def can_add_control_point(self) -> bool:
         """
         Check if a control point can be added in the current phase.
@@ -110,15 +133,7 @@ class PhaseManager:
         Returns:
             True if a point can be added, False otherwise.
         """
-        if not self._current_phase.can_modify_path():
-            return False
-        
-        # During preparation, can place up to 2 initial points
-        if self.is_preparation_phase:
-            return self._initial_points_placed < self.MAX_INITIAL_POINTS
-        
-        # During regular rounds, can modify at most 1 point
-        return self._points_modified_this_round < self.MAX_POINTS_PER_ROUND
+        return self._can_add
     
     def can_remove_control_point(self, point_index: int) -> bool:
         """
@@ -130,20 +145,12 @@ class PhaseManager:
         Returns:
             True if the point can be removed, False otherwise.
         """
-        if not self._current_phase.can_modify_path():
-            return False
-        
-        # Cannot remove during preparation (points are being placed)
-        if self.is_preparation_phase:
+        # Phase and modification limit, cached on transition
+        if not self._can_remove:
             return False
         
         # Can only remove points placed in current round
-        point_round = self._point_round_map.get(point_index)
-        if point_round is None or point_round != self._current_round:
-            return False
-        
-        # Check modification limit
-        return self._points_modified_this_round < self.MAX_POINTS_PER_ROUND
+        return self._point_round_map.get(point_index) == self._current_round
     
     def can_move_control_point(self, point_index: int) -> bool:
         """
@@ -194,21 +201,20 @@ class PhaseManager:
         if not self.is_preparation_phase:
             return  # Validation only applies during preparation
         
-        # Start point must be on left border (x=0)
-        if is_start_point:
-            if x != 0:
+        # Start point on left border (x=0), end point on right (x=grid_width-1);
+        # the common valid placement passes with one comparison per axis
+        border_x = 0 if is_start_point else grid_width - 1
+        if x != border_x:
+            if is_start_point:
                 raise ControlPointConstraintError(
                     f"Start point must be on left border (x=0), got x={x}"
                 )
-        # End point must be on right border (x=grid_width-1)
-        else:
-            if x != grid_width - 1:
-                raise ControlPointConstraintError(
-                    f"End point must be on right border (x={grid_width-1}), got x={x}"
-                )
+            raise ControlPointConstraintError(
+                f"End point must be on right border (x={border_x}), got x={x}"
+            )
         
         # Validate Y is within bounds
-        if y < 0 or y >= grid_height:
+        if not 0 <= y < grid_height:
             raise ControlPointConstraintError(
                 f"Point Y coordinate must be within [0, {grid_height-1}], got y={y}"
             )
@@ -240,6 +246,7 @@ class PhaseManager:
         
         # Track which round this point was placed
         self._point_round_map[point_index] = self._current_round
+        self._refresh_modification_flags()
         
         logger.debug(f"Point {point_index} added in round {self._current_round}")
     
@@ -263,6 +270,7 @@ class PhaseManager:
         # Remove from tracking
         if point_index in self._point_round_map:
             del self._point_round_map[point_index]
+        self._refresh_modification_flags()
         
         logger.debug(f"Point {point_index} removed in round {self._current_round}")
     
@@ -277,8 +285,7 @@ class PhaseManager:
             InvalidPhaseTransitionError: If transition is not allowed.
         """
         # Validate transition is allowed
-        allowed_transitions = self._current_phase.get_allowed_transitions()
-        if new_phase_type not in allowed_transitions:
+        if new_phase_type not in self._current_phase.get_allowed_transitions():
             raise InvalidPhaseTransitionError(
                 f"Cannot transition from {self._current_phase.phase_type.name} "
                 f"to {new_phase_type.name}"
@@ -305,6 +312,8 @@ class PhaseManager:
             self._current_round += 1
             logger.info(f"Starting round {self._current_round}")
         
+        self._refresh_modification_flags()
+        
         logger.info(f"Phase transition: {old_phase.name} -> {new_phase_type.name}")
     
     def reset(self, max_rounds: Optional[int] = None) -> None:
@@ -322,6 +331,7 @@ class PhaseManager:
         self._points_modified_this_round = 0
         self._initial_points_placed = 0
         self._point_round_map.clear()
+        self._refresh_modification_flags()
         
         logger.info(f"PhaseManager reset for new game ({self._max_rounds} rounds)")
     
@@ -16,6 +16,7 @@ In multiplayer, the game uses an asymmetric model:
 
 from abc import ABC, abstractmethod
 from enum import Enum, auto
+from typing import ClassVar
 
 
 class PhaseType(Enum):
@@ -39,8 +40,14 @@ class GamePhaseState(ABC):
     Implements the State Pattern for game phase management.
     Each concrete state defines what actions are allowed and
     what transitions are valid.
+    
+    Attributes:
+        ALLOWED_TRANSITIONS: Phase types reachable from this state, defined
+            once per concrete state class.
     """
     
+    ALLOWED_TRANSITIONS: ClassVar[frozenset[PhaseType]]
+    
     @property
     @abstractmethod
     def phase_type(self) -> PhaseType:
@@ -77,10 +84,9 @@ class GamePhaseState(ABC):
         """Return whether research can be conducted in this phase."""
         pass
     
-    @abstractmethod
-    def get_allowed_transitions(self) -> list[PhaseType]:
-        """Return list of valid phase transitions from this state."""
-        pass
+    def get_allowed_transitions(self) -> frozenset[PhaseType]:
+        """Return the set of valid phase transitions from this state."""
+        return self.ALLOWED_TRANSITIONS
 
 
 class PreparationPhaseState(GamePhaseState):
@@ -92,6 +98,8 @@ class PreparationPhaseState(GamePhaseState):
     These points can be moved freely during this phase.
     """
     
+    ALLOWED_TRANSITIONS: ClassVar[frozenset[PhaseType]] = frozenset({PhaseType.BUILDING})
+    
     @property
     def phase_type(self) -> PhaseType:
         return PhaseType.PREPARATION
@@ -119,10 +127,6 @@ class PreparationPhaseState(GamePhaseState):
     def can_research(self) -> bool:
         """Cannot research during preparation."""
         return False
-    
-    def get_allowed_transitions(self) -> list[PhaseType]:
-        """Can only transition to building phase."""
-        return [PhaseType.BUILDING]
 
 
 class PathModificationPhaseState(GamePhaseState):
@@ -140,6 +144,8 @@ class PathModificationPhaseState(GamePhaseState):
     Previously placed points cannot be moved, only removed.
     """
     
+    ALLOWED_TRANSITIONS: ClassVar[frozenset[PhaseType]] = frozenset({PhaseType.BUILDING})
+    
     @property
     def phase_type(self) -> PhaseType:
         return PhaseType.PATH_MODIFICATION
@@ -167,10 +173,6 @@ class PathModificationPhaseState(GamePhaseState):
     def can_research(self) -> bool:
         """Can conduct research during path modification."""
         return True
-    
-    def get_allowed_transitions(self) -> list[PhaseType]:
-        """Can transition to building phase."""
-        return [PhaseType.BUILDING]
 
 
 class BuildingPhaseState(GamePhaseState):
@@ -183,6 +185,8 @@ class BuildingPhaseState(GamePhaseState):
     This happens before enemies spawn but after the attack path is set.
     """
     
+    ALLOWED_TRANSITIONS: ClassVar[frozenset[PhaseType]] = frozenset({PhaseType.COMBAT})
+    
     @property
     def phase_type(self) -> PhaseType:
         return PhaseType.BUILDING
@@ -210,10 +214,6 @@ class BuildingPhaseState(GamePhaseState):
     def can_research(self) -> bool:
         """Cannot research during building."""
         return False
-    
-    def get_allowed_transitions(self) -> list[PhaseType]:
-        """Can transition to combat phase."""
-        return [PhaseType.COMBAT]
 
 
 class CombatPhaseState(GamePhaseState):
@@ -225,6 +225,8 @@ class CombatPhaseState(GamePhaseState):
     Phase ends when wave is cleared or lives reach 0.
     """
     
+    ALLOWED_TRANSITIONS: ClassVar[frozenset[PhaseType]] = frozenset({PhaseType.ROUND_END})
+    
     @property
     def phase_type(self) -> PhaseType:
         return PhaseType.COMBAT
@@ -252,10 +254,6 @@ class CombatPhaseState(GamePhaseState):
     def can_research(self) -> bool:
         """Cannot research during combat."""
         return False
-    
-    def get_allowed_transitions(self) -> list[PhaseType]:
-        """Can transition to round end."""
-        return [PhaseType.ROUND_END]
 
 
 class RoundEndPhaseState(GamePhaseState):
@@ -266,6 +264,8 @@ class RoundEndPhaseState(GamePhaseState):
     Transitions back to path modification for next round.
     """
     
+    ALLOWED_TRANSITIONS: ClassVar[frozenset[PhaseType]] = frozenset({PhaseType.PATH_MODIFICATION})
+    
     @property
     def phase_type(self) -> PhaseType:
         return PhaseType.ROUND_END
@@ -293,10 +293,6 @@ class RoundEndPhaseState(GamePhaseState):
     def can_research(self) -> bool:
         """Cannot research during round end."""
         return False
-    
-    def get_allowed_transitions(self) -> list[PhaseType]:
-        """Can transition to path modification for next round."""
-        return [PhaseType.PATH_MODIFICATION]
 
 
 # Factory for creating phase state instances
@@ -308,21 +304,26 @@ _PHASE_STATE_MAP = {
     PhaseType.ROUND_END: RoundEndPhaseState,
 }
 
+# Phase states hold no per-instance data, so one shared instance per type
+_PHASE_STATES: dict[PhaseType, GamePhaseState] = {
+    phase_type: state_class() for phase_type, state_class in _PHASE_STATE_MAP.items()
+}
+
 
 def create_phase_state(phase_type: PhaseType) -> GamePhaseState:
     """
-    Factory function to create phase state instances.
+    Factory function to get phase state instances.
     
     Args:
-        phase_type: The type of phase to create.
+        phase_type: The type of phase to get.
         
     Returns:
-        A new instance of the appropriate phase state.
+        The shared instance of the appropriate phase state.
         
     Raises:
         ValueError: If phase_type is invalid.
     """
-    state_class = _PHASE_STATE_MAP.get(phase_type)
-    if state_class is None:
+    state = _PHASE_STATES.get(phase_type)
+    if state is None:
         raise ValueError(f"Unknown phase type: {phase_type}")
-    return state_class()
+    return state
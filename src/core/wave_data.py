@@ -5,13 +5,14 @@ This module defines the dataclasses for wave configurations and provides
 predefined waves with increasing difficulty.
 """
 
+import functools
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Tuple
 
 from entities.enemy import EnemyType
 
 
-@dataclass
+@dataclass(frozen=True)
 class EnemySpawnConfig:
     """
     Configuration for a group of enemies to spawn in a wave.
@@ -28,18 +29,18 @@ class EnemySpawnConfig:
     speed_modifier: float = 1.0
 
 
-@dataclass
+@dataclass(frozen=True)
 class WaveConfig:
     """
     Configuration for a complete wave of enemies.
 
     Attributes:
         wave_number: The wave number (1-indexed).
-        enemy_configs: List of enemy spawn configurations for this wave.
+        enemy_configs: Enemy spawn configurations for this wave.
         spawn_interval: Time in seconds between each enemy spawn.
     """
     wave_number: int
-    enemy_configs: List[EnemySpawnConfig]
+    enemy_configs: Tuple[EnemySpawnConfig, ...]
     spawn_interval: float
 
 
@@ -47,29 +48,37 @@ def get_predefined_waves() -> List[WaveConfig]:
     """
     Get the list of predefined waves for the game.
 
-    Returns a list of 5 waves with increasing difficulty.
+    Returns a list of 5 waves with increasing difficulty. The WaveConfig
+    objects are built once and shared between callers; only the outer list
+    is new on each call.
 
     Returns:
         List of WaveConfig objects defining each wave.
     """
+    return list(_predefined_waves())
+
+
+@functools.lru_cache(maxsize=1)
+def _predefined_waves() -> Tuple[WaveConfig, ...]:
+    """Build the predefined waves once; a tuple so the cache can't be mutated."""
     waves = [
         # Wave 1: Easy introduction - only basic STUDENT enemies
         WaveConfig(
             wave_number=1,
-            enemy_configs=[
+            enemy_configs=(
                 EnemySpawnConfig(
                     enemy_type=EnemyType.STUDENT,
                     count=5,
                     health_modifier=1.0,
                     speed_modifier=1.0
                 ),
-            ],
+            ),
             spawn_interval=2.0
         ),
         # Wave 2: More students, first VARIABLE_X enemies appear
         WaveConfig(
             wave_number=2,
-            enemy_configs=[
+            enemy_configs=(
                 EnemySpawnConfig(
                     enemy_type=EnemyType.STUDENT,
                     count=7,
@@ -82,13 +91,13 @@ def get_predefined_waves() -> List[WaveConfig]:
                     health_modifier=1.0,
                     speed_modifier=1.0
                 ),
-            ],
+            ),
             spawn_interval=1.8
         ),
         # Wave 3: Increased enemy count and health
         WaveConfig(
             wave_number=3,
-            enemy_configs=[
+            enemy_configs=(
                 EnemySpawnConfig(
                     enemy_type=EnemyType.STUDENT,
                     count=10,
@@ -101,13 +110,13 @@ def get_predefined_waves() -> List[WaveConfig]:
                     health_modifier=1.2,
                     speed_modifier=1.1
                 ),
-            ],
+            ),
             spawn_interval=1.5
         ),
         # Wave 4: Higher difficulty with tougher enemies
         WaveConfig(
             wave_number=4,
-            enemy_configs=[
+            enemy_configs=(
                 EnemySpawnConfig(
                     enemy_type=EnemyType.STUDENT,
                     count=12,
@@ -120,13 +129,13 @@ def get_predefined_waves() -> List[WaveConfig]:
                     health_modifier=1.3,
                     speed_modifier=1.2
                 ),
-            ],
+            ),
             spawn_interval=1.2
         ),
         # Wave 5: Final wave - hardest difficulty
         WaveConfig(
             wave_number=5,
-            enemy_configs=[
+            enemy_configs=(
                 EnemySpawnConfig(
                     enemy_type=EnemyType.STUDENT,
                     count=15,
@@ -139,8 +148,8 @@ def get_predefined_waves() -> List[WaveConfig]:
                     health_modifier=1.5,
                     speed_modifier=1.4
                 ),
-            ],
+            ),
             spawn_interval=1.0
         ),
     ]
-    return waves
+    return tuple(waves)
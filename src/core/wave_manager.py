@@ -37,6 +37,7 @@ class WaveManager:
         self._waves: List[WaveConfig] = get_predefined_waves()
         self._current_wave: int = 0
         self._is_active: bool = False
+        self._completed: bool = False
         self._path: List[Tuple[float, float]] = []
         
         # Spawn queue management
@@ -175,6 +176,7 @@ class WaveManager:
         self._current_wave = wave_number
         self._path = path
         self._is_active = True
+        self._completed = False
 
         # Get wave configuration
         wave_config = self._waves[wave_number - 1]
@@ -204,7 +206,9 @@ class WaveManager:
         """
         Update the wave manager and spawn enemies as needed.
 
-        Should be called each frame during the BATTLE phase.
+        Should be called each frame during the BATTLE phase. Once every
+        enemy of the wave has spawned and died, the wave is finalized here
+        and wave complete subscribers are notified.
 
         Args:
             dt: Delta time since last update in seconds.
@@ -244,6 +248,8 @@ class WaveManager:
                 self._current_spawn_config_index += 1
                 self._current_spawn_count = 0
 
+        self._check_and_fire_complete()
+
         return newly_spawned
 
     def _create_enemy_from_config(
@@ -273,24 +279,17 @@ class WaveManager:
             speed=modified_speed,
         )
 
-    def is_wave_complete(self) -> bool:
+    def _check_and_fire_complete(self) -> None:
         """
-        Check if the current wave is complete.
+        Finalize the current wave if it is complete.
 
         A wave is complete when all enemies have been spawned AND
-        all spawned enemies are dead.
-
-        Returns:
-            True if the wave is complete, False otherwise.
+        all spawned enemies are dead. Completing a wave deactivates it
+        and notifies the wave complete subscribers exactly once.
         """
-        if not self._is_active:
-            return False
-
         # Check if all enemies have been spawned
-        all_spawned = self._total_enemies_spawned >= self._total_enemies_to_spawn
-
-        if not all_spawned:
-            return False
+        if self._total_enemies_spawned < self._total_enemies_to_spawn:
+            return
 
         # Check if all spawned enemies are dead
         all_dead = all(
@@ -298,14 +297,22 @@ class WaveManager:
             for enemy in self._spawned_enemies
         )
 
-        if all_spawned and all_dead:
-            # Wave is complete - notify and reset
-            wave_number = self._current_wave
+        if all_dead:
             self._is_active = False
-            self._notify_wave_complete(wave_number)
-            return True
+            self._completed = True
+            self._notify_wave_complete(self._current_wave)
 
-        return False
+    def is_wave_complete(self) -> bool:
+        """
+        Check if the current wave has been completed.
+
+        Completion is detected by update(); the flag stays set until the
+        next wave is started or the manager is reset.
+
+        Returns:
+            True if the current wave is complete, False otherwise.
+        """
+        return self._completed
 
     def get_current_wave(self) -> int:
         """
@@ -343,6 +350,7 @@ class WaveManager:
         """Reset the wave manager to initial state."""
         self._current_wave = 0
         self._is_active = False
+        self._completed = False
         self._spawn_queue = []
         self._current_spawn_config_index = 0
         self._current_spawn_count = 0
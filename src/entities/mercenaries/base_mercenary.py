@@ -9,9 +9,9 @@ from dataclasses import dataclass
 from typing import Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MercenaryStats:
-    """Stats for a mercenary unit."""
+    """Stats for a mercenary unit, shared by every instance of a type."""
     base_hp: int
     base_speed: float
     cost: int
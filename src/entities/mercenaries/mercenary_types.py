@@ -4,13 +4,13 @@ Mercenary type definitions for PathWars - The Interpolation Battles.
 This module defines the concrete mercenary classes and their types.
 """
 
-from enum import Enum, auto
+from enum import IntEnum, auto
 
 from entities.mercenaries.base_mercenary import BaseMercenary, MercenaryStats
 
 
-class MercenaryType(Enum):
-    """Enumeration of available mercenary types."""
+class MercenaryType(IntEnum):
+    """Enumeration of available mercenary types (hashes as a plain int)."""
     REINFORCED_STUDENT = auto()
     SPEEDY_VARIABLE_X = auto()
     TANK_CONSTANT_PI = auto()
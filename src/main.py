@@ -254,6 +254,7 @@ def main() -> None:
         
         # Check if in multiplayer mode and waiting for connection
         if game_mode == 'multiplayer' and duel_session:
+            duel_session.update(dt)
             if duel_session.phase == DuelPhase.WAITING_OPPONENT:
                 # Draw waiting screen
                 screen.fill((20, 20, 40))
@@ -1,4 +1,5 @@
 
+import functools
 import warnings
 import numpy as np
 from scipy.interpolate import lagrange, CubicSpline
@@ -32,19 +33,20 @@ class Interpolator:
         if len(points) < 2:
             return points
 
-        x = np.array([p[0] for p in points])
-        y = np.array([p[1] for p in points])
+        x = np.fromiter((p[0] for p in points), dtype=np.float64, count=len(points))
+        y = np.fromiter((p[1] for p in points), dtype=np.float64, count=len(points))
         
         # Calculate cumulative distance to space points evenly along the path
-        dist = np.cumsum(np.sqrt(np.ediff1d(x, to_begin=0)**2 + np.ediff1d(y, to_begin=0)**2))
-        dist = dist / dist[-1]  # Normalize 0 to 1
+        dist = np.cumsum(np.hypot(np.ediff1d(x, to_begin=0), np.ediff1d(y, to_begin=0)))
+        dist /= dist[-1]  # Normalize 0 to 1
         
         interp_dist = np.linspace(0, 1, num_points)
         
+        # np.interp locates each sample's segment and lerps in a single C loop
         new_x = np.interp(interp_dist, dist, x)
         new_y = np.interp(interp_dist, dist, y)
         
-        return list(zip(new_x, new_y))
+        return list(zip(new_x.tolist(), new_y.tolist()))
 
     @staticmethod
     def lagrange_interpolate(points: List[Tuple[float, float]], num_points: int = 100) -> List[Tuple[float, float]]:
@@ -100,6 +102,20 @@ class Interpolator:
         if len(points) < 2:
             return points
 
+        return list(Interpolator._cubic_spline_cached(
+            tuple(map(tuple, points)), num_points
+        ))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _cubic_spline_cached(
+        points: Tuple[Tuple[float, float], ...], num_points: int
+    ) -> Tuple[Tuple[float, float], ...]:
+        """
+        Memoized cubic spline evaluation keyed on hashable control points.
+        
+        Returns a tuple so cached results cannot be mutated by callers.
+        """
         x = np.array([p[0] for p in points])
         y = np.array([p[1] for p in points])
         
@@ -116,7 +132,7 @@ class Interpolator:
         new_x = cs_x(t_new)
         new_y = cs_y(t_new)
         
-        return list(zip(new_x, new_y))
+        return tuple(zip(new_x, new_y))
 
     @staticmethod
     def interpolate(
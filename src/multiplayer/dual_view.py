@@ -110,7 +110,7 @@ class DualView:
         Returns:
             True if position is in local viewport, False otherwise.
         """
-        return self._local_viewport.collidepoint(screen_pos[0], screen_pos[1])
+        return self._local_viewport.collidepoint(screen_pos)
     
     def is_in_remote_view(self, screen_pos: Tuple[int, int]) -> bool:
         """
@@ -122,7 +122,7 @@ class DualView:
         Returns:
             True if position is in remote viewport, False otherwise.
         """
-        return self._remote_viewport.collidepoint(screen_pos[0], screen_pos[1])
+        return self._remote_viewport.collidepoint(screen_pos)
     
     def draw_divider(self, surface: pygame.Surface, color: Tuple[int, int, int] = (100, 100, 100)) -> None:
         """
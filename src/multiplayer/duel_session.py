@@ -229,6 +229,7 @@ class DuelSession:
         
         # Subscribe to sync messages
         self._sync_engine.subscribe(SyncMessageType.FULL_SYNC, self._on_full_sync)
+        self._sync_engine.subscribe(SyncMessageType.FULL_SYNC_REQUEST, self._on_full_sync_request)
         self._sync_engine.subscribe(SyncMessageType.CURVE_POINT_ADD, self._on_curve_point_add)
         self._sync_engine.subscribe(SyncMessageType.CURVE_POINT_MOVE, self._on_curve_point_move)
         self._sync_engine.subscribe(SyncMessageType.CURVE_POINT_REMOVE, self._on_curve_point_remove)
@@ -267,19 +268,36 @@ class DuelSession:
     def _on_full_sync(self, sync_msg: SyncMessage) -> None:
         """Handle full curve synchronization."""
         if self._local_incoming_curve:
-            self._local_incoming_curve.clear_points()
-            for x, y in sync_msg.data.get('control_points', []):
-                self._local_incoming_curve.add_point(x, y)
+            # Replace the points as sent; the opponent already validated them
+            self._local_incoming_curve.set_points(sync_msg.data.get('control_points', []))
             method = sync_msg.data.get('interpolation_method', 'linear')
             self._local_incoming_curve.set_method(method)
             logger.info("Received full curve sync")
     
+    def _on_full_sync_request(self, sync_msg: SyncMessage) -> None:
+        """Handle a request from the opponent to resend the full curve."""
+        if self._sync_engine and self._local_edit_curve:
+            self._sync_engine.sync_full_curve(self._local_edit_curve)
+    
+    def _request_resync(self) -> None:
+        """
+        Ask the opponent for its full curve after an edit failed to apply.
+        
+        The opponent already applied the edit, so a rejection here means
+        the incoming curve no longer matches the opponent's edit curve.
+        """
+        logger.warning("Remote curve edit rejected, requesting full sync")
+        if self._sync_engine:
+            self._sync_engine.request_full_sync()
+    
     def _on_curve_point_add(self, sync_msg: SyncMessage) -> None:
         """Handle curve point addition."""
         if self._local_incoming_curve:
             x = sync_msg.data.get('x', 0.0)
             y = sync_msg.data.get('y', 0.0)
-            self._local_incoming_curve.add_point(x, y)
+            if not self._local_incoming_curve.add_point(x, y):
+                self._request_resync()
+                return
             logger.debug(f"Remote added point at ({x}, {y})")
     
     def _on_curve_point_move(self, sync_msg: SyncMessage) -> None:
@@ -288,14 +306,18 @@ class DuelSession:
             index = sync_msg.data.get('index', 0)
             x = sync_msg.data.get('x', 0.0)
             y = sync_msg.data.get('y', 0.0)
-            self._local_incoming_curve.move_point(index, x, y)
+            if not self._local_incoming_curve.move_point(index, x, y):
+                self._request_resync()
+                return
             logger.debug(f"Remote moved point {index} to ({x}, {y})")
     
     def _on_curve_point_remove(self, sync_msg: SyncMessage) -> None:
         """Handle curve point removal."""
         if self._local_incoming_curve:
             index = sync_msg.data.get('index', 0)
-            self._local_incoming_curve.remove_point(index)
+            if not self._local_incoming_curve.remove_point(index):
+                self._request_resync()
+                return
             logger.debug(f"Remote removed point {index}")
     
     def _on_curve_method_change(self, sync_msg: SyncMessage) -> None:
@@ -400,6 +422,8 @@ class DuelSession:
     def disconnect(self) -> None:
         """Disconnect from the duel session."""
         logger.info("Disconnecting from duel session")
+        if self._sync_engine:
+            self._sync_engine.flush()
         self._network_manager.close()
         self._phase = DuelPhase.DISCONNECTED
     
@@ -410,5 +434,5 @@ class DuelSession:
         Args:
             dt: Delta time in seconds.
         """
-        # Placeholder for any per-frame updates needed
-        pass
+        if self._sync_engine and not self._sync_engine.update(dt):
+            logger.warning("Failed to send pending sync messages")
@@ -6,17 +6,33 @@ Synchronizes curve states, tower placements, and game events.
 """
 
 import logging
+import threading
+import weakref
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from network.manager import NetworkManager
-from network.protocol import Message, MessageType
+from network.protocol import Message, MessageType, encode_json
 from core.curve_state import CurveState
 
 logger = logging.getLogger(__name__)
 
 
+# Control point coordinates travel as integers in thousandths of a grid unit
+COORD_SCALE = 1000
+
+
+def _quantize(value: float) -> int:
+    """Convert a coordinate to its fixed-point wire representation."""
+    return round(value * COORD_SCALE)
+
+
+def _dequantize(value: int) -> float:
+    """Convert a fixed-point wire coordinate back to a float."""
+    return value / COORD_SCALE
+
+
 class SyncMessageType(Enum):
     """
     Enumeration of synchronization message types.
@@ -34,9 +50,43 @@ class SyncMessageType(Enum):
     READY_STATE = auto()
     GAME_EVENT = auto()
     FULL_SYNC = auto()
+    FULL_SYNC_REQUEST = auto()
+    BATCH = auto()
+
+
+# Decoding table for incoming payloads, avoiding SyncMessageType[...] per message
+_SYNC_TYPE_BY_NAME: Dict[str, SyncMessageType] = {
+    sync_type.name: sync_type for sync_type in SyncMessageType
+}
+
+# Encoding table for outgoing payloads, avoiding the Enum.name descriptor
+_SYNC_TYPE_NAMES: Dict[SyncMessageType, str] = {
+    sync_type: name for name, sync_type in _SYNC_TYPE_BY_NAME.items()
+}
 
+# Pre-encoded JSON envelope pieces, so only the data dict goes through the encoder
+_ENVELOPE_PREFIXES: Dict[SyncMessageType, bytes] = {
+    sync_type: b'{"sync_type":"' + name.encode('ascii') + b'","data":'
+    for sync_type, name in _SYNC_TYPE_NAMES.items()
+}
+_SEQUENCE_KEY = b',"sequence":'
 
-@dataclass
+
+def _encode_envelope(sync_type: SyncMessageType, data_json: bytes, sequence: int) -> bytes:
+    """Assemble the JSON form of a sync payload around already-encoded data."""
+    return b''.join((
+        _ENVELOPE_PREFIXES[sync_type], data_json, _SEQUENCE_KEY, b'%d}' % sequence
+    ))
+
+
+# Sync types whose 'x'/'y' data fields are sent quantized
+_QUANTIZED_SYNC_TYPES = frozenset({
+    SyncMessageType.CURVE_POINT_ADD,
+    SyncMessageType.CURVE_POINT_MOVE,
+})
+
+
+@dataclass(slots=True)
 class SyncMessage:
     """
     Synchronization message for game state updates.
@@ -58,11 +108,20 @@ class SyncMessage:
             Dictionary representation for network transmission.
         """
         return {
-            'sync_type': self.sync_type.name,
+            'sync_type': _SYNC_TYPE_NAMES[self.sync_type],
             'data': self.data,
             'sequence': self.sequence,
         }
     
+    def to_json_bytes(self) -> bytes:
+        """
+        Encode the payload as UTF-8 JSON.
+        
+        Returns:
+            JSON bytes equivalent to encoding ``to_payload()``.
+        """
+        return _encode_envelope(self.sync_type, encode_json(self.data), self.sequence)
+    
     @classmethod
     def from_payload(cls, payload: Dict[str, Any]) -> 'SyncMessage':
         """
@@ -75,11 +134,10 @@ class SyncMessage:
             A new SyncMessage instance.
             
         Raises:
-            KeyError: If required fields are missing.
-            ValueError: If sync_type is invalid.
+            KeyError: If required fields are missing or sync_type is unknown.
         """
         return cls(
-            sync_type=SyncMessageType[payload['sync_type']],
+            sync_type=_SYNC_TYPE_BY_NAME[payload['sync_type']],
             data=payload.get('data', {}),
             sequence=payload.get('sequence', 0),
         )
@@ -92,20 +150,53 @@ class SyncEngine:
     Manages synchronization of curve states, tower placements, and game events
     between players using the NetworkManager.
     
+    Outgoing sync messages are queued and sent together as a single BATCH
+    message once ``flush_threshold`` messages are pending or, on an
+    ``update`` call, ``flush_interval`` seconds have passed, whichever
+    comes first. Batches go out in the order their messages were queued.
+    
+    Control point coordinates, including those of a full sync, are sent as
+    integers scaled by ``COORD_SCALE`` and restored to floats before
+    observers are notified. Rounding can move two points closer than
+    CurveState's duplicate-X tolerance, so receivers apply full syncs with
+    ``CurveState.set_points`` rather than point by point.
+    
     Attributes:
         network_manager: The NetworkManager instance for sending/receiving messages.
     """
     
-    def __init__(self, network_manager: NetworkManager) -> None:
+    DEFAULT_FLUSH_THRESHOLD = 16
+    DEFAULT_FLUSH_INTERVAL = 0.016  # One 60 Hz frame
+    
+    def __init__(
+        self,
+        network_manager: NetworkManager,
+        flush_threshold: int = DEFAULT_FLUSH_THRESHOLD,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
         """
         Initialize the SyncEngine.
         
         Args:
             network_manager: NetworkManager instance for communication.
+            flush_threshold: Number of pending messages that triggers a flush.
+            flush_interval: Seconds a message may wait before it is flushed.
         """
         self._network_manager = network_manager
         self._sequence_number = 0
         self._observers: Dict[SyncMessageType, List[Callable[[SyncMessage], None]]] = {}
+        self._flush_threshold = flush_threshold
+        self._flush_interval = flush_interval
+        self._pending: List[SyncMessage] = []
+        self._pending_age = 0.0
+        self._pending_lock = threading.Lock()
+        # Held from taking the pending messages until they are sent, so
+        # concurrent flushes cannot reorder batches on the wire
+        self._send_lock = threading.Lock()
+        # Curve version last sent in a full sync, per curve
+        self._full_sync_versions: "weakref.WeakKeyDictionary[CurveState, int]" = (
+            weakref.WeakKeyDictionary()
+        )
         
         # Subscribe to network messages
         self._network_manager.subscribe(MessageType.GAME_STATE, self._on_network_message)
@@ -140,66 +231,212 @@ class SyncEngine:
         """
         Notify all observers subscribed to this sync message type.
         
+        Callbacks are iterated from a snapshot so they may subscribe or
+        unsubscribe while being notified.
+        
         Args:
             sync_msg: The sync message that was received.
         """
-        if sync_msg.sync_type in self._observers:
-            for callback in self._observers[sync_msg.sync_type]:
-                try:
-                    callback(sync_msg)
-                except Exception as e:
-                    logger.error(f"Error in sync callback: {e}")
+        for callback in tuple(self._observers.get(sync_msg.sync_type, ())):
+            try:
+                callback(sync_msg)
+            except Exception as e:
+                logger.error(f"Error in sync callback: {e}")
+    
+    def _dispatch(self, sync_msg: SyncMessage) -> None:
+        """
+        Restore quantized coordinates and notify observers.
+        
+        Args:
+            sync_msg: A decoded, non-batch sync message.
+        """
+        # Restored values go into a new dict, leaving the received one intact
+        data = sync_msg.data
+        if sync_msg.sync_type in _QUANTIZED_SYNC_TYPES:
+            sync_msg.data = {
+                **data, 'x': _dequantize(data['x']), 'y': _dequantize(data['y'])
+            }
+        elif sync_msg.sync_type is SyncMessageType.FULL_SYNC:
+            sync_msg.data = {
+                **data,
+                'control_points': [
+                    (_dequantize(x), _dequantize(y))
+                    for x, y in data.get('control_points', ())
+                ],
+            }
+        elif sync_msg.sync_type is SyncMessageType.FULL_SYNC_REQUEST:
+            # The peer lost track of our curves; the next full sync must go out
+            self._full_sync_versions.clear()
+        self._notify_observers(sync_msg)
     
     def _on_network_message(self, message: Message) -> None:
         """
         Handle incoming network messages.
         
+        Each entry of a BATCH message is parsed on its own, so a malformed
+        entry is dropped without losing the entries after it.
+        
         Args:
             message: The network message received.
         """
         try:
             sync_msg = SyncMessage.from_payload(message.payload)
-            self._notify_observers(sync_msg)
-        except (KeyError, ValueError) as e:
+            if sync_msg.sync_type is not SyncMessageType.BATCH:
+                self._dispatch(sync_msg)
+                return
+            batch = sync_msg.data['batch']
+        except (KeyError, TypeError, ValueError) as e:
             logger.error(f"Error parsing sync message: {e}")
+            return
+        for payload in batch:
+            try:
+                self._dispatch(SyncMessage.from_payload(payload))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.error(f"Error parsing batched sync message: {e}")
     
     def _send_sync(self, sync_msg: SyncMessage) -> bool:
         """
-        Send a synchronization message.
+        Queue a synchronization message for the next flush.
         
         Args:
             sync_msg: The sync message to send.
             
         Returns:
-            True if sent successfully, False otherwise.
+            True if the message was queued (or, on reaching the flush
+            threshold, sent), False if not connected or the send failed.
         """
-        sync_msg.sequence = self._sequence_number
-        self._sequence_number += 1
+        if not self._network_manager.is_connected:
+            logger.warning("Cannot sync: not connected")
+            return False
         
-        message = Message(
-            msg_type=MessageType.GAME_STATE,
-            payload=sync_msg.to_payload()
-        )
+        with self._pending_lock:
+            sync_msg.sequence = self._sequence_number
+            self._sequence_number += 1
+            self._pending.append(sync_msg)
+            
+            if len(self._pending) < self._flush_threshold:
+                return True
+        
+        return self.flush()
+    
+    def update(self, dt: float) -> bool:
+        """
+        Flush pending sync messages once they have waited ``flush_interval``.
+        
+        Should be called each frame while a session is active.
+        
+        Args:
+            dt: Delta time since last update in seconds.
+            
+        Returns:
+            False if a flush was due and failed, True otherwise.
+        """
+        with self._pending_lock:
+            if not self._pending:
+                return True
+            self._pending_age += dt
+            if self._pending_age < self._flush_interval:
+                return True
+        
+        return self.flush()
+    
+    def flush(self) -> bool:
+        """
+        Send all pending sync messages.
+        
+        A single pending message is sent as-is; several are wrapped in one
+        BATCH message.
+        
+        Returns:
+            True if the pending messages were sent (or none were pending),
+            False otherwise.
+        """
+        with self._send_lock:
+            with self._pending_lock:
+                pending = self._pending
+                self._pending = []
+                self._pending_age = 0.0
+            
+            if not pending:
+                return True
+            return self._send_pending(pending)
+    
+    def _send_pending(self, pending: List[SyncMessage]) -> bool:
+        """
+        Send taken pending messages as one network message.
         
+        Args:
+            pending: The messages to send, in queue order.
+            
+        Returns:
+            True if sent successfully, False otherwise.
+        """
+        if len(pending) == 1:
+            payload = pending[0].to_payload()
+            payload_json = pending[0].to_json_bytes()
+        else:
+            batch = SyncMessage(
+                sync_type=SyncMessageType.BATCH,
+                data={'batch': [sync_msg.to_payload() for sync_msg in pending]},
+                sequence=pending[-1].sequence,
+            )
+            payload = batch.to_payload()
+            payload_json = _encode_envelope(
+                SyncMessageType.BATCH,
+                b'{"batch":[' + b','.join(m.to_json_bytes() for m in pending) + b']}',
+                batch.sequence,
+            )
+        
+        message = Message(msg_type=MessageType.GAME_STATE, payload=payload)
+        message.set_payload_json(payload_json)
         return self._network_manager.send(message)
     
-    def sync_full_curve(self, curve_state: CurveState) -> bool:
+    def sync_full_curve(self, curve_state: CurveState, force: bool = False) -> bool:
         """
         Send a full curve state synchronization.
         
+        The send is skipped when this curve has not changed since it was
+        last fully synced, unless ``force`` is set or the peer has asked
+        for a resend with a FULL_SYNC_REQUEST. The message is flushed at
+        once, and the version only counts as synced after the send succeeds.
+        
         Args:
             curve_state: The curve state to synchronize.
+            force: Send even if the curve is unchanged since the last full sync.
             
         Returns:
-            True if sent successfully, False otherwise.
+            True if sent (or skipped as unchanged) successfully, False otherwise.
         """
+        version = curve_state.version
+        if not force and self._full_sync_versions.get(curve_state) == version:
+            return True
+        
         sync_msg = SyncMessage(
             sync_type=SyncMessageType.FULL_SYNC,
             data={
-                'control_points': curve_state.control_points,
+                'control_points': [
+                    (_quantize(x), _quantize(y)) for x, y in curve_state.control_points
+                ],
                 'interpolation_method': curve_state.interpolation_method,
+                'version': version,
             }
         )
+        sent = self._send_sync(sync_msg) and self.flush()
+        if sent:
+            self._full_sync_versions[curve_state] = version
+        return sent
+    
+    def request_full_sync(self) -> bool:
+        """
+        Ask the peer to resend its full curve state.
+        
+        Used when an incoming curve edit cannot be applied, which means the
+        local copy of the peer's curve has diverged.
+        
+        Returns:
+            True if sent successfully, False otherwise.
+        """
+        sync_msg = SyncMessage(sync_type=SyncMessageType.FULL_SYNC_REQUEST)
         return self._send_sync(sync_msg)
     
     def sync_point_added(self, x: float, y: float) -> bool:
@@ -215,7 +452,7 @@ class SyncEngine:
         """
         sync_msg = SyncMessage(
             sync_type=SyncMessageType.CURVE_POINT_ADD,
-            data={'x': x, 'y': y}
+            data={'x': _quantize(x), 'y': _quantize(y)}
         )
         return self._send_sync(sync_msg)
     
@@ -233,7 +470,7 @@ class SyncEngine:
         """
         sync_msg = SyncMessage(
             sync_type=SyncMessageType.CURVE_POINT_MOVE,
-            data={'index': index, 'x': x, 'y': y}
+            data={'index': index, 'x': _quantize(x), 'y': _quantize(y)}
         )
         return self._send_sync(sync_msg)
     
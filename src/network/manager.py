@@ -6,13 +6,15 @@ Uses the Observer pattern to emit events when messages arrive, and threading for
 non-blocking receives.
 """
 
+import io
 import logging
+import queue
 import socket
 import threading
 import time
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple, Union
 
-from .protocol import Message, MessageType, Serializer
+from .protocol import MAX_FRAME_SIZE, Message, MessageType, Serializer
 
 # Get logger for this module (let application configure logging)
 logger = logging.getLogger(__name__)
@@ -21,6 +23,20 @@ logger = logging.getLogger(__name__)
 # Type alias for message callback functions
 MessageCallback = Callable[[Message], None]
 
+# Dispatch queue items: a received message, a connection status change, or
+# None to stop the dispatcher
+DispatchItem = Union[Message, bool, None]
+
+# Observer table slots, indexed directly by MessageType.value
+_OBSERVER_SLOTS = max(msg_type.value for msg_type in MessageType) + 1
+
+# Size of the buffered writer wrapping the peer socket
+SEND_BUFFER_SIZE = 65536
+
+# Size of the reusable receive buffer (grown for larger messages, then shrunk
+# back once they are consumed)
+RECV_BUFFER_SIZE = 65536
+
 
 class NetworkManager:
     """
@@ -29,6 +45,11 @@ class NetworkManager:
     Uses the Observer pattern to notify listeners when messages arrive.
     Supports both hosting (server) and connecting (client) modes.
 
+    Received messages are handed to a dispatcher thread through a queue, so
+    a slow message callback never stalls the socket receive loop. The
+    disconnect notification goes through the same queue, so it is only
+    delivered after every message received before it.
+
     Attributes:
         is_host: True if this instance is hosting, False if connecting.
         is_connected: True if a connection is established.
@@ -40,29 +61,45 @@ class NetworkManager:
     def __new__(cls, *args, **kwargs) -> "NetworkManager":
         """
         Implement Singleton pattern to ensure only one NetworkManager exists.
+
+        The lock is only taken while no instance exists yet; once created,
+        the instance is returned from a single unlocked read.
         """
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+            return cls._instance
 
     def __init__(self) -> None:
         """Initialize the NetworkManager."""
         # Prevent re-initialization if already initialized
-        if hasattr(self, "_initialized") and self._initialized:
+        if getattr(self, "_initialized", False):
             return
 
         self._initialized = True
         self._serializer = Serializer()
         self._socket: Optional[socket.socket] = None
         self._client_socket: Optional[socket.socket] = None
+        self._send_buffer: Optional[io.BufferedWriter] = None
+        self._send_lock = threading.Lock()
+        self._recv_buf = bytearray(RECV_BUFFER_SIZE)
         self._server_thread: Optional[threading.Thread] = None
         self._receive_thread: Optional[threading.Thread] = None
+        self._dispatch_thread: Optional[threading.Thread] = None
+        self._dispatch_queue: "queue.SimpleQueue[DispatchItem]" = queue.SimpleQueue()
         self._running = False
         self._is_host = False
         self._is_connected = False
-        self._observers: Dict[MessageType, List[MessageCallback]] = {}
+        self._accept_ready = threading.Event()
+        self._client_connected_event = threading.Event()
+        # Copy-on-write tuples: subscribing is rare, notifying happens per message
+        self._observers: List[Tuple[MessageCallback, ...]] = [
+            () for _ in range(_OBSERVER_SLOTS)
+        ]
+        self._observer_lock = threading.Lock()
         self._connection_observers: List[Callable[[bool], None]] = []
         self._client_address: Optional[Tuple[str, int]] = None
 
@@ -87,6 +124,20 @@ class NetworkManager:
         """Return True if a connection is established."""
         return self._is_connected
 
+    @property
+    def port(self) -> Optional[int]:
+        """
+        Return the local port of the hosting socket, or None if not hosting.
+
+        Useful after ``start_host(0)``, where the OS picks a free port.
+        """
+        if not self._is_host or self._socket is None:
+            return None
+        try:
+            return self._socket.getsockname()[1]
+        except OSError:
+            return None
+
     def subscribe(
         self, msg_type: MessageType, callback: MessageCallback
     ) -> None:
@@ -97,9 +148,8 @@ class NetworkManager:
             msg_type: The type of message to subscribe to.
             callback: Function to call when a message of this type arrives.
         """
-        if msg_type not in self._observers:
-            self._observers[msg_type] = []
-        self._observers[msg_type].append(callback)
+        with self._observer_lock:
+            self._observers[msg_type.value] += (callback,)
 
     def unsubscribe(
         self, msg_type: MessageType, callback: MessageCallback
@@ -111,11 +161,13 @@ class NetworkManager:
             msg_type: The type of message to unsubscribe from.
             callback: The callback function to remove.
         """
-        if msg_type in self._observers:
+        with self._observer_lock:
+            callbacks = list(self._observers[msg_type.value])
             try:
-                self._observers[msg_type].remove(callback)
+                callbacks.remove(callback)
             except ValueError:
-                pass
+                return
+            self._observers[msg_type.value] = tuple(callbacks)
 
     def subscribe_connection(self, callback: Callable[[bool], None]) -> None:
         """
@@ -131,15 +183,47 @@ class NetworkManager:
         """
         Notify all observers subscribed to this message type.
 
+        The callback tuple is replaced rather than mutated on subscribe and
+        unsubscribe, so callbacks may do either while being notified.
+
         Args:
             message: The message that was received.
         """
-        if message.msg_type in self._observers:
-            for callback in self._observers[message.msg_type]:
-                try:
-                    callback(message)
-                except Exception as e:
-                    logger.error(f"Error in message callback: {e}")
+        for callback in self._observers[message.msg_type.value]:
+            try:
+                callback(message)
+            except Exception as e:
+                logger.error(f"Error in message callback: {e}")
+
+    def _start_dispatcher(self) -> None:
+        """
+        Start the thread that delivers received messages to observers.
+
+        Each session gets its own queue, handed to its dispatcher thread, so
+        a dispatcher that outlives ``close`` never consumes the items of the
+        next session.
+        """
+        self._dispatch_queue = queue.SimpleQueue()
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_loop, args=(self._dispatch_queue,), daemon=True
+        )
+        self._dispatch_thread.start()
+
+    def _dispatch_loop(self, dispatch_queue: "queue.SimpleQueue[DispatchItem]") -> None:
+        """
+        Deliver queued items to observers until a None sentinel arrives.
+
+        Args:
+            dispatch_queue: The queue of the session this dispatcher serves.
+        """
+        while True:
+            item = dispatch_queue.get()
+            if item is None:
+                break
+            if isinstance(item, bool):
+                self._notify_connection_observers(item)
+            else:
+                self._notify_observers(item)
 
     def _notify_connection_observers(self, connected: bool) -> None:
         """
@@ -148,7 +232,7 @@ class NetworkManager:
         Args:
             connected: The new connection status.
         """
-        for callback in self._connection_observers:
+        for callback in tuple(self._connection_observers):
             try:
                 callback(connected)
             except Exception as e:
@@ -165,7 +249,8 @@ class NetworkManager:
             To restrict to localhost only, pass host='127.0.0.1'.
 
         Args:
-            port: The port to listen on.
+            port: The port to listen on, or 0 to let the OS pick a free one
+                (read it back from ``port``).
             host: The host address to bind to (default: all interfaces).
 
         Returns:
@@ -184,6 +269,7 @@ class NetworkManager:
 
             self._is_host = True
             self._running = True
+            self._start_dispatcher()
 
             self._server_thread = threading.Thread(
                 target=self._accept_connections, daemon=True
@@ -202,6 +288,7 @@ class NetworkManager:
         """
         Accept incoming connections in a separate thread.
         """
+        self._accept_ready.set()
         while self._running:
             try:
                 if self._socket is None:
@@ -209,10 +296,12 @@ class NetworkManager:
                 client_socket, address = self._socket.accept()
                 self._client_socket = client_socket
                 self._client_address = address
+                self._open_send_buffer(client_socket)
                 self._is_connected = True
 
                 logger.info(f"Client connected from {address}")
                 self._notify_connection_observers(True)
+                self._client_connected_event.set()
 
                 self._receive_thread = threading.Thread(
                     target=self._receive_loop,
@@ -254,10 +343,12 @@ class NetworkManager:
             self._socket.settimeout(timeout)
             self._socket.connect((ip, port))
             self._socket.settimeout(None)
+            self._open_send_buffer(self._socket)
 
             self._is_host = False
             self._running = True
             self._is_connected = True
+            self._start_dispatcher()
 
             self._receive_thread = threading.Thread(
                 target=self._receive_loop,
@@ -275,29 +366,82 @@ class NetworkManager:
             self._cleanup_sockets()
             return False
 
+    def _open_send_buffer(self, sock: socket.socket) -> None:
+        """
+        Wrap the peer socket in a buffered writer for outgoing messages.
+
+        Nagle's algorithm is disabled so that the flush at the end of each
+        ``send`` goes out immediately.
+
+        Args:
+            sock: The connected peer socket.
+        """
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._send_buffer = sock.makefile("wb", buffering=SEND_BUFFER_SIZE)
+
     def _receive_loop(self, sock: socket.socket) -> None:
         """
         Continuously receive messages from the socket.
 
+        Bytes are read in large chunks into a reusable buffer and every
+        complete frame in it is parsed before the next read, so a burst of
+        small messages costs one ``recv`` instead of two per message.
+
+        A header announcing a body larger than ``MAX_FRAME_SIZE`` ends the
+        connection before any buffer is grown for it.
+
         Args:
             sock: The socket to receive from.
         """
+        header_size = Serializer.HEADER_SIZE
+        dispatch = self._dispatch_queue.put
+        read_frame_header = self._serializer.read_frame_header
+        deserialize = self._serializer.deserialize
+        # Buffered bytes not yet consumed live in _recv_buf[start:end]
+        self._recv_buf = bytearray(RECV_BUFFER_SIZE)
+        start = end = 0
         while self._running and self._is_connected:
             try:
-                # Read message length header
-                header = self._recv_exact(sock, Serializer.HEADER_SIZE)
-                if header is None:
+                view = memoryview(self._recv_buf)
+                needed = header_size
+                while end - start >= header_size:
+                    msg_length, compressed = read_frame_header(
+                        self._recv_buf, start
+                    )
+                    if msg_length > MAX_FRAME_SIZE:
+                        raise ValueError(
+                            f"Peer announced a {msg_length}-byte frame "
+                            f"(limit {MAX_FRAME_SIZE})"
+                        )
+                    frame_end = start + header_size + msg_length
+                    if frame_end > end:
+                        needed = header_size + msg_length
+                        break
+                    message = deserialize(
+                        view[start + header_size:frame_end], compressed
+                    )
+                    dispatch(message)
+                    start = frame_end
+
+                # Move a partial frame to the front, growing the buffer for
+                # messages larger than it and shrinking it back once the
+                # large message has been consumed
+                pending = end - start
+                if needed > len(self._recv_buf) or (
+                    needed <= RECV_BUFFER_SIZE < len(self._recv_buf)
+                ):
+                    resized = bytearray(max(needed, RECV_BUFFER_SIZE))
+                    resized[:pending] = self._recv_buf[start:end]
+                    self._recv_buf = resized
+                    view = memoryview(self._recv_buf)
+                elif start:
+                    view[:pending] = self._recv_buf[start:end]
+                start, end = 0, pending
+
+                count = self._recv_some(sock, view[end:])
+                if not count:
                     break
-
-                msg_length = self._serializer.read_header(header)
-
-                # Read message body
-                data = self._recv_exact(sock, msg_length)
-                if data is None:
-                    break
-
-                message = self._serializer.deserialize(data)
-                self._notify_observers(message)
+                end += count
 
             except (ConnectionResetError, BrokenPipeError):
                 logger.info("Connection lost")
@@ -306,37 +450,40 @@ class NetworkManager:
                 logger.error(f"Error receiving message: {e}")
                 break
 
+        self._recv_buf = bytearray(RECV_BUFFER_SIZE)
         self._handle_disconnect()
 
-    def _recv_exact(self, sock: socket.socket, num_bytes: int) -> Optional[bytes]:
+    def _recv_some(self, sock: socket.socket, view: memoryview) -> int:
         """
-        Receive exactly num_bytes from the socket.
+        Receive as many bytes as are available into a buffer view.
 
         Args:
             sock: The socket to receive from.
-            num_bytes: The exact number of bytes to receive.
+            view: Writable view to receive into.
 
         Returns:
-            The received bytes, or None if connection was closed.
+            The number of bytes received, or 0 if the connection was closed
+            or the manager was stopped.
         """
-        data = b""
-        while len(data) < num_bytes:
+        while self._running:
             try:
-                chunk = sock.recv(num_bytes - len(data))
-                if not chunk:
-                    return None
-                data += chunk
+                return sock.recv_into(view)
             except socket.timeout:
                 continue
             except OSError:
-                return None
-        return data
+                return 0
+        return 0
 
     def _handle_disconnect(self) -> None:
-        """Handle disconnection cleanup."""
+        """
+        Handle disconnection cleanup.
+
+        Observers are notified from the dispatcher, after any messages still
+        waiting in the queue.
+        """
         if self._is_connected:
             self._is_connected = False
-            self._notify_connection_observers(False)
+            self._dispatch_queue.put(False)
             logger.info("Disconnected")
 
     def send(self, message: Message) -> bool:
@@ -354,18 +501,23 @@ class NetworkManager:
             return False
 
         try:
-            data = self._serializer.serialize(message)
-            target_socket = (
-                self._client_socket if self._is_host else self._socket
-            )
+            length_prefix, json_data = self._serializer.serialize_parts(message)
 
-            if target_socket is None:
-                return False
+            with self._send_lock:
+                if self._send_buffer is None:
+                    return False
 
-            target_socket.sendall(data)
+                # The buffer gathers both parts into one socket write
+                self._send_buffer.write(length_prefix)
+                self._send_buffer.write(json_data)
+                self._send_buffer.flush()
             return True
 
-        except (BrokenPipeError, ConnectionResetError, OSError) as e:
+        except TypeError as e:
+            # The payload could not be encoded; the connection is still fine
+            logger.error(f"Failed to encode message: {e}")
+            return False
+        except (BrokenPipeError, ConnectionResetError, OSError, ValueError) as e:
             logger.error(f"Failed to send message: {e}")
             self._handle_disconnect()
             return False
@@ -383,10 +535,18 @@ class NetworkManager:
             self._server_thread.join(timeout=2.0)
         if self._receive_thread and self._receive_thread.is_alive():
             self._receive_thread.join(timeout=2.0)
+        if self._dispatch_thread and self._dispatch_thread.is_alive():
+            self._dispatch_queue.put(None)
+            # close() may be called from an observer on the dispatcher itself
+            if self._dispatch_thread is not threading.current_thread():
+                self._dispatch_thread.join(timeout=2.0)
 
         self._server_thread = None
         self._receive_thread = None
-        self._observers.clear()
+        self._dispatch_thread = None
+        self._accept_ready.clear()
+        self._client_connected_event.clear()
+        self._observers = [() for _ in range(_OBSERVER_SLOTS)]
         self._connection_observers.clear()
         self._client_address = None
 
@@ -408,17 +568,51 @@ class NetworkManager:
         logger.info("NetworkManager reset for reuse")
 
     def _cleanup_sockets(self) -> None:
-        """Clean up socket resources."""
+        """
+        Clean up socket resources.
+
+        The sockets are shut down before the send lock is taken: a ``send``
+        blocked in a flush to a peer that stopped reading holds the lock,
+        and only the shutdown makes that flush fail and release it.
+        """
         if self._client_socket:
-            try:
-                self._client_socket.close()
-            except OSError:
-                pass
+            self._close_socket(self._client_socket)
             self._client_socket = None
 
         if self._socket:
-            try:
-                self._socket.close()
-            except OSError:
-                pass
+            self._close_socket(self._socket)
             self._socket = None
+
+        with self._send_lock:
+            if self._send_buffer:
+                # Closing the raw stream first makes the buffered writer's
+                # close a no-op, dropping unsent bytes instead of flushing
+                # them to a socket that is already shut down
+                try:
+                    self._send_buffer.raw.close()
+                    self._send_buffer.close()
+                except (OSError, ValueError):
+                    pass
+                self._send_buffer = None
+
+    @staticmethod
+    def _close_socket(sock: socket.socket) -> None:
+        """
+        Shut down and close a socket.
+
+        Closing alone does not wake a thread blocked in ``recv_into`` or
+        ``accept`` on Linux; shutting the socket down first makes those
+        calls return at once, so worker threads exit without waiting out
+        a timeout.
+
+        Args:
+            sock: The socket to close.
+        """
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass  # Not connected, or already shut down by the peer
+        try:
+            sock.close()
+        except OSError:
+            pass
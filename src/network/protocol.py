@@ -6,12 +6,41 @@ Uses dataclasses for type safety and implements a Serializer class to abstract
 the underlying serialization logic.
 """
 
-import json
 import struct
+import zlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+
+# Curve paths are numpy float64 arrays, so entity positions built from them
+# carry numpy scalars; other float-like values fall back to float(). Non-str
+# dict keys are stringified, as the json module did.
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def encode_json(obj: Any) -> bytes:
+    """
+    Encode an object to compact UTF-8 JSON bytes.
+
+    Unlike ``json.dumps``, Enum members are encoded as their values, and
+    NaN and infinite floats are encoded as ``null``.
+    """
+    return orjson.dumps(obj, default=float, option=_ORJSON_OPTIONS)
+
+
+# Length prefix: 4-byte big-endian unsigned int, compiled once
+_HEADER_STRUCT = struct.Struct(">I")
+
+# High bit of the length prefix marks a zlib-compressed body
+_COMPRESSED_FLAG = 0x80000000
+_LENGTH_MASK = 0x7FFFFFFF
+
+# Largest body a peer may announce, and largest decompressed body accepted
+MAX_FRAME_SIZE = 16 * 1024 * 1024
 
 
 class MessageType(Enum):
@@ -28,7 +57,24 @@ class MessageType(Enum):
     ERROR = auto()
 
 
-@dataclass
+# Name lookup used when decoding; plain dict access skips Enum.__getitem__
+_MESSAGE_TYPE_BY_NAME: Dict[str, MessageType] = {
+    msg_type.name: msg_type for msg_type in MessageType
+}
+
+# Encoding table for outgoing messages, avoiding the Enum.name descriptor
+_MESSAGE_TYPE_NAMES: Dict[MessageType, str] = {
+    msg_type: name for name, msg_type in _MESSAGE_TYPE_BY_NAME.items()
+}
+
+# Pre-encoded start of the JSON envelope for each message type
+_ENVELOPE_PREFIXES: Dict[MessageType, bytes] = {
+    msg_type: b'{"msg_type":"' + name.encode("ascii") + b'","payload":'
+    for msg_type, name in _MESSAGE_TYPE_NAMES.items()
+}
+
+
+@dataclass(slots=True)
 class Message:
     """
     Generic message class for network communication.
@@ -38,11 +84,55 @@ class Message:
         payload: The data payload of the message.
         sender_id: Optional identifier of the message sender.
         timestamp: Optional timestamp for the message.
+
+    A sender that already has the payload as JSON can hand it over with
+    ``set_payload_json`` so it is not encoded again.
     """
     msg_type: MessageType
     payload: Dict[str, Any] = field(default_factory=dict)
     sender_id: Optional[str] = None
     timestamp: Optional[float] = None
+    _payload_json: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def set_payload_json(self, payload_json: bytes) -> None:
+        """
+        Supply the payload already encoded as JSON.
+
+        The bytes are used verbatim by ``to_json_bytes``; the caller is
+        responsible for them encoding the same document as ``payload``,
+        including after later changes to ``payload``.
+
+        Args:
+            payload_json: UTF-8 JSON encoding of ``payload``.
+        """
+        self._payload_json = payload_json
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encode the message as UTF-8 JSON without building an envelope dict.
+
+        Produces the same document as encoding ``to_dict()``; only the
+        payload and any non-null optional fields go through the encoder.
+
+        Returns:
+            JSON bytes for the message.
+        """
+        payload = self._payload_json
+        if payload is None:
+            payload = encode_json(self.payload)
+        sender_id = b"null" if self.sender_id is None else encode_json(self.sender_id)
+        timestamp = b"null" if self.timestamp is None else encode_json(self.timestamp)
+        return b"".join((
+            _ENVELOPE_PREFIXES[self.msg_type],
+            payload,
+            b',"sender_id":',
+            sender_id,
+            b',"timestamp":',
+            timestamp,
+            b"}",
+        ))
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -52,7 +142,7 @@ class Message:
             Dictionary containing all message fields.
         """
         return {
-            "msg_type": self.msg_type.name,
+            "msg_type": _MESSAGE_TYPE_NAMES[self.msg_type],
             "payload": self.payload,
             "sender_id": self.sender_id,
             "timestamp": self.timestamp,
@@ -70,11 +160,10 @@ class Message:
             A new Message instance.
 
         Raises:
-            KeyError: If required fields are missing.
-            ValueError: If msg_type is invalid.
+            KeyError: If required fields are missing or msg_type is unknown.
         """
         return cls(
-            msg_type=MessageType[data["msg_type"]],
+            msg_type=_MESSAGE_TYPE_BY_NAME[data["msg_type"]],
             payload=data.get("payload", {}),
             sender_id=data.get("sender_id"),
             timestamp=data.get("timestamp"),
@@ -102,12 +191,13 @@ class BaseSerializer(ABC):
         pass
 
     @abstractmethod
-    def deserialize(self, data: bytes) -> Message:
+    def deserialize(self, data: bytes, compressed: bool = False) -> Message:
         """
         Deserialize bytes to a message.
 
         Args:
             data: The bytes to deserialize.
+            compressed: True if the header flagged the body as compressed.
 
         Returns:
             A Message instance.
@@ -120,10 +210,16 @@ class Serializer(BaseSerializer):
     JSON-based message serializer with length-prefix framing.
 
     Uses a 4-byte big-endian integer prefix to indicate message length,
-    followed by JSON-encoded message data.
+    followed by JSON-encoded message data, encoded with orjson.
+
+    Bodies larger than ``COMPRESSION_THRESHOLD`` bytes are zlib-compressed
+    (level 1) when that makes them smaller; the high bit of the length
+    prefix flags a compressed body, leaving 31 bits for the length.
     """
 
-    HEADER_SIZE = 4  # 4 bytes for message length (big-endian)
+    HEADER_SIZE = _HEADER_STRUCT.size  # 4 bytes for message length (big-endian)
+    COMPRESSION_THRESHOLD = 512
+    COMPRESSION_LEVEL = 1
 
     def serialize(self, message: Message) -> bytes:
         """
@@ -135,31 +231,66 @@ class Serializer(BaseSerializer):
         Returns:
             Byte representation with 4-byte length prefix followed by JSON data.
         """
-        json_data = json.dumps(message.to_dict()).encode("utf-8")
-        length_prefix = struct.pack(">I", len(json_data))
+        length_prefix, json_data = self.serialize_parts(message)
         return length_prefix + json_data
 
-    def deserialize(self, data: bytes) -> Message:
+    def serialize_parts(self, message: Message) -> Tuple[bytes, bytes]:
+        """
+        Serialize a message to its length prefix and JSON data separately.
+
+        Lets callers hand both pieces to a gathering writer without first
+        concatenating them into a new buffer.
+
+        Args:
+            message: The message to serialize.
+
+        Returns:
+            Tuple of the 4-byte length prefix and the (possibly compressed)
+            JSON data.
+        """
+        body = message.to_json_bytes()
+        header = len(body)
+        if header > self.COMPRESSION_THRESHOLD:
+            compressed = zlib.compress(body, self.COMPRESSION_LEVEL)
+            if len(compressed) < header:
+                body = compressed
+                header = len(body) | _COMPRESSED_FLAG
+        return _HEADER_STRUCT.pack(header), body
+
+    def deserialize(self, data: bytes, compressed: bool = False) -> Message:
         """
         Deserialize bytes to a message (expects raw JSON data without prefix).
 
         Args:
-            data: The JSON bytes to deserialize (without length prefix).
+            data: The JSON bytes (or a memoryview over them) to deserialize,
+                without length prefix.
+            compressed: True if the header flagged the body as compressed.
 
         Returns:
             A Message instance.
 
         Raises:
-            json.JSONDecodeError: If data is not valid JSON.
+            orjson.JSONDecodeError: If data is not valid JSON.
             KeyError: If required message fields are missing.
-            ValueError: If message type is invalid.
+            ValueError: If message type is invalid, or a compressed body
+                expands to more than ``MAX_FRAME_SIZE`` bytes.
+            zlib.error: If a compressed body is corrupt.
         """
-        json_data = json.loads(data.decode("utf-8"))
+        if compressed:
+            decompressor = zlib.decompressobj()
+            data = decompressor.decompress(data, MAX_FRAME_SIZE)
+            if decompressor.unconsumed_tail:
+                raise ValueError(
+                    f"Compressed body expands past {MAX_FRAME_SIZE} bytes"
+                )
+        json_data = orjson.loads(data)
         return Message.from_dict(json_data)
 
     def read_header(self, data: bytes) -> int:
         """
-        Read the message length from header bytes.
+        Read the message length from the header of an uncompressed frame.
+
+        Use ``read_frame_header`` for frames that may be compressed.
 
         Args:
             data: 4-byte header data.
@@ -169,5 +300,29 @@ class Serializer(BaseSerializer):
 
         Raises:
             struct.error: If data is not exactly 4 bytes.
+            ValueError: If the header flags the body as compressed.
+        """
+        header = _HEADER_STRUCT.unpack(data)[0]
+        if header & _COMPRESSED_FLAG:
+            raise ValueError("Header flags a compressed body; use read_frame_header")
+        return header
+
+    def read_frame_header(self, data: bytes, offset: int = 0) -> Tuple[int, bool]:
+        """
+        Read the message length and compression flag from header bytes.
+
+        The header is decoded in place, so a receive buffer can be passed
+        whole without slicing out each frame's header.
+
+        Args:
+            data: Buffer containing the 4-byte header.
+            offset: Position of the header within the buffer.
+
+        Returns:
+            Tuple of the body length and whether the body is compressed.
+
+        Raises:
+            struct.error: If fewer than 4 bytes follow the offset.
         """
-        return struct.unpack(">I", data)[0]
+        header = _HEADER_STRUCT.unpack_from(data, offset)[0]
+        return header & _LENGTH_MASK, bool(header & _COMPRESSED_FLAG)
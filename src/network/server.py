@@ -325,6 +325,10 @@ class GameServer:
         if self._game_state is None:
             return
         
+        # Skip building the state dict when there is nobody to send it to
+        if not self.network_manager.is_connected:
+            return
+        
         # Check if game_state has to_dict method
         if hasattr(self._game_state, 'to_dict'):
             state_dict = self._game_state.to_dict()
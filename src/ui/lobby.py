@@ -6,6 +6,7 @@ Shows configurable parameters and ready status for both players.
 """
 
 import logging
+from dataclasses import replace
 from typing import Optional, Tuple, List, Dict, Any
 import pygame
 
@@ -296,16 +297,9 @@ class LobbyScreen:
             field: Field name to set.
             value: Value to set.
         """
-        if field == 'wave_count':
-            self._config.wave_count = value
-        elif field == 'difficulty':
-            self._config.difficulty = value
-        elif field == 'game_speed':
-            self._config.game_speed = value
-        elif field == 'map_size':
-            self._config.map_size = value
-        elif field == 'starting_money':
-            self._config.starting_money = value
+        if field in ('wave_count', 'difficulty', 'game_speed',
+                     'map_size', 'starting_money'):
+            self._config = replace(self._config, **{field: value})
     
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -88,6 +88,22 @@ class MainMenu:
         # Back button for Host/Join panel
         self._back_button = pygame.Rect(center_x - 100, confirm_y + 70, 200, 50)
     
+    def reset(self) -> None:
+        """
+        Restore the menu's interactive state to its initial values.
+        
+        Fonts and layout rects are kept, so the menu can be reused without
+        being rebuilt.
+        """
+        self._visible = True
+        self._selected_option = None
+        self._hovered_button = None
+        self._ip_input = "127.0.0.1"
+        self._port_input = "12345"
+        self._active_input = None
+        self._status_message = ""
+        self._status_color = (255, 255, 255)
+    
     @property
     def visible(self) -> bool:
         """Check if the main menu is visible."""
@@ -1,8 +1,16 @@
-import sys
 import os
+import sys
+import pathlib
 
-# Add src to the path so tests can import from it
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+# Use SDL's no-op drivers so pygame never probes for a display or sound card.
+# This has to happen before anything imports pygame.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Add src to the path once so tests can import from it
+SRC_PATH = str(pathlib.Path(__file__).resolve().parent.parent / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
 import pytest
 
@@ -14,3 +22,34 @@ def pygame_init():
     pygame.init()
     yield
     pygame.quit()
+
+
+@pytest.fixture(scope="session")
+def draw_surface():
+    """Provide one 800x600 draw target for the whole session.
+
+    Tests that draw on it should take ``cleared_surface`` instead.
+    """
+    import pygame
+    return pygame.Surface((800, 600))
+
+
+@pytest.fixture
+def cleared_surface(draw_surface):
+    """Return the shared draw surface, cleared to black."""
+    draw_surface.fill((0, 0, 0))
+    return draw_surface
+
+
+@pytest.fixture(scope="session")
+def black_pixel_count():
+    """Provide a function counting exactly-black pixels of a surface.
+
+    The count goes through a mask, so the pixel data is not copied.
+    """
+    import pygame
+
+    def count(surface):
+        return pygame.mask.from_threshold(surface, (0, 0, 0), (1, 1, 1, 255)).count()
+
+    return count
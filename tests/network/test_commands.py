@@ -4,7 +4,7 @@ Unit tests for Command Pattern implementation.
 Tests command serialization, deserialization, and server/client instantiation.
 """
 
-import time
+import threading
 
 import pytest
 
@@ -20,6 +20,7 @@ from network.commands import (
 from network.server import GameServer
 from network.client import GameClient
 from network.manager import NetworkManager
+from network.protocol import MessageType
 
 
 class TestPlaceTowerCommand:
@@ -407,8 +408,8 @@ class TestGameServer:
         """Test that server can be started."""
         server = GameServer()
         
-        # Use a random high port for testing
-        result = server.start(55558)
+        # Let the OS pick a free port
+        result = server.start(0)
         
         assert result is True
         assert server.is_running is True
@@ -420,8 +421,8 @@ class TestGameServer:
         """Test that starting an already running server returns False."""
         server = GameServer()
         
-        server.start(55559)
-        result = server.start(55559)
+        server.start(0)
+        result = server.start(0)
         
         assert result is False
         
@@ -457,7 +458,7 @@ class TestGameServer:
     def test_stop(self):
         """Test stopping the server."""
         server = GameServer()
-        server.start(55560)
+        server.start(0)
         
         server.stop()
         
@@ -530,10 +531,10 @@ class TestServerClientIntegration:
     def test_client_connects_to_server(self):
         """Test that a client can connect to a server."""
         server = GameServer()
-        port = 55562
         
-        # Start server
-        assert server.start(port) is True
+        # Start server on a port picked by the OS
+        assert server.start(0) is True
+        port = server.network_manager.port
         
         # Create client with separate NetworkManager instance
         # Note: We bypass the singleton pattern here because we need both
@@ -542,14 +543,14 @@ class TestServerClientIntegration:
         NetworkManager._instance = None
         client = GameClient(player_id="player1")
         
-        # Give server time to start
-        time.sleep(0.1)
+        # Wait for the server to start accepting
+        assert server.network_manager._accept_ready.wait(timeout=1.0)
         
         # Connect client
         assert client.connect("127.0.0.1", port) is True
         
-        # Give time for connection to be established
-        time.sleep(0.2)
+        # Wait for the server side of the connection
+        assert server.network_manager._client_connected_event.wait(timeout=1.0)
         
         assert client.is_connected is True
         assert server.network_manager.is_connected is True
@@ -561,10 +562,10 @@ class TestServerClientIntegration:
     def test_client_sends_command_to_server(self):
         """Test that client can send commands to server."""
         server = GameServer()
-        port = 55563
         
-        # Start server
-        assert server.start(port) is True
+        # Start server on a port picked by the OS
+        assert server.start(0) is True
+        port = server.network_manager.port
         
         # Create client with separate NetworkManager instance
         # Note: We bypass the singleton pattern here because we need both
@@ -573,9 +574,16 @@ class TestServerClientIntegration:
         NetworkManager._instance = None
         client = GameClient(player_id="player1")
         
-        time.sleep(0.1)
+        assert server.network_manager._accept_ready.wait(timeout=1.0)
         assert client.connect("127.0.0.1", port) is True
-        time.sleep(0.2)
+        assert server.network_manager._client_connected_event.wait(timeout=1.0)
+        
+        # Observers run in subscription order, so this fires after the
+        # server has queued the command
+        command_received = threading.Event()
+        server.network_manager.subscribe(
+            MessageType.PLAYER_ACTION, lambda msg: command_received.set()
+        )
         
         # Send command
         cmd = PlaceTowerCommand(
@@ -586,8 +594,8 @@ class TestServerClientIntegration:
         )
         assert client.send_command(cmd) is True
         
-        # Give time for message to be received and queued
-        time.sleep(0.2)
+        # Wait for the message to be received and queued
+        assert command_received.wait(timeout=2.0)
         
         # Process commands on server
         success, fail = server.process_commands()
@@ -494,6 +494,7 @@ class TestBroadcastStateUpdate:
         mock_state = Mock()
         mock_state.to_dict = Mock(return_value={'money': 1000, 'lives': 10})
         server.set_game_state(mock_state)
+        server.network_manager._is_connected = True
         
         with patch.object(server.network_manager, 'send') as mock_send:
             server._broadcast_state_update()
@@ -503,6 +504,18 @@ class TestBroadcastStateUpdate:
             assert call_args.msg_type == MessageType.GAME_STATE
             assert call_args.payload == {'money': 1000, 'lives': 10}
     
+    def test_broadcast_when_not_connected(self):
+        """Test broadcast skips serializing state when nobody is connected."""
+        server = GameServer()
+        mock_state = Mock()
+        server.set_game_state(mock_state)
+        
+        with patch.object(server.network_manager, 'send') as mock_send:
+            server._broadcast_state_update()
+            
+            mock_send.assert_not_called()
+            mock_state.to_dict.assert_not_called()
+    
     def test_broadcast_without_game_state(self):
         """Test broadcast without game state does nothing."""
         server = GameServer()
@@ -5,13 +5,8 @@ Tests cover sprite loading, caching, and placeholder generation.
 """
 
 import pytest
-import sys
-import os
 import pygame
 
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
-
 from graphics.assets import AssetManager
 from entities.tower import TowerType
 from entities.enemy import EnemyType
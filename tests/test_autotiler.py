@@ -5,11 +5,6 @@ Tests cover PathTileSelector and path tile selection logic.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 
 from graphics.autotiler import PathDirection, PathTileType, PathTileSelector
 
@@ -6,11 +6,6 @@ money rewards, and base damage mechanics.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 
 from core.combat_manager import CombatManager, ENEMY_REWARDS
 from core.game_state import GameState
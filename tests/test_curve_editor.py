@@ -6,11 +6,6 @@ and different interpolation methods.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
 from core.curve_state import CurveState
 
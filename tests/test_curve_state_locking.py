@@ -6,11 +6,6 @@ and minimum point enforcement.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
 from core.curve_state import CurveState, CurveLockedError
 
@@ -133,6 +128,15 @@ class TestCurveStateLocking:
         
         assert "locked" in str(exc_info.value).lower()
 
+    def test_set_points_raises_when_locked(self):
+        """Test that set_points raises CurveLockedError when locked."""
+        state = CurveState()
+        state.initialize_default_points()
+        state.lock()
+
+        with pytest.raises(CurveLockedError):
+            state.set_points([(0.0, 1.0), (5.0, 2.0)])
+
     def test_set_method_allowed_when_locked(self):
         """Test that set_method works even when locked."""
         state = CurveState()
@@ -198,6 +202,50 @@ class TestCurveStateMinimumPoints:
         assert state.get_point_count() == 2
 
 
+class TestCurveStateVersion:
+    """Tests for the CurveState modification counter."""
+
+    def test_version_bumps_on_each_change(self):
+        """Test that every successful edit advances the version."""
+        state = CurveState()
+        state.initialize_default_points()
+        versions = [state.version]
+
+        state.add_point(5.0, 3.0)
+        versions.append(state.version)
+        state.move_point(1, 6.0, 4.0)
+        versions.append(state.version)
+        state.remove_point(1)
+        versions.append(state.version)
+        state.set_method('spline')
+        versions.append(state.version)
+
+        assert versions == sorted(set(versions))
+
+    def test_version_unchanged_by_rejected_edits(self):
+        """Test that no-op or rejected edits keep the version."""
+        state = CurveState()
+        state.initialize_default_points()
+        version = state.version
+
+        state.add_point(0.0, 5.0)  # duplicate X
+        state.remove_point(0)  # only two points
+        state.set_method('linear')  # already the method
+        state.set_method('bogus')
+
+        assert state.version == version
+
+    def test_set_points_keeps_close_points_and_sorts(self):
+        """Test that set_points applies points without the duplicate-X check."""
+        state = CurveState()
+        version = state.version
+
+        state.set_points([(19.0, 10.0), (5.01, 2.0), (5.0, 1.0), (0.0, 10.0)])
+
+        assert state.control_points == [(0.0, 10.0), (5.0, 1.0), (5.01, 2.0), (19.0, 10.0)]
+        assert state.version > version
+
+
 class TestCurveLockedError:
     """Tests for CurveLockedError exception."""
 
@@ -5,11 +5,6 @@ Tests cover movement math, damage calculations, cooldowns, and factory methods.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 
 from entities.base import Entity, EntityType, EntityState, Vector2
 from entities.enemy import Enemy, EnemyType
@@ -3,11 +3,6 @@ Unit tests for Grid and GameState modules.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path so we can import the modules
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
 from core.grid import Grid
 from core.game_state import (
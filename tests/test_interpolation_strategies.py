@@ -6,11 +6,6 @@ including individual strategies, registry functionality, and edge cases.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
 from math_engine.strategies import LinearInterpolation, LagrangeInterpolation, SplineInterpolation
 from math_engine.interpolation_registry import InterpolationRegistry, get_registry
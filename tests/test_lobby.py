@@ -2,13 +2,9 @@
 Unit tests for LobbyScreen UI.
 """
 
-import sys
-import os
 import pytest
 import pygame
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
-
 from ui.lobby import LobbyScreen
 from core.match_config import MatchConfig, Difficulty, GameSpeed, MapSize
 
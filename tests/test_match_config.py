@@ -2,11 +2,9 @@
 Unit tests for MatchConfig and related enums.
 """
 
-import sys
-import os
-import pytest
+from dataclasses import FrozenInstanceError, replace
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+import pytest
 
 from core.match_config import MatchConfig, Difficulty, GameSpeed, MapSize
 
@@ -111,15 +109,15 @@ class TestMatchConfig:
     
     def test_validate_valid_config(self):
         """Test that valid configurations pass validation."""
+        config = MatchConfig(starting_money=500)
         for wave_count in (3, 5, 7, 10):
-            config = MatchConfig(wave_count=wave_count, starting_money=500)
-            assert config.validate() is True
+            assert replace(config, wave_count=wave_count).validate() is True
     
     def test_validate_invalid_wave_count(self):
         """Test that invalid wave counts fail validation."""
+        config = MatchConfig()
         for wave_count in (1, 2, 4, 6, 8, 9, 11, 15):
-            config = MatchConfig(wave_count=wave_count)
-            assert config.validate() is False
+            assert replace(config, wave_count=wave_count).validate() is False
     
     def test_validate_invalid_starting_money_too_low(self):
         """Test that starting money below minimum fails validation."""
@@ -139,6 +137,12 @@ class TestMatchConfig:
         config_max = MatchConfig(starting_money=5000)
         assert config_max.validate() is True
     
+    def test_config_is_immutable(self):
+        """Test that MatchConfig fields cannot be reassigned."""
+        config = MatchConfig()
+        with pytest.raises(FrozenInstanceError):
+            config.wave_count = 7
+    
     def test_to_dict(self):
         """Test serialization to dictionary."""
         config = MatchConfig(
@@ -154,7 +158,7 @@ class TestMatchConfig:
         data = config.to_dict()
         
         assert data['wave_count'] == 7
-        assert data['difficulty'] == 'EASY'
+        assert data['difficulty'] == 1 and type(data['difficulty']) is int
         assert data['game_speed'] == 1.5
         assert data['map_size'] == 'SMALL'
         assert data['starting_money'] == 800
@@ -165,7 +169,7 @@ class TestMatchConfig:
         """Test deserialization from dictionary."""
         data = {
             'wave_count': 10,
-            'difficulty': 'HARD',
+            'difficulty': 3,
             'game_speed': 2.0,
             'map_size': 'LARGE',
             'starting_money': 1200,
@@ -193,22 +197,15 @@ class TestMatchConfig:
             starting_money=500,
         )
         
-        data = original.to_dict()
-        restored = MatchConfig.from_dict(data)
+        restored = MatchConfig.from_dict(original.to_dict())
         
-        assert restored.wave_count == original.wave_count
-        assert restored.difficulty == original.difficulty
-        assert restored.game_speed == original.game_speed
-        assert restored.map_size == original.map_size
-        assert restored.starting_money == original.starting_money
-        assert restored.offense_phase_time == original.offense_phase_time
-        assert restored.defense_phase_time == original.defense_phase_time
+        assert restored == original
     
     def test_from_dict_with_missing_phase_times(self):
         """Test deserialization with missing phase time fields uses defaults."""
         data = {
             'wave_count': 5,
-            'difficulty': 'NORMAL',
+            'difficulty': 2,
             'game_speed': 1.0,
             'map_size': 'MEDIUM',
             'starting_money': 500,
@@ -1,11 +1,6 @@
 
 import pytest
 import numpy as np
-import sys
-import os
-
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
 from math_engine.interpolator import Interpolator
 
@@ -30,6 +25,25 @@ class TestInterpolator:
         assert pytest.approx(path[0][0]) == 0
         assert pytest.approx(path[-1][0]) == 10
 
+    def test_lagrange_batch_endpoints(self):
+        # Each row is a flattened set of three control points (x0, y0, x1, y1, x2, y2)
+        control_points = np.array([
+            [0, 0, 5, 5, 10, 10],
+            [0, 0, 5, 10, 10, 0],
+            [0, 5, 4, 0, 12, 8],
+            [2, 2, 6, 9, 15, 3],
+        ], dtype=float).reshape(-1, 3, 2)
+
+        out = np.stack([
+            np.asarray(Interpolator.lagrange_interpolate([tuple(p) for p in batch], num_points=10))
+            for batch in control_points
+        ])
+
+        assert out.shape == (len(control_points), 10, 2)
+        # The polynomial passes through the first and last control points
+        np.testing.assert_allclose(out[:, 0], control_points[:, 0], atol=1e-9)
+        np.testing.assert_allclose(out[:, -1], control_points[:, -1], atol=1e-9)
+
     def test_cubic_spline_basic(self):
         points = [(0, 0), (5, 10), (10, 0)]
         path = Interpolator.cubic_spline_interpolate(points, num_points=20)
@@ -38,6 +52,16 @@ class TestInterpolator:
         assert path[0] == (0, 0)
         assert path[-1] == (10, 0)
         
+    def test_cubic_spline_reuses_cached_result(self):
+        points = [(0, 0), (5, 10), (10, 0)]
+        first = Interpolator.cubic_spline_interpolate(points, num_points=20)
+        hits = Interpolator._cubic_spline_cached.cache_info().hits
+        second = Interpolator.cubic_spline_interpolate(list(points), num_points=20)
+
+        assert Interpolator._cubic_spline_cached.cache_info().hits == hits + 1
+        assert second == first
+        assert second is not first
+
     def test_not_enough_points(self):
         points = [(0,0)]
         assert Interpolator.linear_interpolate(points) == points
@@ -6,11 +6,6 @@ and purchase validation.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 
 from entities.mercenaries import (
     BaseMercenary,
@@ -83,85 +78,37 @@ class TestMercenaryStats:
         assert stats.get_modified_speed(0.5) == 0.5
 
 
-class TestReinforcedStudent:
-    """Tests for the ReinforcedStudent mercenary."""
-
-    def test_creation(self):
-        """Test creating a Reinforced Student."""
-        merc = ReinforcedStudent("player1", "player2")
-        assert merc.owner_player_id == "player1"
-        assert merc.target_player_id == "player2"
-        assert merc.is_alive is True
-
-    def test_stats(self):
-        """Test Reinforced Student stats."""
-        merc = ReinforcedStudent("player1", "player2")
-        assert merc.stats.base_hp == 100
-        assert merc.stats.base_speed == 1.0
-        assert merc.stats.cost == 100
-        assert merc.stats.display_name == "Reinforced Student"
-
-    def test_modifiers(self):
-        """Test Reinforced Student modifiers (+50% HP, normal speed)."""
-        merc = ReinforcedStudent("player1", "player2")
-        assert merc.hp_modifier == 1.5
-        assert merc.speed_modifier == 1.0
-        assert merc.hp == 150  # 100 * 1.5
-        assert merc.speed == 1.0  # 1.0 * 1.0
-
-
-class TestSpeedyVariableX:
-    """Tests for the SpeedyVariableX mercenary."""
-
-    def test_creation(self):
-        """Test creating a Speedy Variable X."""
-        merc = SpeedyVariableX("player1", "player2")
-        assert merc.owner_player_id == "player1"
-        assert merc.target_player_id == "player2"
-        assert merc.is_alive is True
-
-    def test_stats(self):
-        """Test Speedy Variable X stats."""
-        merc = SpeedyVariableX("player1", "player2")
-        assert merc.stats.base_hp == 100
-        assert merc.stats.base_speed == 1.0
-        assert merc.stats.cost == 75
-        assert merc.stats.display_name == "Speedy Variable X"
-
-    def test_modifiers(self):
-        """Test Speedy Variable X modifiers (-30% HP, +100% speed)."""
-        merc = SpeedyVariableX("player1", "player2")
-        assert merc.hp_modifier == 0.7
-        assert merc.speed_modifier == 2.0
-        assert merc.hp == 70  # 100 * 0.7
-        assert merc.speed == 2.0  # 1.0 * 2.0
-
-
-class TestTankConstantPi:
-    """Tests for the TankConstantPi mercenary."""
-
-    def test_creation(self):
-        """Test creating a Tank Constant Pi."""
-        merc = TankConstantPi("player1", "player2")
-        assert merc.owner_player_id == "player1"
-        assert merc.target_player_id == "player2"
-        assert merc.is_alive is True
-
-    def test_stats(self):
-        """Test Tank Constant Pi stats."""
-        merc = TankConstantPi("player1", "player2")
-        assert merc.stats.base_hp == 100
-        assert merc.stats.base_speed == 1.0
-        assert merc.stats.cost == 200
-        assert merc.stats.display_name == "Tank Constant Pi"
-
-    def test_modifiers(self):
-        """Test Tank Constant Pi modifiers (+200% HP, -50% speed)."""
-        merc = TankConstantPi("player1", "player2")
-        assert merc.hp_modifier == 3.0
-        assert merc.speed_modifier == 0.5
-        assert merc.hp == 300  # 100 * 3.0
-        assert merc.speed == 0.5  # 1.0 * 0.5
+# (class, base_hp, base_speed, cost, display_name, hp_mod, speed_mod, hp, speed)
+MERCENARY_VARIANTS = [
+    (ReinforcedStudent, 100, 1.0, 100, "Reinforced Student", 1.5, 1.0, 150, 1.0),
+    (SpeedyVariableX, 100, 1.0, 75, "Speedy Variable X", 0.7, 2.0, 70, 2.0),
+    (TankConstantPi, 100, 1.0, 200, "Tank Constant Pi", 3.0, 0.5, 300, 0.5),
+]
+
+
+class TestMercenaryVariants:
+    """Table-driven tests for the concrete mercenary types."""
+
+    @pytest.mark.parametrize(
+        "merc_class,base_hp,base_speed,cost,display_name,"
+        "hp_modifier,speed_modifier,hp,speed",
+        MERCENARY_VARIANTS,
+        ids=[row[0].__name__ for row in MERCENARY_VARIANTS],
+    )
+    def test_variant(self, merc_class, base_hp, base_speed, cost, display_name,
+                     hp_modifier, speed_modifier, hp, speed):
+        """Test creation, base stats and modifiers of each mercenary type."""
+        merc = merc_class("player1", "player2")
+        assert (merc.owner_player_id, merc.target_player_id, merc.is_alive) == (
+            "player1", "player2", True
+        )
+        assert (
+            merc.stats.base_hp, merc.stats.base_speed,
+            merc.stats.cost, merc.stats.display_name,
+        ) == (base_hp, base_speed, cost, display_name)
+        assert (merc.hp_modifier, merc.speed_modifier, merc.hp, merc.speed) == (
+            hp_modifier, speed_modifier, hp, speed
+        )
 
 
 class TestMercenaryDamage:
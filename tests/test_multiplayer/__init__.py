@@ -1,5 +1 @@
-import sys
-import os
-
-# Add src to the path so tests can import from it
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+# Multiplayer tests
@@ -0,0 +1,30 @@
+"""
+Synchronization helpers for multiplayer integration tests.
+"""
+
+import time
+from typing import Callable
+
+
+def wait_until(predicate: Callable[[], bool], timeout: float = 2.0,
+               interval: float = 0.002) -> bool:
+    """
+    Poll a predicate until it holds or the timeout expires.
+    
+    Returns as soon as the condition is observed, instead of sleeping for
+    a fixed worst-case delay.
+    
+    Args:
+        predicate: Zero-argument callable evaluated on each poll.
+        timeout: Maximum number of seconds to wait.
+        interval: Delay between polls in seconds.
+        
+    Returns:
+        The final result of the predicate.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(interval)
+    return bool(predicate())
@@ -0,0 +1,15 @@
+"""
+Shared fixtures for multiplayer tests.
+"""
+
+import socket
+
+import pytest
+
+
+@pytest.fixture
+def free_port():
+    """Return a loopback port currently free, as assigned by the OS."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
@@ -2,12 +2,7 @@
 Unit tests for DualView.
 """
 
-import sys
-import os
 import pytest
-import pygame
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
 
 from multiplayer.dual_view import DualView
 
@@ -21,32 +16,16 @@ class TestDualView:
         self.screen_height = 720
         self.dual_view = DualView(self.screen_width, self.screen_height)
     
-    def test_viewport_dimensions(self):
-        """Test that viewports have correct dimensions."""
-        local_vp = self.dual_view.local_viewport
-        remote_vp = self.dual_view.remote_viewport
-        
-        # Each viewport should be half the screen width
-        assert local_vp.width == self.screen_width // 2
-        assert remote_vp.width == self.screen_width // 2
-        
-        # Both should be full height
-        assert local_vp.height == self.screen_height
-        assert remote_vp.height == self.screen_height
-    
-    def test_local_viewport_on_left(self):
-        """Test that local viewport is on the left side."""
-        local_vp = self.dual_view.local_viewport
-        
-        assert local_vp.x == 0
-        assert local_vp.y == 0
-    
-    def test_remote_viewport_on_right(self):
-        """Test that remote viewport is on the right side."""
-        remote_vp = self.dual_view.remote_viewport
+    def test_viewport_geometry(self):
+        """Test that the local viewport fills the left half and the remote the right."""
+        lv = self.dual_view.local_viewport
+        rv = self.dual_view.remote_viewport
+        half = self.screen_width // 2
         
-        assert remote_vp.x == self.screen_width // 2
-        assert remote_vp.y == 0
+        assert (lv.x, lv.y, lv.width, lv.height,
+                rv.x, rv.y, rv.width, rv.height) == (
+                0, 0, half, self.screen_height,
+                half, 0, half, self.screen_height)
     
     def test_screen_to_local_grid_conversion(self):
         """Test converting screen coordinates to grid coordinates."""
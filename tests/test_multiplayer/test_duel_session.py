@@ -2,16 +2,13 @@
 Unit tests for DuelSession.
 """
 
-import sys
-import os
 import pytest
 import time
 from unittest.mock import MagicMock, Mock, patch
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
-
 from multiplayer.duel_session import DuelSession, DuelPhase, DuelPlayer
 from multiplayer.player_role import PlayerRole
+from multiplayer.sync_engine import SyncMessage, SyncMessageType
 from network.manager import NetworkManager
 
 
@@ -29,6 +26,13 @@ class TestDuelSession:
             self.session.disconnect()
         NetworkManager.reset_instance()
     
+    @pytest.fixture
+    def host_session(self):
+        """Session that has completed connection bring-up as HOST."""
+        self.session._role = PlayerRole.HOST
+        self.session._on_connection_change(True)
+        return self.session
+    
     def test_initial_state_is_lobby(self):
         """Test that initial phase is LOBBY."""
         assert self.session.phase == DuelPhase.LOBBY
@@ -116,142 +120,132 @@ class TestDuelSession:
         assert self.session.local_player is not None
         assert self.session.remote_player is not None
     
-    def test_set_ready_sends_sync(self):
+    def test_set_ready_sends_sync(self, host_session):
         """Test that set_ready sends sync message."""
-        # Initialize session
-        self.session._role = PlayerRole.HOST
-        self.session._on_connection_change(True)
-        
         # Mock the sync engine's send
-        self.session.sync_engine._send_sync = MagicMock(return_value=True)
+        host_session.sync_engine._send_sync = MagicMock(return_value=True)
         
         # Set ready
-        self.session.set_ready(True)
+        host_session.set_ready(True)
         
-        assert self.session.local_player.ready is True
-        assert self.session.sync_engine._send_sync.called
+        assert host_session.local_player.ready is True
+        assert host_session.sync_engine._send_sync.called
     
-    def test_both_ready_triggers_battle(self):
+    def test_both_ready_triggers_battle(self, host_session):
         """Test that both players ready triggers BATTLE phase."""
-        # Initialize session
-        self.session._role = PlayerRole.HOST
-        self.session._on_connection_change(True)
-        
         # Mock sync engine
-        self.session.sync_engine._send_sync = MagicMock(return_value=True)
+        host_session.sync_engine._send_sync = MagicMock(return_value=True)
         
         # Set both players ready
-        self.session.local_player.ready = True
-        self.session.remote_player.ready = True
+        host_session.local_player.ready = True
+        host_session.remote_player.ready = True
         
         # Trigger ready check
-        self.session.set_ready(True)
+        host_session.set_ready(True)
         
-        assert self.session.phase == DuelPhase.BATTLE
+        assert host_session.phase == DuelPhase.BATTLE
     
-    def test_report_damage_updates_lives(self):
+    def test_report_damage_updates_lives(self, host_session):
         """Test that report_damage is sent via sync."""
-        # Initialize session
-        self.session._role = PlayerRole.HOST
-        self.session._on_connection_change(True)
-        
         # Mock sync engine
-        self.session.sync_engine.sync_game_event = MagicMock(return_value=True)
+        host_session.sync_engine.sync_game_event = MagicMock(return_value=True)
         
         # Report damage
-        self.session.report_damage(2)
+        host_session.report_damage(2)
         
-        self.session.sync_engine.sync_game_event.assert_called_once_with('damage', {'damage': 2})
+        host_session.sync_engine.sync_game_event.assert_called_once_with('damage', {'damage': 2})
     
-    def test_report_damage_syncs_to_opponent(self):
+    def test_report_damage_syncs_to_opponent(self, host_session):
         """Test that damage is synced to opponent."""
-        # Initialize session
-        self.session._role = PlayerRole.HOST
-        self.session._on_connection_change(True)
-        
-        initial_lives = self.session.local_player.lives
+        initial_lives = host_session.local_player.lives
         
         # Simulate receiving damage from opponent
-        from multiplayer.sync_engine import SyncMessage, SyncMessageType
         damage_msg = SyncMessage(
             sync_type=SyncMessageType.GAME_EVENT,
             data={'event_type': 'damage', 'event_data': {'damage': 3}}
         )
         
-        self.session._on_game_event(damage_msg)
+        host_session._on_game_event(damage_msg)
         
-        assert self.session.local_player.lives == initial_lives - 3
+        assert host_session.local_player.lives == initial_lives - 3
     
-    def test_round_completion(self):
+    def test_round_completion(self, host_session):
         """Test round completion handling."""
-        # Initialize session
-        self.session._role = PlayerRole.HOST
-        self.session._on_connection_change(True)
-        self.session._phase = DuelPhase.BATTLE
+        host_session._phase = DuelPhase.BATTLE
         
         # Mock sync
-        self.session.sync_engine.sync_game_event = MagicMock(return_value=True)
+        host_session.sync_engine.sync_game_event = MagicMock(return_value=True)
         
         # Report round complete
-        self.session.report_round_complete()
+        host_session.report_round_complete()
         
-        assert self.session.phase == DuelPhase.PLANNING
-        assert self.session.current_round == 2
+        assert host_session.phase == DuelPhase.PLANNING
+        assert host_session.current_round == 2
     
-    def test_match_end_after_5_rounds(self):
+    def test_match_end_after_5_rounds(self, host_session):
         """Test that match ends after 5 rounds."""
-        # Initialize session
-        self.session._role = PlayerRole.HOST
-        self.session._on_connection_change(True)
-        self.session._current_round = 5
-        self.session._phase = DuelPhase.BATTLE
+        host_session._current_round = 5
+        host_session._phase = DuelPhase.BATTLE
         
         # Complete round 5
-        self.session._handle_round_complete()
+        host_session._handle_round_complete()
         
-        assert self.session.phase == DuelPhase.MATCH_END
+        assert host_session.phase == DuelPhase.MATCH_END
     
-    def test_match_end_when_no_lives(self):
+    def test_match_end_when_no_lives(self, host_session):
         """Test that match ends when local player has no lives."""
-        # Initialize session
-        self.session._role = PlayerRole.HOST
-        self.session._on_connection_change(True)
-        self.session._phase = DuelPhase.BATTLE
+        host_session._phase = DuelPhase.BATTLE
         
         # Lose all lives
-        self.session.local_player.lives = 0
+        host_session.local_player.lives = 0
         
         # Complete round
-        self.session._handle_round_complete()
+        host_session._handle_round_complete()
         
-        assert self.session.phase == DuelPhase.MATCH_END
+        assert host_session.phase == DuelPhase.MATCH_END
     
-    def test_disconnect_cleanup(self):
+    def test_disconnect_cleanup(self, host_session):
         """Test that disconnect properly cleans up."""
-        # Initialize session
-        self.session._role = PlayerRole.HOST
-        self.session._on_connection_change(True)
-        
         # Disconnect
-        self.session.disconnect()
+        host_session.disconnect()
         
-        assert self.session.phase == DuelPhase.DISCONNECTED
-        assert self.session._network_manager.is_connected is False
+        assert host_session.phase == DuelPhase.DISCONNECTED
+        assert host_session._network_manager.is_connected is False
     
-    def test_asymmetric_curves_setup(self):
-        """Test that asymmetric curves are set up correctly."""
-        # Initialize session
-        self.session._role = PlayerRole.HOST
-        self.session._on_connection_change(True)
+    def test_rejected_remote_edit_requests_full_sync(self, host_session):
+        """Test that an incoming edit that cannot be applied asks for a resync."""
+        host_session.sync_engine.request_full_sync = MagicMock(return_value=True)
+        
+        # The incoming curve has only two points, so index 5 is out of range
+        host_session._on_curve_point_move(SyncMessage(
+            sync_type=SyncMessageType.CURVE_POINT_MOVE,
+            data={'index': 5, 'x': 3.0, 'y': 4.0}
+        ))
+        
+        host_session.sync_engine.request_full_sync.assert_called_once_with()
+    
+    def test_applied_remote_edit_does_not_request_full_sync(self, host_session):
+        """Test that edits applying cleanly do not ask for a resync."""
+        host_session.sync_engine.request_full_sync = MagicMock(return_value=True)
+        
+        host_session._on_curve_point_add(SyncMessage(
+            sync_type=SyncMessageType.CURVE_POINT_ADD,
+            data={'x': 3.0, 'y': 4.0}
+        ))
         
+        assert (3.0, 4.0) in host_session.local_incoming_curve.control_points
+        host_session.sync_engine.request_full_sync.assert_not_called()
+    
+    def test_asymmetric_curves_setup(self, host_session):
+        """Test that asymmetric curves are set up correctly."""
         # Verify curves exist and are different objects
-        assert self.session.local_edit_curve is not None
-        assert self.session.local_incoming_curve is not None
-        assert self.session.local_edit_curve is not self.session.local_incoming_curve
+        assert host_session.local_edit_curve is not None
+        assert host_session.local_incoming_curve is not None
+        assert host_session.local_edit_curve is not host_session.local_incoming_curve
         
         # Verify player curve assignments
-        assert self.session.local_player.curve_state is self.session.local_edit_curve
-        assert self.session.remote_player.curve_state is self.session.local_incoming_curve
+        assert host_session.local_player.curve_state is host_session.local_edit_curve
+        assert host_session.remote_player.curve_state is host_session.local_incoming_curve
 
 
 if __name__ == "__main__":
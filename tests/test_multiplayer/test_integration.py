@@ -2,18 +2,32 @@
 Integration tests for multiplayer functionality.
 """
 
-import sys
-import os
 import pytest
-import time
-import threading
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
 
 from multiplayer.duel_session import DuelSession, DuelPhase
 from multiplayer.player_role import PlayerRole
 from network.manager import NetworkManager
 
+from ._sync_helpers import wait_until
+
+
+# Frame time the sessions are ticked with while a test waits
+FRAME_DT = 1 / 60
+
+
+def _run_until(host_session, client_session, predicate):
+    """Tick both sessions like the game loop does until the predicate holds."""
+    def ticked():
+        host_session.update(FRAME_DT)
+        client_session.update(FRAME_DT)
+        return predicate()
+    return wait_until(ticked)
+
+
+def _both_in_phase(host_session, client_session, phase):
+    """Build a predicate that holds once both sessions reach the phase."""
+    return lambda: host_session.phase == phase and client_session.phase == phase
+
 
 class TestMultiplayerIntegration:
     """Integration tests for multiplayer components."""
@@ -26,11 +40,11 @@ class TestMultiplayerIntegration:
         """Clean up after tests."""
         NetworkManager.reset_instance()
     
-    def test_host_client_connection_flow(self):
+    def test_host_client_connection_flow(self, free_port):
         """Test that host and client can connect and establish session."""
         # Create host session
         host_session = DuelSession()
-        port = 55560
+        port = free_port
         
         # Start hosting
         assert host_session.host_game(port) is True
@@ -42,19 +56,15 @@ class TestMultiplayerIntegration:
         NetworkManager._instance = None
         client_session = DuelSession()
         
-        # Give server time to start
-        time.sleep(0.1)
-        
-        # Connect client
+        # Connect client (the host socket is already listening)
         assert client_session.join_game("127.0.0.1", port) is True
         assert client_session.role == PlayerRole.CLIENT
         
-        # Wait for connection to be established
-        time.sleep(0.3)
-        
-        # Both should be in PLANNING phase after sync
-        assert host_session.phase == DuelPhase.PLANNING
-        assert client_session.phase == DuelPhase.PLANNING
+        # Both should reach PLANNING phase after sync
+        assert _run_until(
+            host_session, client_session,
+            _both_in_phase(host_session, client_session, DuelPhase.PLANNING)
+        )
         
         # Both should have curves initialized
         assert host_session.local_edit_curve is not None
@@ -66,11 +76,11 @@ class TestMultiplayerIntegration:
         client_session.disconnect()
         host_session.disconnect()
     
-    def test_curve_sync_bidirectional(self):
+    def test_curve_sync_bidirectional(self, free_port):
         """Test that curve changes sync between players."""
         # Create host and client sessions
         host_session = DuelSession()
-        port = 55561
+        port = free_port
         
         host_session.host_game(port)
         
@@ -78,34 +88,68 @@ class TestMultiplayerIntegration:
         NetworkManager._instance = None
         client_session = DuelSession()
         
-        time.sleep(0.1)
         client_session.join_game("127.0.0.1", port)
-        time.sleep(0.3)
+        assert _run_until(
+            host_session, client_session,
+            _both_in_phase(host_session, client_session, DuelPhase.PLANNING)
+        )
         
         # Host adds a point to their curve (which becomes client's incoming)
         initial_host_points = len(host_session.local_edit_curve.control_points)
         host_session.local_edit_curve.add_point(5.0, 8.0)
         host_session.sync_engine.sync_point_added(5.0, 8.0)
         
-        # Wait for sync
-        time.sleep(0.2)
+        # Client's incoming curve should receive the new point
+        assert _run_until(
+            host_session, client_session,
+            lambda: len(client_session.local_incoming_curve.control_points) > initial_host_points
+        )
+        assert (5.0, 8.0) in client_session.local_incoming_curve.control_points
         
-        # Client's incoming curve should have the new point
-        # Note: This test might be flaky due to timing, but demonstrates the concept
-        client_incoming_points = client_session.local_incoming_curve.control_points
+        # Cleanup
+        client_session.disconnect()
+        host_session.disconnect()
+    
+    def test_full_sync_keeps_points_closer_after_rounding(self, free_port):
+        """Test that a full sync applies points that rounding moved together."""
+        host_session = DuelSession()
+        port = free_port
         
-        # At minimum, should have the initial 2 points
-        assert len(client_incoming_points) >= 2
+        host_session.host_game(port)
+        
+        # Bypass singleton for testing - we need separate instances
+        NetworkManager._instance = None
+        client_session = DuelSession()
+        
+        client_session.join_game("127.0.0.1", port)
+        assert _run_until(
+            host_session, client_session,
+            _both_in_phase(host_session, client_session, DuelPhase.PLANNING)
+        )
+        
+        # Both points pass the host's duplicate-X check, but 5.0104 arrives
+        # as 5.01, within 0.01 of 5.0
+        host_curve = host_session.local_edit_curve
+        assert host_curve.add_point(5.0, 8.0) is True
+        assert host_curve.add_point(5.0104, 9.0) is True
+        assert host_session.sync_engine.sync_full_curve(host_curve) is True
+        
+        assert _run_until(
+            host_session, client_session,
+            lambda: len(client_session.local_incoming_curve.control_points) == 4
+        )
+        received_x = [x for x, _ in client_session.local_incoming_curve.control_points]
+        assert received_x == [0.0, 5.0, 5.01, 19.0]
         
         # Cleanup
         client_session.disconnect()
         host_session.disconnect()
     
-    def test_ready_sync_starts_battle(self):
+    def test_ready_sync_starts_battle(self, free_port):
         """Test that both players being ready transitions to BATTLE."""
         # Create host and client sessions
         host_session = DuelSession()
-        port = 55562
+        port = free_port
         
         host_session.host_game(port)
         
@@ -113,35 +157,37 @@ class TestMultiplayerIntegration:
         NetworkManager._instance = None
         client_session = DuelSession()
         
-        time.sleep(0.1)
         client_session.join_game("127.0.0.1", port)
-        time.sleep(0.3)
-        
-        # Both should be in PLANNING
-        assert host_session.phase == DuelPhase.PLANNING
-        assert client_session.phase == DuelPhase.PLANNING
+        assert _run_until(
+            host_session, client_session,
+            _both_in_phase(host_session, client_session, DuelPhase.PLANNING)
+        )
         
-        # Host sets ready
+        # Host sets ready and the client observes it
         host_session.set_ready(True)
-        time.sleep(0.1)
+        assert _run_until(
+            host_session, client_session,
+            lambda: client_session.remote_player.ready
+        )
         
         # Client sets ready
         client_session.set_ready(True)
-        time.sleep(0.2)
         
         # Both should now be in BATTLE phase
-        assert host_session.phase == DuelPhase.BATTLE
-        assert client_session.phase == DuelPhase.BATTLE
+        assert _run_until(
+            host_session, client_session,
+            _both_in_phase(host_session, client_session, DuelPhase.BATTLE)
+        )
         
         # Cleanup
         client_session.disconnect()
         host_session.disconnect()
     
-    def test_damage_reflects_on_remote(self):
+    def test_damage_reflects_on_remote(self, free_port):
         """Test that damage is synced to the remote player."""
         # Create host and client sessions
         host_session = DuelSession()
-        port = 55563
+        port = free_port
         
         host_session.host_game(port)
         
@@ -149,20 +195,23 @@ class TestMultiplayerIntegration:
         NetworkManager._instance = None
         client_session = DuelSession()
         
-        time.sleep(0.1)
         client_session.join_game("127.0.0.1", port)
-        time.sleep(0.3)
+        assert _run_until(
+            host_session, client_session,
+            _both_in_phase(host_session, client_session, DuelPhase.PLANNING)
+        )
         
         # Record initial lives
         initial_client_lives = client_session.local_player.lives
         
         # Host reports damage (which should apply to client's local player)
         host_session.report_damage(2)
-        time.sleep(0.2)
         
-        # Client's lives should be reduced
-        # Note: Due to the asymmetric model, report_damage sends to opponent
-        # So we need to check that the sync happened
+        # Client's lives should be reduced once the event arrives
+        assert _run_until(
+            host_session, client_session,
+            lambda: client_session.local_player.lives == initial_client_lives - 2
+        )
         
         # Cleanup
         client_session.disconnect()
@@ -2,24 +2,40 @@
 Unit tests for MainMenu UI.
 """
 
-import sys
-import os
 import pytest
 import pygame
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
-
 from ui.main_menu import MainMenu
 
 
+def _keystrokes(text):
+    """Build one KEYDOWN event per character of text."""
+    return [pygame.event.Event(pygame.KEYDOWN, {'key': 0, 'unicode': char}) for char in text]
+
+
+def _handle_all(menu, events):
+    """Feed events to the menu in order, as a frame's event queue would."""
+    handle_event = menu.handle_event
+    for event in events:
+        handle_event(event)
+
+
+@pytest.fixture(scope="module")
+def shared_menu():
+    """Build the MainMenu (fonts and layout) once for the whole module."""
+    return MainMenu(1280, 720)
+
+
 class TestMainMenu:
     """Tests for MainMenu UI."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
+    @pytest.fixture(autouse=True)
+    def _menu(self, shared_menu):
+        """Reset the shared menu's state before each test."""
+        shared_menu.reset()
         self.screen_width = 1280
         self.screen_height = 720
-        self.menu = MainMenu(self.screen_width, self.screen_height)
+        self.menu = shared_menu
     
     def test_initial_state(self):
         """Test initial state of MainMenu."""
@@ -73,9 +89,7 @@ class TestMainMenu:
         self.menu._ip_input = ""
         
         # Type valid IP characters
-        for char in "192.168.1.1":
-            event = pygame.event.Event(pygame.KEYDOWN, {'key': 0, 'unicode': char})
-            self.menu.handle_event(event)
+        _handle_all(self.menu, _keystrokes("192.168.1.1"))
         
         assert self.menu._ip_input == "192.168.1.1"
     
@@ -86,10 +100,7 @@ class TestMainMenu:
         self.menu._ip_input = ""
         
         # Try to type invalid characters
-        invalid_chars = "abcXYZ!@#"
-        for char in invalid_chars:
-            event = pygame.event.Event(pygame.KEYDOWN, {'key': 0, 'unicode': char})
-            self.menu.handle_event(event)
+        _handle_all(self.menu, _keystrokes("abcXYZ!@#"))
         
         # IP should still be empty
         assert self.menu._ip_input == ""
@@ -101,9 +112,7 @@ class TestMainMenu:
         self.menu._port_input = ""
         
         # Type digits
-        for char in "54321":
-            event = pygame.event.Event(pygame.KEYDOWN, {'key': 0, 'unicode': char})
-            self.menu.handle_event(event)
+        _handle_all(self.menu, _keystrokes("54321"))
         
         assert self.menu._port_input == "54321"
     
@@ -114,9 +123,7 @@ class TestMainMenu:
         self.menu._port_input = ""
         
         # Try to type letters
-        for char in "abc":
-            event = pygame.event.Event(pygame.KEYDOWN, {'key': 0, 'unicode': char})
-            self.menu.handle_event(event)
+        _handle_all(self.menu, _keystrokes("abc"))
         
         # Port should still be empty
         assert self.menu._port_input == ""
@@ -225,6 +232,22 @@ class TestMainMenu:
         """Test that the Codex button exists in the main menu."""
         assert 'codex' in self.menu._buttons
     
+    def test_reset_restores_initial_state(self):
+        """Test that reset clears selection, inputs and status."""
+        self.menu._selected_option = 'join'
+        self.menu._active_input = 'ip'
+        self.menu._ip_input = "10.0.0.1"
+        self.menu.set_status("Connection failed", is_error=True)
+        self.menu.hide()
+        
+        self.menu.reset()
+        
+        assert self.menu.visible is True
+        assert self.menu._selected_option is None
+        assert self.menu._active_input is None
+        assert self.menu._ip_input == "127.0.0.1"
+        assert self.menu._status_message == ""
+    
     def test_codex_button_opens_panel(self):
         """Test that clicking Codex button returns 'codex' action."""
         codex_button = self.menu._buttons['codex']
@@ -232,6 +255,15 @@ class TestMainMenu:
         event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {'button': 1, 'pos': center})
         result = self.menu.handle_event(event)
         assert result == 'codex'
+    
+    def test_connection_panel_fits_on_screen(self):
+        """Test that the host/join panel's inputs and buttons lie within the screen."""
+        screen_rect = pygame.Rect(0, 0, self.screen_width, self.screen_height)
+        
+        for rect in self.menu._input_rects.values():
+            assert screen_rect.contains(rect)
+        assert screen_rect.contains(self.menu._confirm_button)
+        assert screen_rect.contains(self.menu._back_button)
 
 
 if __name__ == "__main__":
@@ -2,12 +2,8 @@
 Unit tests for PlayerRole.
 """
 
-import sys
-import os
 import pytest
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
-
 from multiplayer.player_role import PlayerRole
 
 
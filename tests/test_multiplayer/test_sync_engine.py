@@ -2,19 +2,36 @@
 Unit tests for SyncEngine.
 """
 
-import sys
-import os
-import pytest
-from unittest.mock import MagicMock, Mock
+import json
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+import pytest
 
-from multiplayer.sync_engine import SyncEngine, SyncMessage, SyncMessageType
-from network.manager import NetworkManager
+from multiplayer.sync_engine import COORD_SCALE, SyncEngine, SyncMessage, SyncMessageType
 from network.protocol import Message, MessageType
 from core.curve_state import CurveState
 
 
+class FakeNetworkManager:
+    """Connected stand-in for NetworkManager that records sent messages."""
+    
+    def __init__(self):
+        self.sent = []
+        self.send_result = True
+        self._is_connected = True
+        self._observers = [[] for _ in range(max(t.value for t in MessageType) + 1)]
+    
+    @property
+    def is_connected(self):
+        return self._is_connected
+    
+    def subscribe(self, msg_type, callback):
+        self._observers[msg_type.value].append(callback)
+    
+    def send(self, message):
+        self.sent.append(message)
+        return self.send_result
+
+
 class TestSyncMessage:
     """Tests for SyncMessage serialization."""
     
@@ -60,6 +77,16 @@ class TestSyncMessage:
         assert reconstructed.sync_type == original.sync_type
         assert reconstructed.data == original.data
         assert reconstructed.sequence == original.sequence
+    
+    def test_to_json_bytes_matches_payload(self):
+        """Test that direct JSON encoding matches the payload dict."""
+        msg = SyncMessage(
+            sync_type=SyncMessageType.TOWER_PLACE,
+            data={'tower_type': 'basic', 'x': 5, 'y': 10},
+            sequence=12
+        )
+        
+        assert json.loads(msg.to_json_bytes()) == msg.to_payload()
 
 
 class TestSyncEngine:
@@ -67,14 +94,9 @@ class TestSyncEngine:
     
     def setup_method(self):
         """Set up test fixtures."""
-        NetworkManager.reset_instance()
-        self.network_manager = NetworkManager()
+        self.network_manager = FakeNetworkManager()
         self.sync_engine = SyncEngine(self.network_manager)
     
-    def teardown_method(self):
-        """Clean up after tests."""
-        NetworkManager.reset_instance()
-    
     def test_sync_engine_initial_state(self):
         """Test SyncEngine initial state."""
         assert self.sync_engine._sequence_number == 0
@@ -84,15 +106,10 @@ class TestSyncEngine:
         """Test that SyncEngine subscribes to NetworkManager."""
         # The subscription happens in __init__, so we can verify by checking
         # that the network manager has observers for GAME_STATE
-        assert MessageType.GAME_STATE in self.network_manager._observers
-        assert len(self.network_manager._observers[MessageType.GAME_STATE]) > 0
+        assert len(self.network_manager._observers[MessageType.GAME_STATE.value]) > 0
     
     def test_sync_full_curve_sends_all_points(self):
         """Test that sync_full_curve sends complete curve state."""
-        # Mock the send method
-        self.network_manager.send = MagicMock(return_value=True)
-        self.network_manager._is_connected = True
-        
         # Create a curve state with points
         curve = CurveState()
         curve.add_point(0.0, 5.0)
@@ -101,87 +118,134 @@ class TestSyncEngine:
         
         # Sync the curve
         result = self.sync_engine.sync_full_curve(curve)
+        self.sync_engine.flush()
         
         assert result is True
-        assert self.network_manager.send.called
+        assert self.network_manager.sent
         
         # Verify the message content
-        call_args = self.network_manager.send.call_args
-        message = call_args[0][0]
+        message = self.network_manager.sent[-1]
         assert message.msg_type == MessageType.GAME_STATE
         assert message.payload['sync_type'] == 'FULL_SYNC'
-        assert message.payload['data']['control_points'] == [(0.0, 5.0), (10.0, 15.0)]
+        assert message.payload['data']['control_points'] == [(0, 5000), (10000, 15000)]
         assert message.payload['data']['interpolation_method'] == 'lagrange'
+        assert message.payload['data']['version'] == curve.version
+    
+    def test_sync_full_curve_skipped_when_unchanged(self):
+        """Test that an unchanged curve is not fully resent."""
+        curve = CurveState()
+        curve.add_point(0.0, 5.0)
+        curve.add_point(10.0, 15.0)
+        
+        assert self.sync_engine.sync_full_curve(curve) is True
+        self.sync_engine.flush()
+        assert self.sync_engine.sync_full_curve(curve) is True
+        self.sync_engine.flush()
+        assert len(self.network_manager.sent) == 1
+        
+        curve.move_point(1, 10.0, 12.0)
+        self.sync_engine.sync_full_curve(curve)
+        self.sync_engine.flush()
+        assert len(self.network_manager.sent) == 2
+        
+        self.sync_engine.sync_full_curve(curve, force=True)
+        self.sync_engine.flush()
+        assert len(self.network_manager.sent) == 3
+    
+    def test_failed_full_sync_is_retried(self):
+        """Test that a full sync only counts as done once it was sent."""
+        curve = CurveState()
+        curve.add_point(0.0, 5.0)
+        
+        self.network_manager.send_result = False
+        assert self.sync_engine.sync_full_curve(curve) is False
+        
+        self.network_manager.send_result = True
+        assert self.sync_engine.sync_full_curve(curve) is True
+        assert len(self.network_manager.sent) == 2
+    
+    def test_full_sync_request_forces_resend(self):
+        """Test that a peer's FULL_SYNC_REQUEST clears the skip cache."""
+        requests = []
+        self.sync_engine.subscribe(SyncMessageType.FULL_SYNC_REQUEST, requests.append)
+        curve = CurveState()
+        curve.add_point(0.0, 5.0)
+        self.sync_engine.sync_full_curve(curve)
+        self.sync_engine.flush()
+        
+        self.sync_engine._on_network_message(Message(
+            msg_type=MessageType.GAME_STATE,
+            payload=SyncMessage(sync_type=SyncMessageType.FULL_SYNC_REQUEST).to_payload()
+        ))
+        self.sync_engine.sync_full_curve(curve)
+        self.sync_engine.flush()
+        
+        assert len(requests) == 1
+        assert len(self.network_manager.sent) == 2
     
     def test_sync_point_added(self):
         """Test syncing point addition."""
-        self.network_manager.send = MagicMock(return_value=True)
-        self.network_manager._is_connected = True
-        
         result = self.sync_engine.sync_point_added(5.0, 10.0)
         
+        self.sync_engine.flush()
+        
         assert result is True
-        message = self.network_manager.send.call_args[0][0]
+        message = self.network_manager.sent[-1]
         assert message.payload['sync_type'] == 'CURVE_POINT_ADD'
-        assert message.payload['data'] == {'x': 5.0, 'y': 10.0}
+        assert message.payload['data'] == {'x': 5000, 'y': 10000}
     
     def test_sync_point_moved(self):
         """Test syncing point movement."""
-        self.network_manager.send = MagicMock(return_value=True)
-        self.network_manager._is_connected = True
-        
         result = self.sync_engine.sync_point_moved(2, 7.5, 12.5)
         
+        self.sync_engine.flush()
+        
         assert result is True
-        message = self.network_manager.send.call_args[0][0]
+        message = self.network_manager.sent[-1]
         assert message.payload['sync_type'] == 'CURVE_POINT_MOVE'
-        assert message.payload['data'] == {'index': 2, 'x': 7.5, 'y': 12.5}
+        assert message.payload['data'] == {'index': 2, 'x': 7500, 'y': 12500}
     
     def test_sync_point_removed(self):
         """Test syncing point removal."""
-        self.network_manager.send = MagicMock(return_value=True)
-        self.network_manager._is_connected = True
-        
         result = self.sync_engine.sync_point_removed(1)
         
+        self.sync_engine.flush()
+        
         assert result is True
-        message = self.network_manager.send.call_args[0][0]
+        message = self.network_manager.sent[-1]
         assert message.payload['sync_type'] == 'CURVE_POINT_REMOVE'
         assert message.payload['data'] == {'index': 1}
     
     def test_sync_method_changed(self):
         """Test syncing interpolation method change."""
-        self.network_manager.send = MagicMock(return_value=True)
-        self.network_manager._is_connected = True
-        
         result = self.sync_engine.sync_method_changed('spline')
         
+        self.sync_engine.flush()
+        
         assert result is True
-        message = self.network_manager.send.call_args[0][0]
+        message = self.network_manager.sent[-1]
         assert message.payload['sync_type'] == 'CURVE_METHOD_CHANGE'
         assert message.payload['data'] == {'method': 'spline'}
     
     def test_sync_tower_placed(self):
         """Test syncing tower placement."""
-        self.network_manager.send = MagicMock(return_value=True)
-        self.network_manager._is_connected = True
-        
         result = self.sync_engine.sync_tower_placed('basic', 5, 10)
         
+        self.sync_engine.flush()
+        
         assert result is True
-        message = self.network_manager.send.call_args[0][0]
+        message = self.network_manager.sent[-1]
         assert message.payload['sync_type'] == 'TOWER_PLACE'
         assert message.payload['data'] == {'tower_type': 'basic', 'x': 5, 'y': 10}
     
     def test_sync_tower_removed(self):
         """Test syncing tower removal."""
-        self.network_manager.send = MagicMock(return_value=True)
-        self.network_manager._is_connected = True
-        
         result = self.sync_engine.sync_tower_removed(5, 10)
         
+        self.sync_engine.flush()
+        
         assert result is True
-        message = self.network_manager.send.call_args[0][0]
+        message = self.network_manager.sent[-1]
         assert message.payload['sync_type'] == 'TOWER_REMOVE'
         assert message.payload['data'] == {'x': 5, 'y': 10}
     
@@ -200,7 +264,7 @@ class TestSyncEngine:
             msg_type=MessageType.GAME_STATE,
             payload={
                 'sync_type': 'CURVE_POINT_ADD',
-                'data': {'x': 3.0, 'y': 7.0},
+                'data': {'x': 3000, 'y': 7000},
                 'sequence': 1
             }
         )
@@ -211,6 +275,26 @@ class TestSyncEngine:
         assert received_messages[0].sync_type == SyncMessageType.CURVE_POINT_ADD
         assert received_messages[0].data == {'x': 3.0, 'y': 7.0}
     
+    def test_observer_can_unsubscribe_during_notify(self):
+        """Test that a callback removing itself does not skip the next one."""
+        calls = []
+        
+        def once(msg):
+            calls.append('once')
+            self.sync_engine.unsubscribe(SyncMessageType.TOWER_PLACE, once)
+        
+        def always(msg):
+            calls.append('always')
+        
+        self.sync_engine.subscribe(SyncMessageType.TOWER_PLACE, once)
+        self.sync_engine.subscribe(SyncMessageType.TOWER_PLACE, always)
+        
+        sync_msg = SyncMessage(sync_type=SyncMessageType.TOWER_PLACE, data={})
+        self.sync_engine._notify_observers(sync_msg)
+        self.sync_engine._notify_observers(sync_msg)
+        
+        assert calls == ['once', 'always', 'always']
+    
     def test_remote_curve_update_applied(self):
         """Test that remote curve updates are properly parsed."""
         received_syncs = []
@@ -226,7 +310,7 @@ class TestSyncEngine:
             payload={
                 'sync_type': 'FULL_SYNC',
                 'data': {
-                    'control_points': [(0, 0), (5, 10), (10, 5)],
+                    'control_points': [(0, 0), (5000, 10000), (10000, 5000)],
                     'interpolation_method': 'spline'
                 },
                 'sequence': 0
@@ -241,19 +325,180 @@ class TestSyncEngine:
     
     def test_sequence_numbers_increment(self):
         """Test that sequence numbers increment correctly."""
-        self.network_manager.send = MagicMock(return_value=True)
-        self.network_manager._is_connected = True
-        
         # Send multiple messages
         self.sync_engine.sync_point_added(1.0, 2.0)
+        self.sync_engine.flush()
         self.sync_engine.sync_point_added(3.0, 4.0)
+        self.sync_engine.flush()
         self.sync_engine.sync_method_changed('linear')
+        self.sync_engine.flush()
         
         # Check that sequence numbers incremented
-        calls = self.network_manager.send.call_args_list
-        assert calls[0][0][0].payload['sequence'] == 0
-        assert calls[1][0][0].payload['sequence'] == 1
-        assert calls[2][0][0].payload['sequence'] == 2
+        sent = self.network_manager.sent
+        assert sent[0].payload['sequence'] == 0
+        assert sent[1].payload['sequence'] == 1
+        assert sent[2].payload['sequence'] == 2
+    
+    def test_batch_flush_combines_messages(self):
+        """Test that queued sync messages are sent as one BATCH message."""
+        self.sync_engine.sync_point_added(1.0, 2.0)
+        self.sync_engine.sync_point_added(3.0, 4.0)
+        self.sync_engine.sync_method_changed('linear')
+        
+        assert self.sync_engine.flush() is True
+        
+        assert len(self.network_manager.sent) == 1
+        message = self.network_manager.sent[-1]
+        assert message.payload['sync_type'] == 'BATCH'
+        batch = message.payload['data']['batch']
+        assert [entry['sync_type'] for entry in batch] == [
+            'CURVE_POINT_ADD', 'CURVE_POINT_ADD', 'CURVE_METHOD_CHANGE'
+        ]
+        assert [entry['sequence'] for entry in batch] == [0, 1, 2]
+    
+    def test_flushed_message_json_matches_payload(self):
+        """Test that the pre-encoded payload JSON agrees with the payload dict."""
+        self.sync_engine.sync_point_added(1.0, 2.0)
+        self.sync_engine.flush()
+        self.sync_engine.sync_point_added(3.0, 4.0)
+        self.sync_engine.sync_method_changed('spline')
+        self.sync_engine.flush()
+        
+        for message in self.network_manager.sent:
+            assert json.loads(message.to_json_bytes()) == message.to_dict()
+    
+    def test_flush_threshold_sends_immediately(self):
+        """Test that reaching the flush threshold sends without waiting."""
+        sync_engine = SyncEngine(self.network_manager, flush_threshold=2, flush_interval=60.0)
+        
+        sync_engine.sync_point_added(1.0, 2.0)
+        assert not self.network_manager.sent
+        
+        sync_engine.sync_point_added(3.0, 4.0)
+        assert len(self.network_manager.sent) == 1
+        assert sync_engine.flush() is True
+        assert len(self.network_manager.sent) == 1
+    
+    def test_update_flushes_after_interval(self):
+        """Test that update() sends pending messages once they are due."""
+        sync_engine = SyncEngine(self.network_manager, flush_interval=0.05)
+        
+        sync_engine.sync_point_added(1.0, 2.0)
+        assert sync_engine.update(0.03) is True
+        assert not self.network_manager.sent
+        
+        assert sync_engine.update(0.03) is True
+        assert len(self.network_manager.sent) == 1
+    
+    def test_failed_flush_is_reported(self):
+        """Test that a failed send surfaces through update() and the threshold."""
+        self.network_manager.send_result = False
+        
+        self.sync_engine.sync_point_added(1.0, 2.0)
+        assert self.sync_engine.update(1.0) is False
+        
+        sync_engine = SyncEngine(self.network_manager, flush_threshold=1)
+        assert sync_engine.sync_point_added(1.0, 2.0) is False
+    
+    def test_sync_when_disconnected_is_dropped(self):
+        """Test that sync calls fail without queueing when not connected."""
+        self.network_manager._is_connected = False
+        
+        assert self.sync_engine.sync_point_added(1.0, 2.0) is False
+        self.sync_engine.flush()
+        
+        assert not self.network_manager.sent
+    
+    def test_batch_message_dispatches_each_entry(self):
+        """Test that a received BATCH message notifies observers per entry."""
+        received = []
+        self.sync_engine.subscribe(SyncMessageType.CURVE_POINT_ADD, received.append)
+        self.sync_engine.subscribe(SyncMessageType.CURVE_METHOD_CHANGE, received.append)
+        
+        network_msg = Message(
+            msg_type=MessageType.GAME_STATE,
+            payload=SyncMessage(
+                sync_type=SyncMessageType.BATCH,
+                data={'batch': [
+                    SyncMessage(SyncMessageType.CURVE_POINT_ADD, {'x': 1000, 'y': 2000}, 0).to_payload(),
+                    SyncMessage(SyncMessageType.CURVE_METHOD_CHANGE, {'method': 'spline'}, 1).to_payload(),
+                ]},
+                sequence=1,
+            ).to_payload()
+        )
+        
+        self.sync_engine._on_network_message(network_msg)
+        
+        assert [msg.sync_type for msg in received] == [
+            SyncMessageType.CURVE_POINT_ADD, SyncMessageType.CURVE_METHOD_CHANGE
+        ]
+        assert received[0].data == {'x': 1.0, 'y': 2.0}
+        assert received[1].data == {'method': 'spline'}
+    
+    def test_malformed_batch_entry_drops_only_itself(self):
+        """Test that one bad BATCH entry does not stop the entries after it."""
+        received = []
+        self.sync_engine.subscribe(SyncMessageType.CURVE_POINT_ADD, received.append)
+        self.sync_engine.subscribe(SyncMessageType.FULL_SYNC, received.append)
+        
+        network_msg = Message(
+            msg_type=MessageType.GAME_STATE,
+            payload=SyncMessage(
+                sync_type=SyncMessageType.BATCH,
+                data={'batch': [
+                    SyncMessage(SyncMessageType.CURVE_POINT_ADD, {'x': None, 'y': 2000}, 0).to_payload(),
+                    SyncMessage(SyncMessageType.FULL_SYNC, {'control_points': [[1000]]}, 1).to_payload(),
+                    SyncMessage(SyncMessageType.CURVE_POINT_ADD, {'x': 3000, 'y': 4000}, 2).to_payload(),
+                ]},
+                sequence=3,
+            ).to_payload()
+        )
+        
+        self.sync_engine._on_network_message(network_msg)
+        
+        assert len(received) == 1
+        assert received[0].data == {'x': 3.0, 'y': 4.0}
+    
+    def test_point_coordinates_roundtrip_through_quantization(self):
+        """Test that sent point coordinates are restored on receipt."""
+        received = []
+        self.sync_engine.subscribe(SyncMessageType.CURVE_POINT_MOVE, received.append)
+        
+        self.sync_engine.sync_point_moved(1, 3.14159, 7.25)
+        self.sync_engine.flush()
+        self.sync_engine._on_network_message(self.network_manager.sent[-1])
+        
+        assert received[0].data['index'] == 1
+        assert received[0].data['x'] == pytest.approx(3.14159, abs=1 / COORD_SCALE)
+        assert received[0].data['y'] == 7.25
+    
+    def test_dispatch_leaves_received_data_intact(self):
+        """Test that restoring coordinates does not rewrite the received dict."""
+        received = []
+        self.sync_engine.subscribe(SyncMessageType.CURVE_POINT_ADD, received.append)
+        data = {'x': 1500, 'y': 2500}
+        
+        self.sync_engine._on_network_message(Message(
+            msg_type=MessageType.GAME_STATE,
+            payload=SyncMessage(SyncMessageType.CURVE_POINT_ADD, data).to_payload()
+        ))
+        
+        assert data == {'x': 1500, 'y': 2500}
+        assert received[0].data == {'x': 1.5, 'y': 2.5}
+    
+    def test_full_sync_roundtrips_through_quantization(self):
+        """Test that full sync control points are sent quantized and restored."""
+        received = []
+        self.sync_engine.subscribe(SyncMessageType.FULL_SYNC, received.append)
+        curve = CurveState()
+        curve.add_point(0.0, 5.0)
+        curve.add_point(10.25, 15.5)
+        
+        self.sync_engine.sync_full_curve(curve)
+        self.sync_engine.flush()
+        self.sync_engine._on_network_message(self.network_manager.sent[-1])
+        
+        assert received[0].data['control_points'] == [(0.0, 5.0), (10.25, 15.5)]
 
 
 if __name__ == "__main__":
@@ -4,22 +4,24 @@ Unit tests for the Network Core System.
 Tests protocol serialization and network manager functionality.
 """
 
+import base64
 import json
 import socket
 import struct
-import sys
 import os
 import threading
 import time
+import zlib
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
-
-from network.protocol import Message, MessageType, Serializer
-from network.manager import NetworkManager
+from network.protocol import MAX_FRAME_SIZE, Message, MessageType, Serializer
+from network.manager import RECV_BUFFER_SIZE, NetworkManager
+from core.curve_state import CurveState
+from core.game_state import GameState
+from entities.base import Vector2
+from entities.enemy import Enemy, EnemyType
 
 
 class TestMessageType:
@@ -126,6 +128,28 @@ class TestMessage:
         assert reconstructed.sender_id == original.sender_id
         assert reconstructed.timestamp == original.timestamp
 
+    def test_to_json_bytes_matches_to_dict(self):
+        """Test that direct JSON encoding matches the dict representation."""
+        msg = Message(
+            msg_type=MessageType.GAME_STATE,
+            payload={"points": [[1, 2], [3, 4]], "name": "caf\u00e9"},
+            sender_id="host",
+            timestamp=1.5,
+        )
+
+        assert json.loads(msg.to_json_bytes()) == msg.to_dict()
+        assert json.loads(Message(msg_type=MessageType.PING).to_json_bytes()) == (
+            Message(msg_type=MessageType.PING).to_dict()
+        )
+
+    def test_set_payload_json_is_used_verbatim(self):
+        """Test that supplied payload JSON is written instead of re-encoding."""
+        msg = Message(msg_type=MessageType.CHAT, payload={"text": "hi"})
+        msg.set_payload_json(b'{"text":"hi"}')
+
+        assert b'"payload":{"text":"hi"}' in msg.to_json_bytes()
+        assert json.loads(msg.to_json_bytes()) == msg.to_dict()
+
 
 class TestSerializer:
     """Tests for Serializer class."""
@@ -145,10 +169,10 @@ class TestSerializer:
         msg = Message(msg_type=MessageType.PING, payload={"test": "data"})
         result = self.serializer.serialize(msg)
 
-        # First 4 bytes should be the length
-        length = struct.unpack(">I", result[:4])[0]
+        # First HEADER_SIZE bytes should be the length
+        length = struct.unpack(">I", result[:Serializer.HEADER_SIZE])[0]
         # Rest should be JSON data
-        json_data = result[4:]
+        json_data = result[Serializer.HEADER_SIZE:]
         assert len(json_data) == length
 
     def test_deserialize_valid_json(self):
@@ -177,6 +201,12 @@ class TestSerializer:
         with pytest.raises(struct.error):
             self.serializer.read_header(b"\x00\x00")
 
+    def test_read_header_rejects_compressed_frame(self):
+        """Test that read_header refuses a header flagging compression."""
+        header = struct.pack(">I", 1000 | 0x80000000)
+        with pytest.raises(ValueError):
+            self.serializer.read_header(header)
+
     def test_serialize_deserialize_roundtrip(self):
         """Test full serialization roundtrip."""
         original = Message(
@@ -187,8 +217,8 @@ class TestSerializer:
         )
         serialized = self.serializer.serialize(original)
 
-        # Skip the 4-byte header
-        json_data = serialized[4:]
+        # Skip the length header
+        json_data = serialized[Serializer.HEADER_SIZE:]
         reconstructed = self.serializer.deserialize(json_data)
 
         assert reconstructed.msg_type == original.msg_type
@@ -196,6 +226,81 @@ class TestSerializer:
         assert reconstructed.sender_id == original.sender_id
         assert reconstructed.timestamp == original.timestamp
 
+    def test_serialize_parts_matches_framed_bytes(self):
+        """Test that the split prefix and JSON data join to the framed bytes."""
+        msg = Message(msg_type=MessageType.CHAT, payload={"text": "hi"})
+
+        length_prefix, json_data = self.serializer.serialize_parts(msg)
+
+        assert len(length_prefix) == Serializer.HEADER_SIZE
+        assert self.serializer.read_header(length_prefix) == len(json_data)
+        assert length_prefix + json_data == self.serializer.serialize(msg)
+
+    def test_large_body_is_compressed(self):
+        """Test that bodies over the threshold are compressed and flagged."""
+        msg = Message(msg_type=MessageType.GAME_STATE, payload={"points": [[1, 2]] * 500})
+
+        length_prefix, body = self.serializer.serialize_parts(msg)
+        length, compressed = self.serializer.read_frame_header(length_prefix)
+
+        assert compressed is True
+        assert length == len(body)
+        assert len(body) < len(msg.to_json_bytes())
+        assert self.serializer.deserialize(body, compressed).payload == msg.payload
+
+    def test_deserialize_rejects_oversized_compressed_body(self):
+        """Test that a compressed body expanding past the limit is refused."""
+        body = zlib.compress(b" " * (MAX_FRAME_SIZE + 1), 9)
+
+        with pytest.raises(ValueError):
+            self.serializer.deserialize(body, compressed=True)
+
+    def test_small_body_is_not_compressed(self):
+        """Test that bodies under the threshold are sent as plain JSON."""
+        msg = Message(msg_type=MessageType.PING, payload={"test": "data"})
+
+        length_prefix, body = self.serializer.serialize_parts(msg)
+
+        assert self.serializer.read_frame_header(length_prefix) == (len(body), False)
+        assert body == msg.to_json_bytes()
+
+    def test_serialize_game_state_with_enemy_on_curve_path(self):
+        """Test that numpy coordinates from a curve path serialize."""
+        curve = CurveState()
+        curve.add_point(0.0, 5.0)
+        curve.add_point(10.0, 15.0)
+        path = curve.get_interpolated_path(10)
+        GameState.reset_instance()
+        state = GameState()
+        state.add_entity('enemies', Enemy(
+            position=Vector2(*path[3]), enemy_type=EnemyType.STUDENT, path=path
+        ))
+
+        msg = Message(msg_type=MessageType.GAME_STATE, payload=state.to_dict())
+        data = self.serializer.serialize(msg)
+        GameState.reset_instance()
+
+        payload = json.loads(data[Serializer.HEADER_SIZE:])["payload"]
+        position = payload["entities"]["enemies"][0]["position"]
+        assert position == {"x": float(path[3][0]), "y": float(path[3][1])}
+
+    def test_serialize_int_keyed_payload(self):
+        """Test that non-str dict keys are encoded as strings."""
+        msg = Message(msg_type=MessageType.GAME_STATE, payload={"scores": {1: 10, 2: 20}})
+
+        data = self.serializer.serialize(msg)
+
+        payload = json.loads(data[Serializer.HEADER_SIZE:])["payload"]
+        assert payload == {"scores": {"1": 10, "2": 20}}
+
+    def test_read_frame_header_at_offset(self):
+        """Test reading a header from the middle of a larger buffer."""
+        buffer = bytearray(b"junk" + struct.pack(">I", 1000) + b"body")
+
+        assert self.serializer.read_frame_header(buffer, 4) == (1000, False)
+        with pytest.raises(struct.error):
+            self.serializer.read_frame_header(buffer, 9)
+
 
 class TestNetworkManagerUnit:
     """Unit tests for NetworkManager with mocked sockets."""
@@ -245,6 +350,26 @@ class TestNetworkManagerUnit:
         assert len(received_messages) == 1
         assert received_messages[0].msg_type == MessageType.PING
 
+    def test_observer_can_unsubscribe_during_notify(self):
+        """Test that a callback removing itself does not skip the next one."""
+        manager = NetworkManager()
+        calls = []
+
+        def once(msg):
+            calls.append("once")
+            manager.unsubscribe(MessageType.PING, once)
+
+        def always(msg):
+            calls.append("always")
+
+        manager.subscribe(MessageType.PING, once)
+        manager.subscribe(MessageType.PING, always)
+
+        manager._notify_observers(Message(msg_type=MessageType.PING))
+        manager._notify_observers(Message(msg_type=MessageType.PING))
+
+        assert calls == ["once", "always", "always"]
+
     def test_unsubscribe(self):
         """Test unsubscribing from message events."""
         manager = NetworkManager()
@@ -276,6 +401,11 @@ class TestNetworkManagerUnit:
 
         assert status_changes == [True, False]
 
+    def test_port_is_none_when_not_hosting(self):
+        """Test that no port is reported before hosting."""
+        manager = NetworkManager()
+        assert manager.port is None
+
     def test_send_when_not_connected(self):
         """Test that send fails when not connected."""
         manager = NetworkManager()
@@ -283,6 +413,17 @@ class TestNetworkManagerUnit:
         result = manager.send(msg)
         assert result is False
 
+    def test_send_unencodable_payload_keeps_connection(self):
+        """Test that a payload that cannot be encoded fails without disconnecting."""
+        manager = NetworkManager()
+        manager._is_connected = True
+        manager._send_buffer = MagicMock()
+
+        msg = Message(msg_type=MessageType.PING, payload={"value": object()})
+        assert manager.send(msg) is False
+        assert manager.is_connected is True
+        manager._send_buffer.write.assert_not_called()
+
     @patch("socket.socket")
     def test_start_host_creates_socket(self, mock_socket_class):
         """Test that start_host creates and configures socket."""
@@ -316,6 +457,8 @@ class TestNetworkManagerUnit:
     def test_connect_to_host_success(self, mock_socket_class):
         """Test successful connection to host."""
         mock_socket = MagicMock()
+        # Idle connection: the receive loop keeps waiting until close()
+        mock_socket.recv_into.side_effect = socket.timeout
         mock_socket_class.return_value = mock_socket
 
         manager = NetworkManager()
@@ -341,6 +484,38 @@ class TestNetworkManagerUnit:
         assert result is False
         assert manager.is_connected is False
 
+    def test_receive_loop_parses_coalesced_frames(self):
+        """Test that several frames delivered in one read are all parsed."""
+        serializer = Serializer()
+        frames = b"".join(
+            serializer.serialize(Message(msg_type=MessageType.PING, payload={"n": i}))
+            for i in range(3)
+        )
+        split = len(frames) - 5
+        chunks = [frames[:split], frames[split:], b""]
+
+        def recv_into(view):
+            chunk = chunks.pop(0)
+            view[:len(chunk)] = chunk
+            return len(chunk)
+
+        mock_socket = MagicMock()
+        mock_socket.recv_into.side_effect = recv_into
+
+        manager = NetworkManager()
+        manager._running = True
+        manager._is_connected = True
+        manager._receive_loop(mock_socket)
+
+        received = []
+        while not manager._dispatch_queue.empty():
+            received.append(manager._dispatch_queue.get())
+        # The disconnect notification is queued behind the messages
+        assert received[-1] is False
+        assert [msg.payload["n"] for msg in received[:-1]] == [0, 1, 2]
+        assert mock_socket.recv_into.call_count == 3
+        assert manager.is_connected is False
+
     def test_close_clears_state(self):
         """Test that close clears all state."""
         manager = NetworkManager()
@@ -350,7 +525,7 @@ class TestNetworkManagerUnit:
         manager.close()
 
         # Internal state should be cleared
-        assert manager._observers == {}
+        assert all(not callbacks for callbacks in manager._observers)
         assert manager._connection_observers == []
 
 
@@ -369,25 +544,26 @@ class TestNetworkManagerIntegration:
         """Test host and client can connect."""
         # Create separate instances by resetting singleton between creations
         host_manager = NetworkManager()
-        port = 55555
 
-        # Start host
-        assert host_manager.start_host(port) is True
+        # Start host on a port picked by the OS
+        assert host_manager.start_host(0) is True
         assert host_manager.is_host is True
+        port = host_manager.port
+        assert port
 
         # Need a fresh instance for client (bypass singleton for testing)
         NetworkManager._instance = None
         client_manager = NetworkManager()
 
-        # Give server time to start
-        time.sleep(0.1)
+        # Wait for the accept thread to start
+        assert host_manager._accept_ready.wait(timeout=1.0)
 
         # Connect client
         assert client_manager.connect_to_host("127.0.0.1", port) is True
         assert client_manager.is_connected is True
 
-        # Give time for host to accept connection
-        time.sleep(0.2)
+        # Wait for the host to accept the connection
+        assert host_manager._client_connected_event.wait(timeout=1.0)
         assert host_manager.is_connected is True
 
         # Cleanup
@@ -406,19 +582,18 @@ class TestNetworkManagerIntegration:
         # Create host
         host_manager = NetworkManager()
         host_manager.subscribe(MessageType.PING, on_message)
-        port = 55556
-
-        assert host_manager.start_host(port) is True
+        assert host_manager.start_host(0) is True
+        port = host_manager.port
 
         # Create client (bypass singleton)
         NetworkManager._instance = None
         client_manager = NetworkManager()
 
-        time.sleep(0.1)
+        assert host_manager._accept_ready.wait(timeout=1.0)
         assert client_manager.connect_to_host("127.0.0.1", port) is True
 
         # Wait for connection to be established
-        time.sleep(0.2)
+        assert host_manager._client_connected_event.wait(timeout=1.0)
 
         # Send message from client to host
         msg = Message(
@@ -458,18 +633,17 @@ class TestNetworkManagerIntegration:
         # Create host
         host_manager = NetworkManager()
         host_manager.subscribe(MessageType.CHAT, on_host_message)
-        port = 55557
-
-        assert host_manager.start_host(port) is True
+        assert host_manager.start_host(0) is True
+        port = host_manager.port
 
         # Create client (bypass singleton)
         NetworkManager._instance = None
         client_manager = NetworkManager()
         client_manager.subscribe(MessageType.CHAT, on_client_message)
 
-        time.sleep(0.1)
+        assert host_manager._accept_ready.wait(timeout=1.0)
         assert client_manager.connect_to_host("127.0.0.1", port) is True
-        time.sleep(0.2)
+        assert host_manager._client_connected_event.wait(timeout=1.0)
 
         # Client sends to host
         client_msg = Message(msg_type=MessageType.CHAT, payload={"text": "Hello host!"})
@@ -491,6 +665,194 @@ class TestNetworkManagerIntegration:
         client_manager.close()
         host_manager.close()
 
+    def test_close_does_not_wait_for_blocked_send(self):
+        """Test that close() returns while a send is blocked on a full socket."""
+        # A bare listener that accepts but never reads, so the client's
+        # socket buffers fill up and send() blocks in its flush
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        port = listener.getsockname()[1]
+
+        client_manager = NetworkManager()
+        assert client_manager.connect_to_host("127.0.0.1", port) is True
+        peer, _ = listener.accept()
+
+        blob = base64.b64encode(os.urandom(1 << 20)).decode()
+        msg = Message(msg_type=MessageType.GAME_STATE, payload={"blob": blob})
+
+        def send_until_failure():
+            while client_manager.send(msg):
+                pass
+
+        sender = threading.Thread(target=send_until_failure, daemon=True)
+        sender.start()
+        sender.join(timeout=0.5)
+        assert sender.is_alive()
+
+        closer = threading.Thread(target=client_manager.close, daemon=True)
+        closer.start()
+        closer.join(timeout=2.0)
+        assert not closer.is_alive()
+        sender.join(timeout=2.0)
+        assert not sender.is_alive()
+
+        peer.close()
+        listener.close()
+
+    def test_receive_message_larger_than_buffer(self):
+        """Test that messages larger than the receive buffer arrive intact."""
+        host_received = []
+        host_event = threading.Event()
+
+        def on_host_message(msg):
+            host_received.append(msg)
+            host_event.set()
+
+        host_manager = NetworkManager()
+        host_manager.subscribe(MessageType.GAME_STATE, on_host_message)
+        assert host_manager.start_host(0) is True
+        port = host_manager.port
+
+        NetworkManager._instance = None
+        client_manager = NetworkManager()
+
+        assert host_manager._accept_ready.wait(timeout=1.0)
+        assert client_manager.connect_to_host("127.0.0.1", port) is True
+        assert host_manager._client_connected_event.wait(timeout=1.0)
+
+        # Random data so the body stays larger than the buffer once compressed
+        blob = base64.b64encode(os.urandom(len(host_manager._recv_buf) * 2)).decode()
+        msg = Message(msg_type=MessageType.GAME_STATE, payload={"blob": blob})
+        assert client_manager.send(msg) is True
+
+        host_event.wait(timeout=2.0)
+        assert len(host_received) == 1
+        assert host_received[0].payload["blob"] == blob
+
+        client_manager.close()
+        host_manager.close()
+
+    def test_oversized_frame_header_disconnects(self):
+        """Test that a header announcing a huge body drops the peer unbuffered."""
+        disconnected = threading.Event()
+
+        host_manager = NetworkManager()
+        host_manager.subscribe_connection(
+            lambda connected: None if connected else disconnected.set()
+        )
+        assert host_manager.start_host(0) is True
+        assert host_manager._accept_ready.wait(timeout=1.0)
+
+        peer = socket.create_connection(("127.0.0.1", host_manager.port))
+        assert host_manager._client_connected_event.wait(timeout=1.0)
+        peer.sendall(struct.pack(">I", MAX_FRAME_SIZE + 1))
+
+        assert disconnected.wait(timeout=2.0)
+        assert len(host_manager._recv_buf) == RECV_BUFFER_SIZE
+
+        peer.close()
+        host_manager.close()
+
+    def test_receive_buffer_shrinks_after_large_message(self):
+        """Test that the buffer grown for a large message is shrunk again."""
+        received = []
+        small_received = threading.Event()
+
+        def on_host_message(msg):
+            received.append(msg)
+            if msg.msg_type == MessageType.CHAT:
+                small_received.set()
+
+        host_manager = NetworkManager()
+        host_manager.subscribe(MessageType.GAME_STATE, on_host_message)
+        host_manager.subscribe(MessageType.CHAT, on_host_message)
+        assert host_manager.start_host(0) is True
+        port = host_manager.port
+
+        NetworkManager._instance = None
+        client_manager = NetworkManager()
+
+        assert host_manager._accept_ready.wait(timeout=1.0)
+        assert client_manager.connect_to_host("127.0.0.1", port) is True
+        assert host_manager._client_connected_event.wait(timeout=1.0)
+
+        blob = base64.b64encode(os.urandom(RECV_BUFFER_SIZE * 2)).decode()
+        large = Message(msg_type=MessageType.GAME_STATE, payload={"blob": blob})
+        assert client_manager.send(large) is True
+        assert client_manager.send(Message(msg_type=MessageType.CHAT)) is True
+
+        assert small_received.wait(timeout=2.0)
+        assert len(received) == 2
+        # The receive loop resizes after handing the frames to the dispatcher
+        deadline = time.monotonic() + 2.0
+        while (
+            len(host_manager._recv_buf) != RECV_BUFFER_SIZE
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+        assert len(host_manager._recv_buf) == RECV_BUFFER_SIZE
+
+        client_manager.close()
+        host_manager.close()
+
+    def test_slow_callback_does_not_block_receive(self):
+        """Test that frames keep arriving while a callback is blocked."""
+        release = threading.Event()
+        first_entered = threading.Event()
+        callback_threads = []
+        both_received = threading.Event()
+
+        def on_host_message(msg):
+            callback_threads.append(threading.current_thread())
+            first_entered.set()
+            release.wait(timeout=2.0)
+            if len(callback_threads) == 2:
+                both_received.set()
+
+        host_manager = NetworkManager()
+        host_manager.subscribe(MessageType.CHAT, on_host_message)
+        assert host_manager.start_host(0) is True
+        port = host_manager.port
+
+        NetworkManager._instance = None
+        client_manager = NetworkManager()
+
+        assert host_manager._accept_ready.wait(timeout=1.0)
+        assert client_manager.connect_to_host("127.0.0.1", port) is True
+        assert host_manager._client_connected_event.wait(timeout=1.0)
+
+        assert client_manager.send(Message(msg_type=MessageType.CHAT)) is True
+        assert first_entered.wait(timeout=2.0)
+        assert client_manager.send(Message(msg_type=MessageType.CHAT)) is True
+
+        # The receive loop queues the second frame while the first callback
+        # is still held
+        deadline = time.monotonic() + 2.0
+        while host_manager._dispatch_queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not host_manager._dispatch_queue.empty()
+        assert len(callback_threads) == 1
+
+        release.set()
+        assert both_received.wait(timeout=2.0)
+        assert callback_threads == [host_manager._dispatch_thread] * 2
+        assert host_manager._receive_thread not in callback_threads
+
+        client_manager.close()
+        host_manager.close()
+
+    def test_restart_uses_fresh_dispatch_queue(self):
+        """Test that each session's dispatcher gets its own queue."""
+        manager = NetworkManager()
+        assert manager.start_host(0) is True
+        first_queue = manager._dispatch_queue
+        manager.close()
+
+        assert manager.start_host(0) is True
+        assert manager._dispatch_queue is not first_queue
+        manager.close()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
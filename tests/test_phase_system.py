@@ -7,11 +7,6 @@ and round tracking.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
 from core.phase_state import (
     PhaseType,
@@ -136,6 +131,11 @@ class TestPhaseStates:
         
         end_state = create_phase_state(PhaseType.ROUND_END)
         assert isinstance(end_state, RoundEndPhaseState)
+    
+    def test_phase_state_factory_reuses_instances(self):
+        """Test create_phase_state returns one shared instance per phase type."""
+        for phase_type in PhaseType:
+            assert create_phase_state(phase_type) is create_phase_state(phase_type)
 
 
 class TestPhaseManager:
@@ -5,15 +5,28 @@ Tests ready state management, timer functionality, and observer pattern.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
 from core.ready_manager import ReadyManager, ReadyTrigger
 
 
+class Recorder:
+    """Callable observer that records every trigger it receives."""
+
+    __slots__ = ("events",)
+
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, trigger):
+        self.events.append(trigger)
+
+
+@pytest.fixture
+def recorder():
+    """Return a fresh trigger recorder."""
+    return Recorder()
+
+
 class TestReadyManagerInitialization:
     """Tests for ReadyManager initialization."""
 
@@ -28,30 +41,27 @@ class TestReadyManagerInitialization:
         assert manager.all_ready is False
         assert manager.time_remaining == 0.0
 
-    def test_custom_player_count(self):
-        """Test ReadyManager with custom player count."""
-        manager = ReadyManager(player_count=4)
+    @pytest.mark.parametrize(
+        "player_count,expected",
+        [(4, 4), (0, 1), (-5, 1)],
+        ids=["custom", "zero_clamped", "negative_clamped"],
+    )
+    def test_player_count(self, player_count, expected):
+        """Test custom player counts, clamped to a minimum of 1."""
+        manager = ReadyManager(player_count=player_count)
         
-        assert manager.player_count == 4
+        assert manager.player_count == expected
 
-    def test_custom_timeout(self):
-        """Test ReadyManager with custom timeout."""
-        manager = ReadyManager(ready_timeout=120.0)
-        
-        assert manager.ready_timeout == 120.0
-
-    def test_player_count_minimum_is_one(self):
-        """Test that player count is clamped to minimum of 1."""
-        manager = ReadyManager(player_count=0)
-        assert manager.player_count == 1
+    @pytest.mark.parametrize(
+        "ready_timeout,expected",
+        [(120.0, 120.0), (-10.0, 0.0)],
+        ids=["custom", "negative_clamped"],
+    )
+    def test_ready_timeout(self, ready_timeout, expected):
+        """Test custom timeouts, clamped to a minimum of 0."""
+        manager = ReadyManager(ready_timeout=ready_timeout)
         
-        manager2 = ReadyManager(player_count=-5)
-        assert manager2.player_count == 1
-
-    def test_timeout_minimum_is_zero(self):
-        """Test that timeout is clamped to minimum of 0."""
-        manager = ReadyManager(ready_timeout=-10.0)
-        assert manager.ready_timeout == 0.0
+        assert manager.ready_timeout == expected
 
 
 class TestReadyManagerStart:
@@ -118,33 +128,28 @@ class TestReadyManagerSetReady:
         assert manager.ready_count == 1
         assert manager.is_player_ready(1) is True
 
-    def test_set_ready_returns_true_on_change(self):
-        """Test that set_ready returns True when state changes."""
-        manager = ReadyManager()
-        manager.start()
-        
-        result = manager.set_ready(1)
-        
-        assert result is True
-
-    def test_set_ready_returns_false_if_already_ready(self):
-        """Test that set_ready returns False if already ready."""
-        manager = ReadyManager()
-        manager.start()
-        manager.set_ready(1)
-        
-        result = manager.set_ready(1)
-        
-        assert result is False
-
-    def test_set_ready_returns_false_if_not_active(self):
-        """Test that set_ready returns False if manager not active."""
+    @pytest.mark.parametrize(
+        "active,already_ready,expected_result,expected_count",
+        [
+            (True, False, True, 1),
+            (True, True, False, 1),
+            (False, False, False, 0),
+        ],
+        ids=["changed", "already_ready", "not_active"],
+    )
+    def test_set_ready_return_value(self, active, already_ready,
+                                    expected_result, expected_count):
+        """Test that set_ready returns True only when the state changes."""
         manager = ReadyManager()
+        if active:
+            manager.start()
+        if already_ready:
+            manager.set_ready(1)
         
         result = manager.set_ready(1)
         
-        assert result is False
-        assert manager.ready_count == 0
+        assert result is expected_result
+        assert manager.ready_count == expected_count
 
     def test_is_player_ready(self):
         """Test is_player_ready method."""
@@ -175,24 +180,22 @@ class TestReadyManagerSetUnready:
         assert manager.is_player_ready(1) is False
         assert manager.is_player_ready(2) is True
 
-    def test_set_unready_returns_true_on_change(self):
-        """Test that set_unready returns True when state changes."""
-        manager = ReadyManager()
-        manager.start()
-        manager.set_ready(1)
-        
-        result = manager.set_unready(1)
-        
-        assert result is True
-
-    def test_set_unready_returns_false_if_not_ready(self):
-        """Test that set_unready returns False if not ready."""
+    @pytest.mark.parametrize(
+        "was_ready,expected_result",
+        [(True, True), (False, False)],
+        ids=["changed", "not_ready"],
+    )
+    def test_set_unready_return_value(self, was_ready, expected_result):
+        """Test that set_unready returns True only when the state changes."""
         manager = ReadyManager()
         manager.start()
+        if was_ready:
+            manager.set_ready(1)
         
         result = manager.set_unready(1)
         
-        assert result is False
+        assert result is expected_result
+        assert manager.ready_count == 0
 
 
 class TestReadyManagerAllReady:
@@ -220,38 +223,30 @@ class TestReadyManagerAllReady:
         manager.set_ready(2)
         assert manager.all_ready is True
 
-    def test_all_ready_triggers_callback(self):
+    def test_all_ready_triggers_callback(self, recorder):
         """Test that reaching all_ready triggers callback."""
         manager = ReadyManager(player_count=2)
         
-        triggered = []
-        def callback(trigger):
-            triggered.append(trigger)
-        
-        manager.subscribe(callback)
+        manager.subscribe(recorder)
         manager.start()
         manager.set_ready(1)
         manager.set_ready(2)
         
-        assert len(triggered) == 1
-        assert triggered[0] == ReadyTrigger.ALL_READY
+        assert len(recorder.events) == 1
+        assert recorder.events[0] == ReadyTrigger.ALL_READY
 
-    def test_callback_not_triggered_twice(self):
+    def test_callback_not_triggered_twice(self, recorder):
         """Test that callback is not triggered multiple times."""
         manager = ReadyManager(player_count=1)
         
-        triggered = []
-        def callback(trigger):
-            triggered.append(trigger)
-        
-        manager.subscribe(callback)
+        manager.subscribe(recorder)
         manager.start()
         manager.set_ready(1)
         
         # Try to set ready again (should not trigger)
         manager.set_ready(1)
         
-        assert len(triggered) == 1
+        assert len(recorder.events) == 1
 
 
 class TestReadyManagerTimer:
@@ -270,57 +265,45 @@ class TestReadyManagerTimer:
         
         assert manager.time_remaining == 24.0
 
-    def test_timer_expiration_triggers_callback(self):
+    def test_timer_expiration_triggers_callback(self, recorder):
         """Test that timer expiration triggers callback."""
         manager = ReadyManager(ready_timeout=5.0)
         
-        triggered = []
-        def callback(trigger):
-            triggered.append(trigger)
-        
-        manager.subscribe(callback)
+        manager.subscribe(recorder)
         manager.start()
         
         manager.update(6.0)
         
-        assert len(triggered) == 1
-        assert triggered[0] == ReadyTrigger.TIMER_EXPIRED
+        assert len(recorder.events) == 1
+        assert recorder.events[0] == ReadyTrigger.TIMER_EXPIRED
 
-    def test_timer_disabled_with_zero_timeout(self):
+    def test_timer_disabled_with_zero_timeout(self, recorder):
         """Test that timer with 0 timeout never expires."""
         manager = ReadyManager(ready_timeout=0.0)
         
-        triggered = []
-        def callback(trigger):
-            triggered.append(trigger)
-        
-        manager.subscribe(callback)
+        manager.subscribe(recorder)
         manager.start()
         
         manager.update(100.0)
         
-        assert len(triggered) == 0
+        assert len(recorder.events) == 0
         assert manager.is_active is True
 
 
 class TestReadyManagerForceReady:
     """Tests for force_ready functionality."""
 
-    def test_force_ready_triggers_immediately(self):
+    def test_force_ready_triggers_immediately(self, recorder):
         """Test that force_ready triggers callback immediately."""
         manager = ReadyManager(player_count=2)
         
-        triggered = []
-        def callback(trigger):
-            triggered.append(trigger)
-        
-        manager.subscribe(callback)
+        manager.subscribe(recorder)
         manager.start()
         
         manager.force_ready()
         
-        assert len(triggered) == 1
-        assert triggered[0] == ReadyTrigger.FORCED
+        assert len(recorder.events) == 1
+        assert recorder.events[0] == ReadyTrigger.FORCED
 
     def test_force_ready_deactivates_manager(self):
         """Test that force_ready deactivates the manager."""
@@ -335,54 +318,39 @@ class TestReadyManagerForceReady:
 class TestReadyManagerObservers:
     """Tests for observer pattern."""
 
-    def test_subscribe_adds_callback(self):
+    def test_subscribe_adds_callback(self, recorder):
         """Test that subscribe adds a callback."""
         manager = ReadyManager()
         
-        def callback(trigger):
-            pass
-        
-        manager.subscribe(callback)
+        manager.subscribe(recorder)
         manager.start()
         manager.force_ready()
         
-        # If subscribed correctly, this won't crash
+        assert recorder.events == [ReadyTrigger.FORCED]
 
-    def test_unsubscribe_removes_callback(self):
+    def test_unsubscribe_removes_callback(self, recorder):
         """Test that unsubscribe removes a callback."""
         manager = ReadyManager()
         
-        triggered = []
-        def callback(trigger):
-            triggered.append(trigger)
-        
-        manager.subscribe(callback)
-        manager.unsubscribe(callback)
+        manager.subscribe(recorder)
+        manager.unsubscribe(recorder)
         manager.start()
         manager.force_ready()
         
-        assert len(triggered) == 0
+        assert len(recorder.events) == 0
 
-    def test_multiple_observers(self):
+    def test_multiple_observers(self, recorder):
         """Test multiple observers receive callbacks."""
         manager = ReadyManager()
+        second_recorder = Recorder()
         
-        triggered1 = []
-        triggered2 = []
-        
-        def callback1(trigger):
-            triggered1.append(trigger)
-        
-        def callback2(trigger):
-            triggered2.append(trigger)
-        
-        manager.subscribe(callback1)
-        manager.subscribe(callback2)
+        manager.subscribe(recorder)
+        manager.subscribe(second_recorder)
         manager.start()
         manager.force_ready()
         
-        assert len(triggered1) == 1
-        assert len(triggered2) == 1
+        assert len(recorder.events) == 1
+        assert len(second_recorder.events) == 1
 
 
 class TestReadyManagerReset:
@@ -11,30 +11,28 @@ class MockScreen:
     def get_width(self): return 800
     def get_height(self): return 600
 
-def test_iso_conversion():
+
+@pytest.fixture(scope="module")
+def renderer():
+    """Build one Renderer shared by every conversion case in this module."""
+    return Renderer(MockScreen(), Grid(10, 10, 32))
+
+
+@pytest.mark.parametrize(
+    "cart_x,cart_y",
+    [(0, 0), (5, 5), (-3, 7), (9, 1)],
+    ids=["origin", "diagonal", "negative_x", "edge"],
+)
+def test_iso_conversion(renderer, cart_x, cart_y):
     """Test cartesian to isometric and back conversion."""
-    screen = MockScreen()
-    grid = Grid(10, 10, 32)
-    renderer = Renderer(screen, grid)
-    
-    # Test Origin
-    cart_x, cart_y = 0, 0
     iso_x, iso_y = renderer.cart_to_iso(cart_x, cart_y)
-    
+
     # Check inverse
     res_x, res_y = renderer.iso_to_cart(iso_x, iso_y)
-    
+
     # Allow small rounding error
     assert abs(res_x - cart_x) <= 1
     assert abs(res_y - cart_y) <= 1
-    
-    # Test Arbitrary Point
-    cart_x, cart_y = 5, 5
-    iso_x, iso_y = renderer.cart_to_iso(cart_x, cart_y)
-    res_x, res_y = renderer.iso_to_cart(iso_x, iso_y)
-    
-    assert abs(res_x - cart_x) <= 1
-    assert abs(res_y - cart_y) <= 1
 
 if __name__ == "__main__":
-    test_iso_conversion()
+    pytest.main([__file__, "-v"])
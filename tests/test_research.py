@@ -5,12 +5,9 @@ Tests cover research unlocking, prerequisites, cost validation, serialization,
 and integration with interpolation methods.
 """
 
-import pytest
-import sys
-import os
+import itertools
 
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+import pytest
 
 from core.research import (
     ResearchType,
@@ -22,6 +19,9 @@ from core.research import (
     AlreadyResearchedError
 )
 
+# Every research type, iterated once for the whole module
+ALL_TYPES = tuple(ResearchType)
+
 
 class TestResearchType:
     """Tests for ResearchType enum."""
@@ -34,8 +34,7 @@ class TestResearchType:
 
     def test_research_types_are_unique(self):
         """Test that all research types have unique values."""
-        types = [rt for rt in ResearchType]
-        values = [rt.value for rt in types]
+        values = [rt.value for rt in ALL_TYPES]
         assert len(values) == len(set(values))
 
 
@@ -44,7 +43,7 @@ class TestResearchInfo:
 
     def test_all_research_have_info(self):
         """Test that all research types have corresponding info."""
-        for rt in ResearchType:
+        for rt in ALL_TYPES:
             assert rt in RESEARCH_INFO
 
     def test_lagrange_info(self):
@@ -235,37 +234,26 @@ class TestGetAvailableResearch:
 class TestGetInterpolationMethods:
     """Tests for get_interpolation_methods method."""
 
-    def test_linear_always_available(self):
-        """Test that linear is always available."""
-        manager = ResearchManager("player1")
-        methods = manager.get_interpolation_methods()
-        assert 'linear' in methods
-
-    def test_lagrange_after_unlock(self):
-        """Test lagrange available after unlock."""
-        manager = ResearchManager("player1")
-        manager.unlock(ResearchType.LAGRANGE_INTERPOLATION, 1000)
-        methods = manager.get_interpolation_methods()
-        assert 'linear' in methods
-        assert 'lagrange' in methods
-        assert 'spline' not in methods
-
-    def test_spline_after_unlock(self):
-        """Test spline available after unlock."""
-        manager = ResearchManager("player1")
-        manager.unlock(ResearchType.LAGRANGE_INTERPOLATION, 2000)
-        manager.unlock(ResearchType.SPLINE_INTERPOLATION, 1500)
-        methods = manager.get_interpolation_methods()
-        assert 'linear' in methods
-        assert 'lagrange' in methods
-        assert 'spline' in methods
-
-    def test_tangent_control_not_in_methods(self):
-        """Test that tangent control doesn't add interpolation methods."""
+    @pytest.mark.parametrize(
+        "unlocks,expected",
+        [
+            ([], {'linear'}),
+            ([ResearchType.LAGRANGE_INTERPOLATION], {'linear', 'lagrange'}),
+            (
+                [ResearchType.LAGRANGE_INTERPOLATION, ResearchType.SPLINE_INTERPOLATION],
+                {'linear', 'lagrange', 'spline'},
+            ),
+            # Tangent control doesn't add interpolation methods
+            ([ResearchType.TANGENT_CONTROL], {'linear'}),
+        ],
+        ids=["linear_always", "lagrange", "spline", "tangent_control"],
+    )
+    def test_methods_after_unlocks(self, unlocks, expected):
+        """Test the interpolation methods available after each unlock chain."""
         manager = ResearchManager("player1")
-        manager.unlock(ResearchType.TANGENT_CONTROL, 1000)
-        methods = manager.get_interpolation_methods()
-        assert methods == {'linear'}  # Only linear
+        for research_type in unlocks:
+            manager.unlock(research_type, RESEARCH_INFO[research_type].cost)
+        assert manager.get_interpolation_methods() == expected
 
 
 class TestReset:
@@ -284,59 +272,42 @@ class TestReset:
         assert not manager.is_unlocked(ResearchType.TANGENT_CONTROL)
 
 
-class TestSerialization:
-    """Tests for serialization and deserialization."""
+def _valid_unlock_sets():
+    """Return every prerequisite-closed set of research, in unlock order."""
+    unlock_sets = []
+    for size in range(len(ALL_TYPES) + 1):
+        for combo in itertools.combinations(ALL_TYPES, size):
+            chosen = set(combo)
+            if all(set(RESEARCH_INFO[rt].prerequisites) <= chosen for rt in combo):
+                unlock_sets.append(combo)
+    return unlock_sets
 
-    def test_to_dict_empty(self):
-        """Test serialization with no research."""
-        manager = ResearchManager("player1")
-        data = manager.to_dict()
-        assert data['player_id'] == "player1"
-        assert data['unlocked'] == []
 
-    def test_to_dict_with_research(self):
-        """Test serialization with unlocked research."""
-        manager = ResearchManager("player1")
-        manager.unlock(ResearchType.LAGRANGE_INTERPOLATION, 1000)
-        manager.unlock(ResearchType.TANGENT_CONTROL, 800)
-        
-        data = manager.to_dict()
-        assert data['player_id'] == "player1"
-        assert 'LAGRANGE_INTERPOLATION' in data['unlocked']
-        assert 'TANGENT_CONTROL' in data['unlocked']
+# Enum order lists prerequisites first, so each combo can be unlocked in order
+UNLOCK_SETS = _valid_unlock_sets()
 
-    def test_from_dict_empty(self):
-        """Test deserialization with no research."""
-        data = {'player_id': 'player2', 'unlocked': []}
-        manager = ResearchManager.from_dict(data)
-        
-        assert manager.player_id == 'player2'
-        assert len(manager.unlocked_research) == 0
 
-    def test_from_dict_with_research(self):
-        """Test deserialization with unlocked research."""
-        data = {
-            'player_id': 'player2',
-            'unlocked': ['LAGRANGE_INTERPOLATION', 'TANGENT_CONTROL']
-        }
-        manager = ResearchManager.from_dict(data)
-        
-        assert manager.player_id == 'player2'
-        assert manager.is_unlocked(ResearchType.LAGRANGE_INTERPOLATION)
-        assert manager.is_unlocked(ResearchType.TANGENT_CONTROL)
-        assert not manager.is_unlocked(ResearchType.SPLINE_INTERPOLATION)
+class TestSerialization:
+    """Tests for serialization and deserialization."""
 
-    def test_roundtrip_serialization(self):
-        """Test that serialization and deserialization are inverses."""
-        manager1 = ResearchManager("player3")
-        manager1.unlock(ResearchType.LAGRANGE_INTERPOLATION, 2000)
-        manager1.unlock(ResearchType.SPLINE_INTERPOLATION, 1500)
+    @pytest.mark.parametrize(
+        "unlocked",
+        UNLOCK_SETS,
+        ids=["+".join(rt.name for rt in combo) or "none" for combo in UNLOCK_SETS],
+    )
+    def test_roundtrip_serialization(self, unlocked):
+        """Test that every reachable research state survives a roundtrip."""
+        manager1 = ResearchManager("player1")
+        for research_type in unlocked:
+            manager1.unlock(research_type, RESEARCH_INFO[research_type].cost)
         
         data = manager1.to_dict()
-        manager2 = ResearchManager.from_dict(data)
+        assert data['player_id'] == "player1"
+        assert sorted(data['unlocked']) == sorted(rt.name for rt in unlocked)
         
-        assert manager1.player_id == manager2.player_id
-        assert manager1.unlocked_research == manager2.unlocked_research
+        manager2 = ResearchManager.from_dict(data)
+        assert manager2.player_id == manager1.player_id
+        assert manager2.unlocked_research == set(unlocked)
 
     def test_from_dict_ignores_unknown_research(self):
         """Test that deserialization ignores unknown research types."""
@@ -4,17 +4,22 @@ Unit tests for ResultScreen in PathWars - The Interpolation Battles.
 Tests cover victory/game over display, button interactions, and visibility states.
 """
 
-import pytest
-import sys
-import os
-
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from unittest.mock import MagicMock
 
+import pytest
 import pygame
 
 from ui.result_screen import ResultScreen
 
+# A motion event never hits a button, so one instance serves every test.
+_MOTION_EVT = pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0))
+
+
+@pytest.fixture
+def result_screen():
+    """Create a fresh ResultScreen for each test."""
+    return ResultScreen(800, 600)
+
 
 class TestResultScreenInit:
     """Tests for ResultScreen initialization."""
@@ -32,71 +37,46 @@ class TestResultScreenInit:
         assert screen.bg_color == (10, 20, 30, 200)
 
 
-class TestResultScreenVictory:
-    """Tests for ResultScreen victory display."""
+SHOW_METHODS = pytest.mark.parametrize(
+    "show_method,expected_type",
+    [
+        ("show_victory", ResultScreen.VICTORY),
+        ("show_game_over", ResultScreen.GAME_OVER),
+    ],
+    ids=["victory", "game_over"],
+)
+
 
-    @pytest.fixture
-    def result_screen(self):
-        """Create a fresh ResultScreen for each test."""
-        return ResultScreen(800, 600)
+@SHOW_METHODS
+class TestResultScreenShow:
+    """Tests for ResultScreen victory and game over display."""
 
-    def test_show_victory_sets_visible(self, result_screen):
-        """Test that show_victory() makes the screen visible."""
+    def test_show_sets_visible(self, result_screen, show_method, expected_type):
+        """Test that showing a result makes the screen visible."""
         assert result_screen.visible is False
-        result_screen.show_victory()
+        getattr(result_screen, show_method)()
         assert result_screen.visible is True
 
-    def test_show_victory_sets_result_type(self, result_screen):
-        """Test that show_victory() sets result type to victory."""
-        result_screen.show_victory()
-        assert result_screen.result_type == ResultScreen.VICTORY
+    def test_show_sets_result_type(self, result_screen, show_method, expected_type):
+        """Test that showing a result sets the matching result type."""
+        getattr(result_screen, show_method)()
+        assert result_screen.result_type == expected_type
 
-    def test_show_victory_with_stats(self, result_screen):
-        """Test that show_victory() accepts and stores stats."""
+    def test_show_with_stats(self, result_screen, show_method, expected_type):
+        """Test that showing a result accepts and stores stats."""
         stats = {"Score": 1000, "Waves Completed": 5}
-        result_screen.show_victory(stats)
+        getattr(result_screen, show_method)(stats)
         assert result_screen.stats == stats
 
-    def test_show_victory_without_stats(self, result_screen):
-        """Test that show_victory() works without stats."""
-        result_screen.show_victory()
+    def test_show_without_stats(self, result_screen, show_method, expected_type):
+        """Test that showing a result works without stats."""
+        getattr(result_screen, show_method)()
         assert result_screen.stats == {}
 
 
-class TestResultScreenGameOver:
-    """Tests for ResultScreen game over display."""
-
-    @pytest.fixture
-    def result_screen(self):
-        """Create a fresh ResultScreen for each test."""
-        return ResultScreen(800, 600)
-
-    def test_show_game_over_sets_visible(self, result_screen):
-        """Test that show_game_over() makes the screen visible."""
-        assert result_screen.visible is False
-        result_screen.show_game_over()
-        assert result_screen.visible is True
-
-    def test_show_game_over_sets_result_type(self, result_screen):
-        """Test that show_game_over() sets result type to game_over."""
-        result_screen.show_game_over()
-        assert result_screen.result_type == ResultScreen.GAME_OVER
-
-    def test_show_game_over_with_stats(self, result_screen):
-        """Test that show_game_over() accepts and stores stats."""
-        stats = {"Score": 500, "Waves Completed": 2}
-        result_screen.show_game_over(stats)
-        assert result_screen.stats == stats
-
-
 class TestResultScreenHide:
     """Tests for ResultScreen hide functionality."""
 
-    @pytest.fixture
-    def result_screen(self):
-        """Create a fresh ResultScreen for each test."""
-        return ResultScreen(800, 600)
-
     def test_hide_sets_invisible(self, result_screen):
         """Test that hide() makes the screen invisible."""
         result_screen.show_victory()
@@ -119,11 +99,6 @@ class TestResultScreenHide:
 class TestResultScreenEventHandling:
     """Tests for ResultScreen event handling."""
 
-    @pytest.fixture
-    def result_screen(self):
-        """Create a fresh ResultScreen for each test."""
-        return ResultScreen(800, 600)
-
     def test_handle_event_returns_none_when_hidden(self, result_screen):
         """Test that handle_event() returns None when hidden."""
         event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(400, 400))
@@ -133,8 +108,7 @@ class TestResultScreenEventHandling:
     def test_handle_event_returns_none_for_no_click(self, result_screen):
         """Test that handle_event() returns None when no button clicked."""
         result_screen.show_victory()
-        event = pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0))
-        result = result_screen.handle_event(event)
+        result = result_screen.handle_event(_MOTION_EVT)
         assert result is None
 
     def test_handle_event_restart_button(self, result_screen):
@@ -169,57 +143,36 @@ class TestResultScreenEventHandling:
 class TestResultScreenDraw:
     """Tests for ResultScreen draw functionality."""
 
-    @pytest.fixture
-    def result_screen(self):
-        """Create a fresh ResultScreen for each test."""
-        return ResultScreen(800, 600)
-
-    @pytest.fixture
-    def screen(self):
-        """Create a test screen surface."""
-        return pygame.Surface((800, 600))
-
-    def test_draw_when_hidden_does_nothing(self, result_screen, screen):
+    def test_draw_when_hidden_does_nothing(self, result_screen):
         """Test that draw() does nothing when screen is hidden."""
-        screen.fill((0, 0, 0))
-        original = screen.copy()
-        
+        screen = MagicMock(spec=pygame.Surface)
         result_screen.draw(screen)
         
-        # Screen should be unchanged
-        assert pygame.image.tostring(screen, 'RGB') == pygame.image.tostring(original, 'RGB')
+        # Nothing should have been drawn onto the screen
+        assert screen.method_calls == []
 
-    def test_draw_victory_modifies_screen(self, result_screen, screen):
+    def test_draw_victory_modifies_screen(self, result_screen, cleared_surface, black_pixel_count):
         """Test that draw() modifies the screen for victory."""
-        screen.fill((0, 0, 0))
-        original = pygame.image.tostring(screen, 'RGB')
-        
         result_screen.show_victory()
-        result_screen.draw(screen)
+        result_screen.draw(cleared_surface)
         
-        # Screen should be different
-        assert pygame.image.tostring(screen, 'RGB') != original
+        # Some pixels should no longer be black
+        width, height = cleared_surface.get_size()
+        assert black_pixel_count(cleared_surface) < width * height
 
-    def test_draw_game_over_modifies_screen(self, result_screen, screen):
+    def test_draw_game_over_modifies_screen(self, result_screen, cleared_surface, black_pixel_count):
         """Test that draw() modifies the screen for game over."""
-        screen.fill((0, 0, 0))
-        original = pygame.image.tostring(screen, 'RGB')
-        
         result_screen.show_game_over()
-        result_screen.draw(screen)
+        result_screen.draw(cleared_surface)
         
-        # Screen should be different
-        assert pygame.image.tostring(screen, 'RGB') != original
+        # Some pixels should no longer be black
+        width, height = cleared_surface.get_size()
+        assert black_pixel_count(cleared_surface) < width * height
 
 
 class TestResultScreenSwitching:
     """Tests for switching between victory and game over states."""
 
-    @pytest.fixture
-    def result_screen(self):
-        """Create a fresh ResultScreen for each test."""
-        return ResultScreen(800, 600)
-
     def test_switch_from_victory_to_game_over(self, result_screen):
         """Test switching from victory to game over."""
         result_screen.show_victory({"Score": 100})
@@ -240,11 +193,6 @@ class TestResultScreenSwitching:
 class TestResultScreenStatsImmutability:
     """Tests for stats dictionary immutability."""
 
-    @pytest.fixture
-    def result_screen(self):
-        """Create a fresh ResultScreen for each test."""
-        return ResultScreen(800, 600)
-
     def test_stats_returns_copy(self, result_screen):
         """Test that stats property returns a copy."""
         original_stats = {"Score": 100}
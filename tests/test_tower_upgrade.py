@@ -5,11 +5,6 @@ Tests cover tower levels, upgrade costs, upgrade mechanics, and stat improvement
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 
 from entities.base import Vector2
 from entities.tower import Tower, TowerType, TowerLevel, TowerUpgradeError
@@ -18,13 +13,13 @@ from entities.tower import Tower, TowerType, TowerLevel, TowerUpgradeError
 class TestTowerLevel:
     """Tests for TowerLevel enum."""
 
-    def test_mastery_is_level_1(self):
-        """Test MASTERY level is 1."""
-        assert TowerLevel.MASTERY.value == 1
-
-    def test_doctorate_is_level_2(self):
-        """Test DOCTORATE level is 2."""
-        assert TowerLevel.DOCTORATE.value == 2
+    @pytest.mark.parametrize("level,expected_value", [
+        (TowerLevel.MASTERY, 1),
+        (TowerLevel.DOCTORATE, 2),
+    ])
+    def test_level_values(self, level, expected_value):
+        """Test MASTERY is level 1 and DOCTORATE is level 2."""
+        assert level.value == expected_value
 
 
 class TestTowerInitialization:
@@ -54,7 +49,7 @@ class TestTowerInitialization:
         # CALCULUS base damage is 25, upgraded should be 25 * 1.5 = 37
         assert tower.damage == 37
         # CALCULUS base range is 5.0, upgraded should be 5.0 * 1.25 = 6.25
-        assert pytest.approx(tower.attack_range, abs=0.01) == 6.25
+        assert tower.attack_range == 6.25
         # CALCULUS base cooldown is 0.5, upgraded should be 0.5 * 0.8 = 0.4
         assert pytest.approx(tower.cooldown, abs=0.01) == 0.4
 
@@ -62,25 +57,8 @@ class TestTowerInitialization:
 class TestTowerUpgradeCost:
     """Tests for tower upgrade costs."""
 
-    def test_dean_upgrade_cost(self):
-        """Test DEAN upgrade cost is 75."""
-        tower = Tower(Vector2(5.0, 5.0), TowerType.DEAN)
-        assert tower.upgrade_cost == 75
-
-    def test_calculus_upgrade_cost(self):
-        """Test CALCULUS upgrade cost is 100."""
-        tower = Tower(Vector2(5.0, 5.0), TowerType.CALCULUS)
-        assert tower.upgrade_cost == 100
-
-    def test_physics_upgrade_cost(self):
-        """Test PHYSICS upgrade cost is 150."""
-        tower = Tower(Vector2(5.0, 5.0), TowerType.PHYSICS)
-        assert tower.upgrade_cost == 150
-
-    def test_statistics_upgrade_cost(self):
-        """Test STATISTICS upgrade cost is 90."""
-        tower = Tower(Vector2(5.0, 5.0), TowerType.STATISTICS)
-        assert tower.upgrade_cost == 90
+    # Per-type MASTERY costs are covered by
+    # TestTowerUpgradeAllTypes.test_all_types_have_upgrade_cost
 
     def test_doctorate_upgrade_cost_is_zero(self):
         """Test DOCTORATE towers have 0 upgrade cost."""
@@ -121,54 +99,23 @@ class TestTowerUpgrade:
         assert result is True
         assert tower.level == TowerLevel.DOCTORATE
 
-    def test_upgrade_increases_damage(self):
-        """Test upgrade increases damage by 1.5x."""
-        tower = Tower(Vector2(5.0, 5.0), TowerType.CALCULUS)
-        base_damage = tower.damage
-        assert base_damage == 25
-        tower.upgrade()
-        assert tower.damage == 37  # 25 * 1.5 = 37.5, rounded to 37
-
-    def test_upgrade_increases_range(self):
-        """Test upgrade increases range by 1.25x."""
-        tower = Tower(Vector2(5.0, 5.0), TowerType.CALCULUS)
-        base_range = tower.attack_range
-        assert base_range == 5.0
-        tower.upgrade()
-        assert pytest.approx(tower.attack_range, abs=0.01) == 6.25
-
-    def test_upgrade_decreases_cooldown(self):
-        """Test upgrade decreases cooldown by 0.8x (20% faster)."""
-        tower = Tower(Vector2(5.0, 5.0), TowerType.CALCULUS)
-        base_cooldown = tower.cooldown
-        assert base_cooldown == 0.5
-        tower.upgrade()
-        assert pytest.approx(tower.cooldown, abs=0.01) == 0.4
-
-    def test_upgrade_increases_stun_duration(self):
-        """Test upgrade increases stun duration for DEAN by 1.5x."""
-        tower = Tower(Vector2(5.0, 5.0), TowerType.DEAN)
-        base_stun = tower.stun_duration
-        assert base_stun == 1.0
-        tower.upgrade()
-        assert pytest.approx(tower.stun_duration, abs=0.01) == 1.5
-
-    def test_upgrade_increases_splash_radius(self):
-        """Test upgrade increases splash radius for PHYSICS by 1.3x."""
-        tower = Tower(Vector2(5.0, 5.0), TowerType.PHYSICS)
-        base_splash = tower.splash_radius
-        assert base_splash == 2.0
-        tower.upgrade()
-        assert pytest.approx(tower.splash_radius, abs=0.01) == 2.6
-
-    def test_upgrade_increases_slow_amount(self):
-        """Test upgrade increases slow amount for STATISTICS by 1.25x, capped at 1.0."""
-        tower = Tower(Vector2(5.0, 5.0), TowerType.STATISTICS)
-        base_slow = tower.slow_amount
-        assert base_slow == 0.5
+    @pytest.mark.parametrize("tower_type,stat,base_value,upgraded_value", [
+        # 25 * 1.5 = 37.5, rounded down to 37
+        (TowerType.CALCULUS, "damage", 25, 37),
+        (TowerType.CALCULUS, "attack_range", 5.0, 6.25),
+        # 20% faster
+        (TowerType.CALCULUS, "cooldown", 0.5, pytest.approx(0.4, abs=0.01)),
+        (TowerType.DEAN, "stun_duration", 1.0, 1.5),
+        (TowerType.PHYSICS, "splash_radius", 2.0, pytest.approx(2.6, abs=0.01)),
+        # 0.5 * 1.25 = 0.625, below the 1.0 cap
+        (TowerType.STATISTICS, "slow_amount", 0.5, 0.625),
+    ], ids=["damage", "range", "cooldown", "stun", "splash", "slow"])
+    def test_upgrade_scales_stat(self, tower_type, stat, base_value, upgraded_value):
+        """Test upgrade applies the stat multiplier for the tower type."""
+        tower = Tower(Vector2(5.0, 5.0), tower_type)
+        assert getattr(tower, stat) == base_value
         tower.upgrade()
-        # 0.5 * 1.25 = 0.625, not capped
-        assert pytest.approx(tower.slow_amount, abs=0.01) == 0.625
+        assert getattr(tower, stat) == upgraded_value
 
     def test_upgrade_returns_false_if_already_max(self):
         """Test upgrade returns False if already at DOCTORATE."""
@@ -204,14 +151,14 @@ class TestTowerUpgradePreview:
         """Test preview shows correct range increase."""
         tower = Tower(Vector2(5.0, 5.0), TowerType.CALCULUS)
         preview = tower.get_upgrade_preview()
-        assert pytest.approx(preview["current"]["attack_range"], abs=0.01) == 5.0
-        assert pytest.approx(preview["upgraded"]["attack_range"], abs=0.01) == 6.25
+        assert preview["current"]["attack_range"] == 5.0
+        assert preview["upgraded"]["attack_range"] == 6.25
 
     def test_preview_shows_cooldown_decrease(self):
         """Test preview shows correct cooldown decrease."""
         tower = Tower(Vector2(5.0, 5.0), TowerType.CALCULUS)
         preview = tower.get_upgrade_preview()
-        assert pytest.approx(preview["current"]["cooldown"], abs=0.01) == 0.5
+        assert preview["current"]["cooldown"] == 0.5
         assert pytest.approx(preview["upgraded"]["cooldown"], abs=0.01) == 0.4
 
     def test_preview_empty_if_already_max(self):
@@ -0,0 +1,21 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def ui_screen(pygame_init):
+    """Provide one off-screen 1280x720 surface for every UI test that needs it.
+
+    No display window is opened; the UI code only blits onto the surface.
+    Tests that draw on it must not rely on its previous contents.
+    """
+    import pygame
+    return pygame.Surface((1280, 720))
+
+
+@pytest.fixture
+def game_state():
+    """Provide a fresh GameState singleton, discarded again after the test."""
+    from core.game_state import GameState
+    GameState.reset_instance()
+    yield GameState()
+    GameState.reset_instance()
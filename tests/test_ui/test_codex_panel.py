@@ -2,26 +2,39 @@
 Unit tests for CodexPanel UI.
 """
 
-import sys
-import os
 import pytest
 import pygame
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
-
 from ui.codex_panel import CodexPanel
 from entities.tower import TowerType
 from entities.enemy import EnemyType
 
+# Key events carry no per-test state, so build them once and reuse them.
+_ESC_EVT = pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_ESCAPE, 'unicode': ''})
+_TAB_EVT = pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_TAB, 'unicode': ''})
+_LEFT_EVT = pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_LEFT, 'unicode': ''})
+_RIGHT_EVT = pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_RIGHT, 'unicode': ''})
+
+_SCREEN_WIDTH = 1280
+_SCREEN_HEIGHT = 720
+
+
+@pytest.fixture(scope="class")
+def shared_panel():
+    """Build one CodexPanel per test class."""
+    return CodexPanel(_SCREEN_WIDTH, _SCREEN_HEIGHT)
+
 
 class TestCodexPanel:
     """Tests for CodexPanel UI."""
-    
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.screen_width = 1280
-        self.screen_height = 720
-        self.panel = CodexPanel(self.screen_width, self.screen_height)
+
+    @pytest.fixture(autouse=True)
+    def _reset_panel(self, shared_panel):
+        """Return the shared panel to its initial hidden state before each test."""
+        shared_panel.show()
+        shared_panel.hide()
+        shared_panel._hovered_button = None
+        self.panel = shared_panel
     
     def test_codex_panel_initial_state(self):
         """Test that codex panel initializes with correct default state."""
@@ -90,44 +103,31 @@ class TestCodexPanel:
         assert EnemyType.VARIABLE_X in self.panel._enemy_types
     
     def test_card_navigation(self):
-        """Test navigating between cards with arrows."""
+        """Test arrow keys and navigation buttons move through cards within bounds."""
         self.panel.show()
-        
-        # Start at index 0
         assert self.panel.current_index == 0
         
-        # Navigate to next card
-        event = pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_RIGHT, 'unicode': ''})
-        self.panel.handle_event(event)
-        assert self.panel.current_index == 1
-        
-        # Navigate to next card again
-        self.panel.handle_event(event)
-        assert self.panel.current_index == 2
-        
-        # Navigate back
-        event = pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_LEFT, 'unicode': ''})
-        self.panel.handle_event(event)
-        assert self.panel.current_index == 1
-    
-    def test_card_navigation_bounds(self):
-        """Test that navigation respects bounds."""
-        self.panel.show()
-        self.panel._current_tab = 'torres'
-        self.panel._current_index = 0
-        
-        # Try to go before first card
-        event = pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_LEFT, 'unicode': ''})
-        self.panel.handle_event(event)
-        assert self.panel.current_index == 0  # Should stay at 0
-        
-        # Go to last card
-        self.panel._current_index = 3  # Last tower
-        
-        # Try to go past last card
-        event = pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_RIGHT, 'unicode': ''})
-        self.panel.handle_event(event)
-        assert self.panel.current_index == 3  # Should stay at 3
+        next_click = pygame.event.Event(
+            pygame.MOUSEBUTTONDOWN, {'button': 1, 'pos': self.panel._nav_buttons['next'].center}
+        )
+        prev_click = pygame.event.Event(
+            pygame.MOUSEBUTTONDOWN, {'button': 1, 'pos': self.panel._nav_buttons['prev'].center}
+        )
+        steps = [
+            (_LEFT_EVT, 0),  # Can't go before the first card
+            (_RIGHT_EVT, 1),
+            (_RIGHT_EVT, 2),
+            (_LEFT_EVT, 1),
+            (prev_click, 0),
+            (next_click, 1),
+            (_RIGHT_EVT, 2),
+            (_RIGHT_EVT, 3),
+            (_RIGHT_EVT, 3),  # Can't go past the last tower
+            (next_click, 3),
+        ]
+        for step, (event, expected_index) in enumerate(steps):
+            self.panel.handle_event(event)
+            assert self.panel.current_index == expected_index, f"step {step}"
     
     def test_close_button_returns_to_menu(self):
         """Test that close button hides the panel."""
@@ -146,8 +146,7 @@ class TestCodexPanel:
         self.panel.show()
         
         # Press ESC
-        event = pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_ESCAPE, 'unicode': ''})
-        result = self.panel.handle_event(event)
+        result = self.panel.handle_event(_ESC_EVT)
         
         assert result == 'close'
     
@@ -157,14 +156,13 @@ class TestCodexPanel:
         assert self.panel.current_tab == 'torres'
         
         # Press TAB
-        event = pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_TAB, 'unicode': ''})
-        self.panel.handle_event(event)
+        self.panel.handle_event(_TAB_EVT)
         
         assert self.panel.current_tab == 'enemigos'
         assert self.panel.current_index == 0
         
         # Press TAB again
-        self.panel.handle_event(event)
+        self.panel.handle_event(_TAB_EVT)
         
         assert self.panel.current_tab == 'torres'
         assert self.panel.current_index == 0
@@ -175,36 +173,11 @@ class TestCodexPanel:
         
         # Check tower lore
         for tower_type in self.panel._tower_types:
-            lore = get_tower_lore(tower_type)
-            assert lore != ""
-            assert len(lore) > 0
+            assert get_tower_lore(tower_type) != ""
         
         # Check enemy lore
         for enemy_type in self.panel._enemy_types:
-            lore = get_enemy_lore(enemy_type)
-            assert lore != ""
-            assert len(lore) > 0
-    
-    def test_navigation_buttons_click(self):
-        """Test clicking navigation buttons."""
-        self.panel.show()
-        assert self.panel.current_index == 0
-        
-        # Click next button
-        next_button = self.panel._nav_buttons['next']
-        center = next_button.center
-        event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {'button': 1, 'pos': center})
-        self.panel.handle_event(event)
-        
-        assert self.panel.current_index == 1
-        
-        # Click prev button
-        prev_button = self.panel._nav_buttons['prev']
-        center = prev_button.center
-        event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {'button': 1, 'pos': center})
-        self.panel.handle_event(event)
-        
-        assert self.panel.current_index == 0
+            assert get_enemy_lore(enemy_type) != ""
 
 
 if __name__ == "__main__":
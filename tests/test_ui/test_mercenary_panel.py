@@ -2,32 +2,25 @@
 Unit tests for Mercenary Panel UI.
 """
 
-import sys
-import os
 import pytest
 import pygame
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
-
 from ui.mercenary_panel import MercenaryPanel
 from ui.manager import UIManager
-from core.game_state import GameState
 from entities.mercenaries.mercenary_types import MercenaryType
 
 
 class TestMercenaryPanel:
     """Tests for mercenary panel UI."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, ui_screen, game_state):
         """Set up test fixtures."""
-        pygame.init()
         self.screen_width = 1280
         self.screen_height = 720
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        self.screen = ui_screen
         
-        # Reset GameState singleton
-        GameState.reset_instance()
-        self.game_state = GameState()
+        self.game_state = game_state
         self.game_state._money = 1000
         
         # Create UI manager
@@ -40,10 +33,6 @@ class TestMercenaryPanel:
             on_send_mercenary=self.ui_manager._on_send_mercenary
         )
     
-    def teardown_method(self):
-        """Clean up after tests."""
-        GameState.reset_instance()
-    
     def test_panel_hidden_in_singleplayer_mode(self):
         """El panel NO debe ser visible en modo single player."""
         self.ui_manager.set_multiplayer_mode(False)
@@ -54,24 +43,18 @@ class TestMercenaryPanel:
         self.ui_manager.set_multiplayer_mode(True)
         assert self.ui_manager.mercenary_panel.visible
     
-    def test_send_mercenary_deducts_correct_cost(self):
+    @pytest.mark.parametrize("mercenary_type,cost", [
+        (MercenaryType.REINFORCED_STUDENT, 30),
+        (MercenaryType.SPEEDY_VARIABLE_X, 40),
+        (MercenaryType.TANK_CONSTANT_PI, 60),
+    ])
+    def test_send_mercenary_deducts_correct_cost(self, mercenary_type, cost):
         """Enviar mercenario debe deducir el costo correcto."""
         initial_money = self.game_state.money
         
-        # Send Reinforced Student ($30)
-        success = self.ui_manager._on_send_mercenary(MercenaryType.REINFORCED_STUDENT)
-        assert success
-        assert self.game_state.money == initial_money - 30
-        
-        # Send Speedy Variable X ($40)
-        success = self.ui_manager._on_send_mercenary(MercenaryType.SPEEDY_VARIABLE_X)
+        success = self.ui_manager._on_send_mercenary(mercenary_type)
         assert success
-        assert self.game_state.money == initial_money - 30 - 40
-        
-        # Send Tank Constant Pi ($60)
-        success = self.ui_manager._on_send_mercenary(MercenaryType.TANK_CONSTANT_PI)
-        assert success
-        assert self.game_state.money == initial_money - 30 - 40 - 60
+        assert self.game_state.money == initial_money - cost
     
     def test_send_mercenary_with_insufficient_funds_fails(self):
         """Enviar mercenario sin fondos debe fallar."""
@@ -85,16 +68,9 @@ class TestMercenaryPanel:
     
     def test_mercenary_buttons_show_cost(self):
         """Los botones deben mostrar el costo de cada mercenario."""
-        # Check button labels in the panel
-        button_labels = []
-        for child in self.panel.panel.children:
-            if hasattr(child, 'text'):
-                button_labels.append(child.text)
-        
-        # Check that costs are shown in labels
-        assert "Reinforced Student ($30)" in button_labels
-        assert "Speedy Variable X ($40)" in button_labels
-        assert "Tank Constant Pi ($60)" in button_labels
+        # Check that costs are shown in the panel's button labels
+        button_labels = {child.text for child in self.panel.panel.children if hasattr(child, 'text')}
+        assert {"Reinforced Student ($30)", "Speedy Variable X ($40)", "Tank Constant Pi ($60)"} <= button_labels
     
     def test_panel_initial_state_hidden(self):
         """Panel debe iniciar oculto."""
@@ -124,15 +100,7 @@ class TestMercenaryPanel:
         event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {'button': 1, 'pos': (100, 100)})
         
         # Panel should process the event (return True or False depending on hit)
-        # The important thing is it doesn't crash
-        try:
-            result = self.panel.handle_event(event)
-            success = True
-        except Exception as e:
-            print(f"Error handling event: {e}")
-            success = False
-        
-        assert success
+        assert isinstance(self.panel.handle_event(event), bool)
     
     def test_panel_ignores_events_when_hidden(self):
         """Panel debe ignorar eventos cuando está oculto."""
@@ -2,15 +2,10 @@
 Unit tests for Tower Preview System.
 """
 
-import sys
-import os
 import pytest
-import pygame
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
 
 from ui.manager import UIManager
-from core.game_state import GameState, GamePhase
+from core.game_state import GamePhase
 from core.grid import Grid
 from graphics.renderer import Renderer
 from entities.factory import EntityFactory
@@ -20,16 +15,14 @@ from entities.tower import TowerType
 class TestTowerPreview:
     """Tests for tower preview visual system."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, ui_screen, game_state):
         """Set up test fixtures."""
-        pygame.init()
         self.screen_width = 1280
         self.screen_height = 720
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        self.screen = ui_screen
         
-        # Reset GameState singleton
-        GameState.reset_instance()
-        self.game_state = GameState()
+        self.game_state = game_state
         self.game_state._current_phase = GamePhase.PLANNING
         self.game_state._money = 1000
         
@@ -40,10 +33,6 @@ class TestTowerPreview:
         # Create UI manager
         self.ui_manager = UIManager(self.screen_width, self.screen_height, self.game_state)
     
-    def teardown_method(self):
-        """Clean up after tests."""
-        GameState.reset_instance()
-    
     def test_preview_follows_mouse_position(self):
         """El preview debe seguir la posición del mouse."""
         # Select a tower
@@ -67,14 +56,7 @@ class TestTowerPreview:
         self.ui_manager.update_mouse_position(screen_pos, self.renderer)
         
         # Drawing preview should not crash
-        try:
-            self.ui_manager.draw_tower_preview(self.screen, self.renderer)
-            success = True
-        except Exception as e:
-            print(f"Error drawing preview: {e}")
-            success = False
-        
-        assert success
+        self.ui_manager.draw_tower_preview(self.screen, self.renderer)
     
     def test_no_preview_during_battle_phase(self):
         """No debe haber preview durante fase de batalla."""
@@ -89,14 +71,7 @@ class TestTowerPreview:
         self.ui_manager.update_mouse_position(screen_pos, self.renderer)
         
         # Drawing preview should not crash and should not show anything
-        try:
-            self.ui_manager.draw_tower_preview(self.screen, self.renderer)
-            success = True
-        except Exception as e:
-            print(f"Error drawing preview: {e}")
-            success = False
-        
-        assert success
+        self.ui_manager.draw_tower_preview(self.screen, self.renderer)
     
     def test_preview_updates_with_mouse_movement(self):
         """Preview debe actualizarse al mover el mouse."""
@@ -149,33 +124,23 @@ class TestTowerPreview:
         # Both should update the position without error
         assert self.ui_manager._mouse_grid_pos == (10, 10)
     
-    def test_draw_preview_does_not_crash(self):
+    @pytest.mark.parametrize("tower_type,phase", [
+        (None, GamePhase.PLANNING),  # No tower selected
+        (TowerType.DEAN, GamePhase.PLANNING),  # Valid scenario
+        (TowerType.CALCULUS, GamePhase.BATTLE),  # Battle phase
+        (TowerType.PHYSICS, GamePhase.PLANNING),  # Different tower
+    ], ids=["no_tower", "dean_planning", "calculus_battle", "physics_planning"])
+    def test_draw_preview_does_not_crash(self, tower_type, phase):
         """Drawing preview should never crash."""
-        # Test various scenarios
-        scenarios = [
-            (None, GamePhase.PLANNING),  # No tower selected
-            (TowerType.DEAN, GamePhase.PLANNING),  # Valid scenario
-            (TowerType.CALCULUS, GamePhase.BATTLE),  # Battle phase
-            (TowerType.PHYSICS, GamePhase.PLANNING),  # Different tower
-        ]
-        
-        for tower_type, phase in scenarios:
-            self.ui_manager.selected_tower_type = tower_type
-            self.game_state._current_phase = phase
-            
-            # Update mouse position
-            screen_pos = self.renderer.cart_to_iso(5, 5)
-            self.ui_manager.update_mouse_position(screen_pos, self.renderer)
-            
-            # Draw preview
-            try:
-                self.ui_manager.draw_tower_preview(self.screen, self.renderer)
-                success = True
-            except Exception as e:
-                print(f"Error with scenario {tower_type}, {phase}: {e}")
-                success = False
-            
-            assert success
+        self.ui_manager.selected_tower_type = tower_type
+        self.game_state._current_phase = phase
+        
+        # Update mouse position
+        screen_pos = self.renderer.cart_to_iso(5, 5)
+        self.ui_manager.update_mouse_position(screen_pos, self.renderer)
+        
+        # Draw preview; any exception fails the test
+        self.ui_manager.draw_tower_preview(self.screen, self.renderer)
 
 
 if __name__ == "__main__":
@@ -2,14 +2,9 @@
 Unit tests for Tower Upgrade UI Integration.
 """
 
-import sys
-import os
 import pytest
-import pygame
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
-
-from core.game_state import GameState, GamePhase
+from core.game_state import GamePhase
 from core.grid import Grid
 from core.input_handler import InputHandler
 from graphics.renderer import Renderer
@@ -22,16 +17,14 @@ from ui.manager import UIManager
 class TestTowerUpgradeUI:
     """Tests for tower upgrade UI integration."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, ui_screen, game_state):
         """Set up test fixtures."""
-        pygame.init()
         self.screen_width = 1280
         self.screen_height = 720
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        self.screen = ui_screen
         
-        # Reset GameState singleton
-        GameState.reset_instance()
-        self.game_state = GameState()
+        self.game_state = game_state
         self.game_state._current_phase = GamePhase.PLANNING
         self.game_state._money = 1000
         
@@ -47,10 +40,6 @@ class TestTowerUpgradeUI:
         self.input_handler.ui_manager = self.ui_manager
         self.input_handler.on_tower_selected = self.ui_manager.select_tower
     
-    def teardown_method(self):
-        """Clean up after tests."""
-        GameState.reset_instance()
-    
     def test_left_click_on_tower_shows_info_panel(self):
         """Click izquierdo en torre debe mostrar panel de info."""
         # Place a tower manually
@@ -121,8 +110,7 @@ class TestTowerUpgradeUI:
     def test_left_click_empty_area_does_not_show_panel(self):
         """Click en área vacía no debe mostrar panel."""
         # Simulate left click on empty position
-        screen_pos = self.renderer.cart_to_iso(10, 10)
-        self.input_handler._handle_left_click(screen_pos)
+        self.input_handler._handle_grid_click(10, 10)
         
         # Verify no tower is selected
         assert self.input_handler.selected_tower is None
@@ -5,13 +5,8 @@ Tests cover Particle, ParticleEmitter, and VisualEffectManager classes.
 """
 
 import pytest
-import sys
-import os
 import pygame
 
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
-
 from graphics.effects import Particle, ParticleEmitter, ParticleType, VisualEffectManager
 
 
@@ -114,9 +109,8 @@ class TestParticleEmitter:
         # Initially not finished
         assert not emitter.is_finished
         
-        # Update until all particles die
-        for _ in range(100):  # Arbitrary large number
-            emitter.update(0.1)
+        # One step longer than any particle's lifetime (at most 0.8s) kills them all
+        emitter.update(1.0)
         
         # Should be finished now
         assert emitter.is_finished
@@ -154,44 +148,27 @@ class TestParticleEmitter:
 class TestVisualEffectManager:
     """Tests for the VisualEffectManager class."""
     
-    def test_spawn_explosion_creates_emitter(self):
-        """Test that spawn_explosion creates an emitter."""
+    @pytest.mark.parametrize("spawn", ["spawn_explosion", "spawn_impact", "spawn_death_effect"])
+    def test_spawn_creates_emitter(self, spawn):
+        """Test that each spawn method creates an emitter."""
         manager = VisualEffectManager()
         
         # Initially no emitters
         assert len(manager._emitters) == 0
         
-        # Spawn explosion
-        manager.spawn_explosion((5.0, 5.0))
+        getattr(manager, spawn)((5.0, 5.0))
         
         # Should have an emitter now
         assert len(manager._emitters) == 1
     
-    def test_spawn_impact_creates_emitter(self):
-        """Test that spawn_impact creates an emitter."""
-        manager = VisualEffectManager()
-        
-        manager.spawn_impact((5.0, 5.0))
-        
-        assert len(manager._emitters) == 1
-    
-    def test_spawn_death_effect_creates_emitter(self):
-        """Test that spawn_death_effect creates an emitter."""
-        manager = VisualEffectManager()
-        
-        manager.spawn_death_effect((5.0, 5.0))
-        
-        assert len(manager._emitters) == 1
-    
     def test_update_cleans_up_finished_emitters(self):
         """Test that update removes finished emitters."""
         manager = VisualEffectManager()
         
         manager.spawn_impact((5.0, 5.0))
         
-        # Update multiple times until effect finishes
-        for _ in range(100):
-            manager.update(0.1)
+        # One step longer than any impact particle's lifetime finishes the effect
+        manager.update(1.0)
         
         # Emitter should be cleaned up
         assert len(manager._emitters) == 0
@@ -4,12 +4,9 @@ Unit tests for WaveBanner in PathWars - The Interpolation Battles.
 Tests cover show/hide logic, timer countdown, and visibility states.
 """
 
-import pytest
-import sys
-import os
+from unittest.mock import MagicMock
 
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+import pytest
 
 import pygame
 
@@ -146,32 +143,22 @@ class TestWaveBannerDraw:
         """Create a fresh WaveBanner for each test."""
         return WaveBanner(800, 600)
 
-    @pytest.fixture
-    def screen(self):
-        """Create a test screen surface."""
-        return pygame.Surface((800, 600))
-
-    def test_draw_when_hidden_does_nothing(self, banner, screen):
+    def test_draw_when_hidden_does_nothing(self, banner):
         """Test that draw() does nothing when banner is hidden."""
-        # Fill screen with a known color
-        screen.fill((0, 0, 0))
-        original = screen.copy()
-        
+        screen = MagicMock(spec=pygame.Surface)
         banner.draw(screen)
         
-        # Screen should be unchanged
-        assert pygame.image.tostring(screen, 'RGB') == pygame.image.tostring(original, 'RGB')
+        # Nothing should have been drawn onto the screen
+        assert screen.method_calls == []
 
-    def test_draw_when_visible_modifies_screen(self, banner, screen):
+    def test_draw_when_visible_modifies_screen(self, banner, cleared_surface, black_pixel_count):
         """Test that draw() modifies the screen when visible."""
-        screen.fill((0, 0, 0))
-        original = pygame.image.tostring(screen, 'RGB')
-        
         banner.show("Test Message")
-        banner.draw(screen)
+        banner.draw(cleared_surface)
         
-        # Screen should be different
-        assert pygame.image.tostring(screen, 'RGB') != original
+        # Some pixels should no longer be black
+        width, height = cleared_surface.get_size()
+        assert black_pixel_count(cleared_surface) < width * height
 
 
 class TestWaveBannerReshowing:
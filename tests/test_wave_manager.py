@@ -6,11 +6,6 @@ and wave progression.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path so we can import the module
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 
 from core.wave_data import EnemySpawnConfig, WaveConfig, get_predefined_waves
 from core.wave_manager import WaveManager, WaveEvent
@@ -18,6 +13,42 @@ from entities.base import EntityState
 from entities.enemy import Enemy, EnemyType
 
 
+@pytest.fixture
+def wave_manager():
+    """Create a fresh WaveManager for each test.
+
+    WaveManager.reset() keeps event subscribers, so one instance can't be
+    shared between tests.
+    """
+    return WaveManager()
+
+
+def _spawn_all(wave_manager, wave_number):
+    """Spawn every enemy of the active wave in a single update."""
+    wave_config = wave_manager.get_wave_config(wave_number)
+    total_enemies = sum(c.count for c in wave_config.enemy_configs)
+    # More time than needed to spawn the whole wave
+    wave_manager.update(wave_config.spawn_interval * total_enemies * 2)
+
+
+def _kill_all(wave_manager):
+    """Deal lethal damage to every enemy spawned so far."""
+    for enemy in wave_manager.spawned_enemies:
+        enemy.take_damage(enemy.health)
+
+
+@pytest.fixture(scope="module")
+def predefined_waves():
+    """Load the predefined waves once for the module."""
+    return get_predefined_waves()
+
+
+@pytest.fixture
+def simple_path():
+    """Create a simple path for testing."""
+    return [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0)]
+
+
 class TestEnemySpawnConfig:
     """Tests for the EnemySpawnConfig dataclass."""
 
@@ -51,9 +82,9 @@ class TestWaveConfig:
 
     def test_wave_config_creation(self):
         """Test basic WaveConfig creation."""
-        enemy_configs = [
-            EnemySpawnConfig(enemy_type=EnemyType.STUDENT, count=5)
-        ]
+        enemy_configs = (
+            EnemySpawnConfig(enemy_type=EnemyType.STUDENT, count=5),
+        )
         config = WaveConfig(
             wave_number=1,
             enemy_configs=enemy_configs,
@@ -67,20 +98,20 @@ class TestWaveConfig:
 class TestPredefinedWaves:
     """Tests for predefined wave configurations."""
 
-    def test_predefined_waves_count(self):
+    def test_predefined_waves_count(self, predefined_waves):
         """Test that there are exactly 5 predefined waves."""
-        waves = get_predefined_waves()
+        waves = predefined_waves
         assert len(waves) == 5
 
-    def test_predefined_waves_numbers(self):
+    def test_predefined_waves_numbers(self, predefined_waves):
         """Test that wave numbers are correct."""
-        waves = get_predefined_waves()
+        waves = predefined_waves
         for i, wave in enumerate(waves):
             assert wave.wave_number == i + 1
 
-    def test_predefined_waves_increasing_difficulty(self):
+    def test_predefined_waves_increasing_difficulty(self, predefined_waves):
         """Test that waves have increasing enemy counts."""
-        waves = get_predefined_waves()
+        waves = predefined_waves
         
         # Calculate total enemies per wave
         total_enemies = []
@@ -93,28 +124,32 @@ class TestPredefinedWaves:
             assert total_enemies[i] >= total_enemies[i - 1], \
                 f"Wave {i + 1} should have at least as many enemies as wave {i}"
 
-    def test_predefined_waves_spawn_intervals(self):
+    def test_predefined_waves_spawn_intervals(self, predefined_waves):
         """Test that spawn intervals generally decrease (harder)."""
-        waves = get_predefined_waves()
+        waves = predefined_waves
         
         # Later waves should have smaller or equal spawn intervals
         for i in range(1, len(waves)):
             assert waves[i].spawn_interval <= waves[i - 1].spawn_interval, \
                 f"Wave {i + 1} spawn interval should be <= wave {i}"
 
+    def test_predefined_waves_are_built_once(self):
+        """Test that wave configs are shared while each caller gets its own list."""
+        first = get_predefined_waves()
+        second = get_predefined_waves()
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
 
-class TestWaveManager:
-    """Tests for the WaveManager class."""
+    def test_shared_wave_configs_are_immutable(self):
+        """Test that callers cannot change the cached spawn configurations."""
+        wave = get_predefined_waves()[0]
+        assert isinstance(wave.enemy_configs, tuple)
+        with pytest.raises(AttributeError):
+            wave.enemy_configs.append(wave.enemy_configs[0])
 
-    @pytest.fixture
-    def wave_manager(self):
-        """Create a fresh WaveManager for each test."""
-        return WaveManager()
 
-    @pytest.fixture
-    def simple_path(self):
-        """Create a simple path for testing."""
-        return [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0)]
+class TestWaveManager:
+    """Tests for the WaveManager class."""
 
     def test_wave_manager_initialization(self, wave_manager):
         """Test WaveManager initializes correctly."""
@@ -217,35 +252,34 @@ class TestWaveManager:
         """Test wave is complete when all enemies spawned and dead."""
         wave_manager.start_wave(1, simple_path)
         
-        # Get wave config to know how many enemies
-        wave_config = wave_manager.get_wave_config(1)
-        total_enemies = sum(c.count for c in wave_config.enemy_configs)
-        spawn_interval = wave_config.spawn_interval
-        
-        # Spawn all enemies (more time than needed)
-        total_time = spawn_interval * total_enemies * 2
-        wave_manager.update(total_time)
+        # Spawn all enemies
+        _spawn_all(wave_manager, 1)
         
         # Kill all enemies
-        for enemy in wave_manager.spawned_enemies:
-            enemy.take_damage(enemy.health)
+        _kill_all(wave_manager)
+        wave_manager.update(0.0)
         
         # Now wave should be complete
         assert wave_manager.is_wave_complete() is True
         assert wave_manager.is_active is False
 
+    def test_wave_complete_clears_on_next_start(self, wave_manager, simple_path):
+        """Test the completed flag is cleared when the next wave starts."""
+        wave_manager.start_wave(1, simple_path)
+        _spawn_all(wave_manager, 1)
+        _kill_all(wave_manager)
+        wave_manager.update(0.0)
+        assert wave_manager.is_wave_complete() is True
+
+        wave_manager.start_wave(2, simple_path)
+        assert wave_manager.is_wave_complete() is False
+
     def test_wave_not_complete_enemies_alive(self, wave_manager, simple_path):
         """Test wave is not complete when enemies still alive."""
         wave_manager.start_wave(1, simple_path)
         
-        # Spawn some enemies
-        wave_config = wave_manager.get_wave_config(1)
-        total_enemies = sum(c.count for c in wave_config.enemy_configs)
-        spawn_interval = wave_config.spawn_interval
-        
         # Spawn all enemies
-        total_time = spawn_interval * total_enemies * 2
-        wave_manager.update(total_time)
+        _spawn_all(wave_manager, 1)
         
         # Don't kill any enemies
         assert wave_manager.is_wave_complete() is False
@@ -259,11 +293,12 @@ class TestWaveManager:
         wave_manager.update(0.0)
         
         # Kill spawned enemy
-        for enemy in wave_manager.spawned_enemies:
-            enemy.take_damage(enemy.health)
+        _kill_all(wave_manager)
+        wave_manager.update(0.0)
         
         # Wave should not be complete (not all enemies spawned)
         assert wave_manager.is_wave_complete() is False
+        assert wave_manager.is_active is True
 
     def test_is_wave_complete_when_not_active(self, wave_manager):
         """Test is_wave_complete returns False when not active."""
@@ -273,16 +308,6 @@ class TestWaveManager:
 class TestWaveManagerObserver:
     """Tests for WaveManager Observer pattern."""
 
-    @pytest.fixture
-    def wave_manager(self):
-        """Create a fresh WaveManager for each test."""
-        return WaveManager()
-
-    @pytest.fixture
-    def simple_path(self):
-        """Create a simple path for testing."""
-        return [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0)]
-
     def test_subscribe_wave_start(self, wave_manager, simple_path):
         """Test subscribing to wave start events."""
         received_events = []
@@ -309,18 +334,13 @@ class TestWaveManagerObserver:
         wave_manager.start_wave(1, simple_path)
         
         # Spawn all enemies
-        wave_config = wave_manager.get_wave_config(1)
-        total_enemies = sum(c.count for c in wave_config.enemy_configs)
-        spawn_interval = wave_config.spawn_interval
-        total_time = spawn_interval * total_enemies * 2
-        wave_manager.update(total_time)
+        _spawn_all(wave_manager, 1)
         
         # Kill all enemies
-        for enemy in wave_manager.spawned_enemies:
-            enemy.take_damage(enemy.health)
+        _kill_all(wave_manager)
         
-        # Check wave completion
-        wave_manager.is_wave_complete()
+        # Poll wave completion
+        wave_manager.update(0.0)
         
         assert len(received_events) == 1
         assert received_events[0] == ("complete", 1)
@@ -350,16 +370,12 @@ class TestWaveManagerObserver:
         
         # Start and complete wave
         wave_manager.start_wave(1, simple_path)
-        wave_config = wave_manager.get_wave_config(1)
-        total_enemies = sum(c.count for c in wave_config.enemy_configs)
-        spawn_interval = wave_config.spawn_interval
-        total_time = spawn_interval * total_enemies * 2
-        wave_manager.update(total_time)
+        # Spawn all enemies
+        _spawn_all(wave_manager, 1)
         
-        for enemy in wave_manager.spawned_enemies:
-            enemy.take_damage(enemy.health)
+        _kill_all(wave_manager)
         
-        wave_manager.is_wave_complete()
+        wave_manager.update(0.0)
         
         assert len(received_events) == 0
 
@@ -400,16 +416,6 @@ class TestWaveManagerObserver:
 class TestWaveProgression:
     """Tests for wave progression (wave 1 -> 2 -> etc)."""
 
-    @pytest.fixture
-    def wave_manager(self):
-        """Create a fresh WaveManager for each test."""
-        return WaveManager()
-
-    @pytest.fixture
-    def simple_path(self):
-        """Create a simple path for testing."""
-        return [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0)]
-
     def test_has_more_waves_initially(self, wave_manager):
         """Test has_more_waves when no waves started."""
         assert wave_manager.has_more_waves() is True
@@ -424,17 +430,12 @@ class TestWaveProgression:
         # Start wave 5 (last wave)
         wave_manager.start_wave(5, simple_path)
         
-        # Complete the wave
-        wave_config = wave_manager.get_wave_config(5)
-        total_enemies = sum(c.count for c in wave_config.enemy_configs)
-        spawn_interval = wave_config.spawn_interval
-        total_time = spawn_interval * total_enemies * 2
-        wave_manager.update(total_time)
+        # Spawn all enemies
+        _spawn_all(wave_manager, 5)
         
-        for enemy in wave_manager.spawned_enemies:
-            enemy.take_damage(enemy.health)
+        _kill_all(wave_manager)
         
-        wave_manager.is_wave_complete()
+        wave_manager.update(0.0)
         
         assert wave_manager.has_more_waves() is False
 
@@ -457,17 +458,12 @@ class TestWaveProgression:
             wave_manager.start_wave(wave_num, simple_path)
             
             # Spawn all enemies
-            wave_config = wave_manager.get_wave_config(wave_num)
-            total_enemies = sum(c.count for c in wave_config.enemy_configs)
-            spawn_interval = wave_config.spawn_interval
-            total_time = spawn_interval * total_enemies * 2
-            wave_manager.update(total_time)
+            _spawn_all(wave_manager, wave_num)
             
             # Kill all enemies
-            for enemy in wave_manager.spawned_enemies:
-                enemy.take_damage(enemy.health)
+            _kill_all(wave_manager)
             
-            wave_manager.is_wave_complete()
+            wave_manager.update(0.0)
         
         assert start_events == [1, 2]
         assert complete_events == [1, 2]
@@ -499,16 +495,6 @@ class TestWaveProgression:
 class TestEnemyModifiers:
     """Tests for enemy health and speed modifiers."""
 
-    @pytest.fixture
-    def wave_manager(self):
-        """Create a fresh WaveManager for each test."""
-        return WaveManager()
-
-    @pytest.fixture
-    def simple_path(self):
-        """Create a simple path for testing."""
-        return [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0)]
-
     def test_health_modifier_applied(self, wave_manager, simple_path):
         """Test that health modifiers are applied to spawned enemies."""
         # Wave 3 has health_modifier of 1.2 for students